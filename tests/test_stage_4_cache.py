@@ -0,0 +1,207 @@
+"""Tests for the persistent results cache in validators/stage_4_validator.py"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "validators"))
+
+import stage_4_validator  # noqa: E402
+
+FIXTURE = {
+    "src/views/Home.tsx": "export const Home = () => <div>Home</div>;\n",
+    "src/views/NotFound.tsx": "export const NotFound = () => <div>Not found</div>;\n",
+    "src/views/UserView.tsx": "import { formatUser } from '../utils/format';\nexport const UserView = () => null;\n",
+    "src/utils/format.ts": "export const formatUser = (name: string) => name;\n",
+    "src/router/routes.ts": "export const ROUTES = {\n  HOME: '/',\n  USER: '/users',\n};\n",
+    "src/router/index.tsx": "import { UserView } from '../views/UserView';\nexport const router = [];\n",
+    "src/components/Layout.tsx": "export const Layout = () => null;\n",
+    "src/components/Navbar.tsx": "export const Navbar = () => null;\n",
+}
+
+
+class Stage4FixtureTestCase(unittest.TestCase):
+    """A small generated_project in a temporary directory, with the cache file kept there too"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.project = self.root / "generated_project"
+        for rel_path, content in FIXTURE.items():
+            self.write(rel_path, content)
+
+        self.erd_path = self.root / "erd.json"
+        self.openapi_path = self.root / "openapi.json"
+        self.write_erd(["User"])
+        self.openapi_path.write_text(json.dumps({"openapi": "3.0.0", "paths": {}}))
+        self.cache_file = self.root / "cache" / "stage_4.json"
+
+        self._cwd = os.getcwd()
+        os.chdir(self.root)
+
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def write(self, rel_path, content):
+        """Write a project file and move its mtime forward so the change is
+        seen even on filesystems with coarse timestamps"""
+        path = self.project / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        mtime_ns = path.stat().st_mtime_ns + 10**9 if path.exists() else None
+        path.write_text(content)
+        if mtime_ns is not None:
+            os.utime(path, ns=(mtime_ns, mtime_ns))
+
+    def write_erd(self, entities):
+        self.erd_path.write_text(json.dumps({"entities": [{"name": name} for name in entities]}))
+
+    def run_validator(self, spy=None):
+        """Run a full validation; returns (validator, calls to each spied method)"""
+        validator = stage_4_validator.Stage4Validator(str(self.erd_path), str(self.openapi_path))
+        validator.cache_file = self.cache_file
+
+        calls = {}
+        for name in spy or ():
+            method = getattr(validator, name)
+            calls[name] = 0
+            setattr(validator, name, self._counting(method, name, calls))
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            validator.validate()
+        return validator, calls
+
+    @staticmethod
+    def _counting(method, name, calls):
+        def wrapper(*args, **kwargs):
+            calls[name] += 1
+            return method(*args, **kwargs)
+        return wrapper
+
+    def assert_matches_uncached(self, validator):
+        """The (possibly replayed) results equal those of a run without the cache"""
+        with mock.patch.dict(os.environ, {"STAGE_VALIDATORS_NO_CACHE": "1"}):
+            fresh, _ = self.run_validator()
+        self.assertEqual(validator.errors, fresh.errors)
+        self.assertEqual(validator.warnings, fresh.warnings)
+        self.assertEqual(validator.validation_results, fresh.validation_results)
+
+
+class Stage4CacheTest(Stage4FixtureTestCase):
+    def test_unchanged_tree_replays_results(self):
+        first, calls = self.run_validator(spy=["validate_home_view", "_scan_file"])
+        self.assertEqual(calls["validate_home_view"], 1)
+        self.assertGreater(calls["_scan_file"], 0)
+        self.assertTrue(self.cache_file.exists())
+
+        second, calls = self.run_validator(spy=["validate_home_view", "_scan_file"])
+        self.assertEqual(calls, {"validate_home_view": 0, "_scan_file": 0})
+        self.assertEqual(second.errors, first.errors)
+        self.assertEqual(second.validation_results, first.validation_results)
+
+    def test_edited_file_is_revalidated(self):
+        self.run_validator()
+        self.write("src/views/Home.tsx", "export default function Home() { return null; }\n")
+
+        validator, calls = self.run_validator(spy=["validate_home_view"])
+        self.assertEqual(calls["validate_home_view"], 1)
+        self.assert_matches_uncached(validator)
+
+    def test_deleted_file_is_revalidated(self):
+        self.run_validator()
+        (self.project / "src/views/NotFound.tsx").unlink()
+
+        validator, calls = self.run_validator(spy=["validate_notfound_view"])
+        self.assertEqual(calls["validate_notfound_view"], 1)
+        self.assertIn("NotFound View: File not found - src/views/NotFound.tsx", validator.errors)
+        self.assert_matches_uncached(validator)
+
+    def test_erd_change_is_revalidated(self):
+        self.run_validator()
+        self.write_erd(["User", "Order", "Invoice", "Payment"])
+
+        validator, calls = self.run_validator(spy=["validate_sidebar_component"])
+        self.assertEqual(calls["validate_sidebar_component"], 1)
+        self.assert_matches_uncached(validator)
+
+    def test_changed_validator_discards_cache(self):
+        self.run_validator()
+        with mock.patch.object(stage_4_validator, "CACHE_VERSION", "other"):
+            _, calls = self.run_validator(spy=["validate_home_view", "_scan_file"])
+        self.assertEqual(calls["validate_home_view"], 1)
+        self.assertGreater(calls["_scan_file"], 0)
+
+    def test_opt_out_neither_reads_nor_writes(self):
+        with mock.patch.dict(os.environ, {"STAGE_VALIDATORS_NO_CACHE": "1"}):
+            self.run_validator()
+            self.assertFalse(self.cache_file.exists())
+
+        self.run_validator()
+        self.assertTrue(self.cache_file.exists())
+        with mock.patch.dict(os.environ, {"STAGE_VALIDATORS_NO_CACHE": "1"}):
+            _, calls = self.run_validator(spy=["validate_home_view", "_scan_file"])
+        self.assertEqual(calls["validate_home_view"], 1)
+        self.assertGreater(calls["_scan_file"], 0)
+
+    def test_unwritable_cache_dir_is_ignored(self):
+        (self.root / "not_a_dir").write_text("")
+        self.cache_file = self.root / "not_a_dir" / "stage_4.json"
+
+        validator, _ = self.run_validator()
+        self.assertFalse(self.cache_file.exists())
+        self.assert_matches_uncached(validator)
+
+
+class Stage4ImportReplayTest(Stage4FixtureTestCase):
+    """validate_imports replays its errors only while no source file under src/ changes"""
+
+    def import_errors(self, validator):
+        return [error for error in validator.errors if error.startswith("Import Validation:")]
+
+    def test_added_file_invalidates_import_errors(self):
+        self.write("src/views/Home.tsx", "import { missing } from './Missing';\nexport const Home = () => null;\n")
+        first, _ = self.run_validator()
+        self.assertEqual(len(self.import_errors(first)), 1)
+
+        self.write("src/views/Missing.ts", "export const missing = 1;\n")
+        validator, calls = self.run_validator(spy=["_scan_file"])
+        self.assertGreater(calls["_scan_file"], 0)
+        self.assertEqual(self.import_errors(validator), [])
+        self.assert_matches_uncached(validator)
+
+    def test_deleted_file_invalidates_import_errors(self):
+        first, _ = self.run_validator()
+        self.assertEqual(self.import_errors(first), [])
+
+        (self.project / "src/utils/format.ts").unlink()
+        validator, calls = self.run_validator(spy=["_scan_file"])
+        self.assertGreater(calls["_scan_file"], 0)
+        self.assertEqual(len(self.import_errors(validator)), 1)
+        self.assert_matches_uncached(validator)
+
+    def test_edited_file_invalidates_import_errors(self):
+        first, _ = self.run_validator()
+        self.assertEqual(self.import_errors(first), [])
+
+        self.write("src/utils/format.ts", "import { nope } from './nope';\nexport const formatUser = nope;\n")
+        validator, calls = self.run_validator(spy=["_scan_file"])
+        self.assertGreater(calls["_scan_file"], 0)
+        self.assertEqual(len(self.import_errors(validator)), 1)
+        self.assert_matches_uncached(validator)
+
+    def test_file_outside_src_does_not_invalidate(self):
+        self.run_validator()
+        (self.project / "README.md").write_text("notes\n")
+
+        _, calls = self.run_validator(spy=["_scan_file"])
+        self.assertEqual(calls["_scan_file"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+"""Tests that Stage 5 probe scans do not depend on whether a file is scanned through mmap"""
+
+import random
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+REPO = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO / "validators"))
+
+import stage_5_validator  # noqa: E402
+
+# Probe sets with the project file each is applied to
+PROBE_SETS = {
+    "app": (stage_5_validator._APP_PROBES, "src/App.tsx"),
+    "app_auth": (stage_5_validator._APP_AUTH_PROBES, "src/App.tsx"),
+    "main": (stage_5_validator._MAIN_PROBES, "src/main.tsx"),
+    "app_css": (stage_5_validator._APP_CSS_PROBES, "src/App.css"),
+    "index_css": (stage_5_validator._INDEX_CSS_PROBES, "src/index.css"),
+    "auth_context": (stage_5_validator._AUTH_CONTEXT_PROBES, "src/context/AuthContext.tsx"),
+    "html": (stage_5_validator._HTML_PROBES, "index.html"),
+}
+
+# Large enough to take the mmap path at the real threshold
+PADDING = "\n" * (stage_5_validator.MMAP_THRESHOLD + 1)
+
+
+class Stage5ProbeScanTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "scanned"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def scan(self, probes, mmap_threshold):
+        """Scan self.path with a fresh validator, so no earlier result is reused"""
+        validator = stage_5_validator.Stage5Validator("erd.json", "openapi.json")
+        with mock.patch.object(stage_5_validator, "MMAP_THRESHOLD", mmap_threshold):
+            return validator._scan_shell_file(self.path, probes)
+
+    def assert_same_scan(self, probes, data):
+        self.path.write_bytes(data)
+        as_text = self.scan(probes, mmap_threshold=len(data) + 1)
+        through_mmap = self.scan(probes, mmap_threshold=0)
+        self.assertEqual(through_mmap, as_text, repr(data[:200]))
+        return through_mmap
+
+    def test_project_files(self):
+        for name, (probes, rel_path) in PROBE_SETS.items():
+            content = (REPO / "generated_project" / rel_path).read_text(encoding="utf-8")
+            for variant in (content, content + PADDING, content.replace("\n", "\r\n") + PADDING):
+                with self.subTest(probes=name):
+                    self.assert_same_scan(probes, variant.encode("utf-8"))
+
+    def test_unicode_whitespace_and_separators(self):
+        base = "import React from 'react';\nconst App = () => null;\nexport default App;\n"
+        for separator in ("\xa0", "\x1c", "\x1f", "\u2003"):
+            content = base.replace("export default", f"export{separator}default") + PADDING
+            with self.subTest(separator=repr(separator)):
+                found = self.assert_same_scan(stage_5_validator._APP_PROBES, content.encode("utf-8"))
+                self.assertIn("any_default_export", found)
+
+    def test_invalid_utf8_fails_on_both_paths(self):
+        data = b"export default App;\n\xff\xfe" + PADDING.encode()
+        self.path.write_bytes(data)
+        for threshold in (0, len(data) + 1):
+            with self.subTest(mmap_threshold=threshold):
+                with self.assertRaises(UnicodeDecodeError):
+                    self.scan(stage_5_validator._APP_PROBES, threshold)
+
+    def test_random_sources(self):
+        tokens = [
+            "export", "default", "App", "React", "import", "from", "'react'", "function", "const",
+            "<BrowserRouter>", "<AuthProvider>", "createRoot", "StrictMode", "box-sizing", "body",
+            ":root", "{", "}", ";", "(", ")", "=", " ", "  ", "\n", "\r\n", "\t", "\x1c", "\xa0",
+            "\u212a", "\u017f", "\xe9", "*", "#root", "<div", "id=\"root\"", "<script", "main.tsx",
+        ]
+        rng = random.Random(0)
+        for _ in range(300):
+            content = "".join(rng.choice(tokens) for _ in range(rng.randint(1, 60)))
+            for name, (probes, _) in PROBE_SETS.items():
+                self.assert_same_scan(probes, content.encode("utf-8"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -23,6 +23,7 @@ import json
 import yaml
 import re
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, List, Set, Optional, Tuple
 
 class Colors:
@@ -50,7 +51,73 @@ def print_section(title):
     print(f"  {title}")
     print(f"{'='*70}{Colors.RESET}")
 
+# All patterns used by the validator, compiled once at import time
+PATTERNS = MappingProxyType({
+    # API client
+    "axios_import": re.compile(r"import.*axios"),
+    "axios_create": re.compile(r"axios\.create\s*\("),
+    "base_url": re.compile(r"baseURL\s*:"),
+    "request_interceptor": re.compile(r"interceptors\.request\.use"),
+    "response_interceptor": re.compile(r"interceptors\.response\.use"),
+    "default_export": re.compile(r"export\s+default"),
+    "env_base_url": re.compile(r"import\.meta\.env\.VITE_API_BASE_URL"),
+    # Utilities - required names are matched in a single pass over the file
+    "format_functions": re.compile(
+        r"export\s+(?:const|function)\s+"
+        r"(formatDate|formatDateTime|formatCurrency|formatNumber|truncate|capitalize)\b"
+    ),
+    "storage_export": re.compile(r"export\s+const\s+(storage|storageUtil)\s*="),
+    "storage_methods": re.compile(r"(get|set|remove|clear)\s*[:(=<]"),
+    "generic_t": re.compile(r"<T>"),
+    # Hooks
+    "use_api_export": re.compile(r"(export\s+(const|function)\s+useApi|export\s+default\s+useApi)"),
+    "use_pagination_export": re.compile(
+        r"(export\s+(const|function)\s+usePagination|export\s+default\s+usePagination)"
+    ),
+    "react_import": re.compile(r"import.*from\s+['\"]react['\"]"),
+    "generic_t_param": re.compile(r"<T[,>]"),
+    # Environment / Vite
+    "env_base_url_var": re.compile(r"VITE_API_BASE_URL\s*="),
+    "env_var": re.compile(r"^([A-Z_]+)\s*=", re.MULTILINE),
+    "vite_define_config": re.compile(r"import.*defineConfig.*from\s+['\"]vite['\"]"),
+    "vite_react_plugin": re.compile(r"import.*react.*from\s+['\"]@vitejs/plugin-react['\"]"),
+    "vite_proxy": re.compile(r"proxy\s*:"),
+    "vite_api_path": re.compile(r"['\"]\/api['\"]"),
+    # Barrel exports
+    "barrel_formatting": re.compile(r"export\s+\*\s+from\s+['\"]\.\/formatting['\"]"),
+    "barrel_storage": re.compile(r"export.*from\s+['\"]\.\/storage['\"]"),
+    "barrel_use_api": re.compile(
+        r"(export\s+\*\s+from\s+['\"]\.\/useApi['\"]|export\s*\{\s*default\s+as\s+useApi\s*\}\s*from)"
+    ),
+    "barrel_use_pagination": re.compile(
+        r"(export\s+\*\s+from\s+['\"]\.\/usePagination['\"]"
+        r"|export\s*\{\s*default\s+as\s+usePagination\s*\}\s*from)"
+    ),
+    # ES6 style / type safety
+    "commonjs_require": re.compile(r"=\s*require\s*\("),
+    "commonjs_exports": re.compile(r"module\.exports\s*="),
+    "untyped_function": re.compile(
+        r"export\s+(?:const|function)\s+(\w+)\s*=\s*(?:<[^>]+>)?\s*\([^)]*\)\s*=>(?!\s*:)"
+    ),
+    # Export / import scanning
+    "export_named": re.compile(r'export\s+(?:interface|type|const|let|var|function|class)\s+(\w+)'),
+    "export_block": re.compile(r'export\s*\{\s*([^}]+)\s*\}'),
+    "export_star": re.compile(r'export\s+\*\s+from'),
+    "import_named": re.compile(r"import\s*\{\s*([^}]+)\s*\}\s*from\s*['\"]([^'\"]+)['\"]"),
+    "import_default": re.compile(r"import\s+(\w+)\s+from\s+['\"]([^'\"]+)['\"]"),
+    "import_wildcard": re.compile(r"import\s+\*\s+as\s+(\w+)\s+from\s+['\"]([^'\"]+)['\"]"),
+})
+
+# Directories never descended into when walking the source tree
+_SKIP_DIRS = frozenset({'node_modules', 'dist', 'build', '.next', '.git', 'coverage'})
+
 class Stage3Validator:
+    __slots__ = (
+        'erd_path', 'openapi_path', 'erd_data', 'openapi_data',
+        'errors', 'warnings', 'validation_results', 'base_path',
+        'file_exports', 'file_imports', '_source_paths',
+    )
+    
     def __init__(self, erd_path: str, openapi_path: str):
         self.erd_path = erd_path
         self.openapi_path = openapi_path
@@ -62,6 +129,9 @@ class Stage3Validator:
         # Track exported symbols from each file
         self.file_exports = {}
         self.file_imports = {}
+        
+        # Normalized path strings of the source files, filled while walking src/
+        self._source_paths: Set[str] = set()
     
     def load_openapi_file(self, file_path: str) -> Optional[dict]:
         """Load OpenAPI file supporting both JSON and YAML formats"""
@@ -125,31 +195,30 @@ class Stage3Validator:
         try:
             with open(api_file, 'r', encoding='utf-8') as f:
                 content = f.read()
-            
-            if not re.search(r"import.*axios", content):
+        except (OSError, UnicodeDecodeError) as e:
+            file_errors.append(f"Error reading file: {e}")
+        else:
+            if not PATTERNS["axios_import"].search(content):
                 file_errors.append("Missing axios import")
             
-            if not re.search(r"axios\.create\s*\(", content):
+            if not PATTERNS["axios_create"].search(content):
                 file_errors.append("Missing axios instance creation (axios.create)")
             
-            if not re.search(r"baseURL\s*:", content):
+            if not PATTERNS["base_url"].search(content):
                 file_errors.append("Missing baseURL configuration")
             
-            if not re.search(r"interceptors\.request\.use", content):
+            if not PATTERNS["request_interceptor"].search(content):
                 file_errors.append("Missing request interceptor")
             
-            if not re.search(r"interceptors\.response\.use", content):
+            if not PATTERNS["response_interceptor"].search(content):
                 file_errors.append("Missing response interceptor")
             
-            if not re.search(r"export\s+default", content):
+            if not PATTERNS["default_export"].search(content):
                 file_errors.append("Missing default export")
             
-            if not re.search(r"import\.meta\.env\.VITE_API_BASE_URL", content):
+            if not PATTERNS["env_base_url"].search(content):
                 self.warnings.append(f"{validation_name}: Should use VITE_API_BASE_URL from environment")
         
-        except Exception as e:
-            file_errors.append(f"Error reading file: {e}")
-        
         if file_errors:
             for error in file_errors:
                 self.errors.append(f"{validation_name}: {error}")
@@ -180,14 +249,14 @@ class Stage3Validator:
         try:
             with open(formatting_file, 'r', encoding='utf-8') as f:
                 content = f.read()
-            
+        except (OSError, UnicodeDecodeError) as e:
+            file_errors.append(f"Error reading file: {e}")
+        else:
+            found = {m.group(1) for m in PATTERNS["format_functions"].finditer(content)}
             for func in required_functions:
-                if not re.search(rf"export\s+(const|function)\s+{func}", content):
+                if func not in found:
                     file_errors.append(f"Missing function: {func}()")
         
-        except Exception as e:
-            file_errors.append(f"Error reading file: {e}")
-        
         if file_errors:
             for error in file_errors:
                 self.errors.append(f"{validation_name}: {error}")
@@ -210,22 +279,22 @@ class Stage3Validator:
         try:
             with open(storage_file, 'r', encoding='utf-8') as f:
                 content = f.read()
-            
-            if not re.search(r"export\s+const\s+(storage|storageUtil)\s*=", content):
+        except (OSError, UnicodeDecodeError) as e:
+            file_errors.append(f"Error reading file: {e}")
+        else:
+            if not PATTERNS["storage_export"].search(content):
                 file_errors.append("Missing storage object export")
             
             required_methods = ['get', 'set', 'remove', 'clear']
+            # Match both shorthand (get(...)) and arrow function (get: (...) =>)
+            found = {m.group(1) for m in PATTERNS["storage_methods"].finditer(content)}
             for method in required_methods:
-                # Match both shorthand (get(...)) and arrow function (get: (...) =>)
-                if not re.search(rf"{method}\s*[:(=<]", content):
+                if method not in found:
                     file_errors.append(f"Missing {method}() method")
             
-            if not re.search(r"<T>", content):
+            if not PATTERNS["generic_t"].search(content):
                 self.warnings.append(f"{validation_name}: Should use TypeScript generics for type safety")
         
-        except Exception as e:
-            file_errors.append(f"Error reading file: {e}")
-        
         if file_errors:
             for error in file_errors:
                 self.errors.append(f"{validation_name}: {error}")
@@ -253,19 +322,18 @@ class Stage3Validator:
             try:
                 with open(use_api_file, 'r', encoding='utf-8') as f:
                     content = f.read()
-                
+            except (OSError, UnicodeDecodeError) as e:
+                file_errors.append(f"useApi.ts: Error reading file - {e}")
+            else:
                 # Match both 'export const useApi', 'export function useApi', and 'export default useApi'
-                if not re.search(r"(export\s+(const|function)\s+useApi|export\s+default\s+useApi)", content):
+                if not PATTERNS["use_api_export"].search(content):
                     file_errors.append("useApi.ts: Missing hook export")
                 
-                if not re.search(r"import.*from\s+['\"]react['\"]", content):
+                if not PATTERNS["react_import"].search(content):
                     file_errors.append("useApi.ts: Missing React imports")
                 
-                if not re.search(r"<T[,>]", content):
+                if not PATTERNS["generic_t_param"].search(content):
                     self.warnings.append(f"{validation_name}: useApi.ts should use TypeScript generics")
-            
-            except Exception as e:
-                file_errors.append(f"useApi.ts: Error reading file - {e}")
         
         # Check usePagination hook
         use_pagination_file = hooks_path / "usePagination.ts"
@@ -275,16 +343,15 @@ class Stage3Validator:
             try:
                 with open(use_pagination_file, 'r', encoding='utf-8') as f:
                     content = f.read()
-                
+            except (OSError, UnicodeDecodeError) as e:
+                file_errors.append(f"usePagination.ts: Error reading file - {e}")
+            else:
                 # Match both 'export const usePagination', 'export function usePagination', and 'export default usePagination'
-                if not re.search(r"(export\s+(const|function)\s+usePagination|export\s+default\s+usePagination)", content):
+                if not PATTERNS["use_pagination_export"].search(content):
                     file_errors.append("usePagination.ts: Missing hook export")
                 
-                if not re.search(r"import.*from\s+['\"]react['\"]", content):
+                if not PATTERNS["react_import"].search(content):
                     file_errors.append("usePagination.ts: Missing React imports")
-            
-            except Exception as e:
-                file_errors.append(f"usePagination.ts: Error reading file - {e}")
         
         if file_errors:
             for error in file_errors:
@@ -308,18 +375,17 @@ class Stage3Validator:
         try:
             with open(env_file, 'r', encoding='utf-8') as f:
                 content = f.read()
-            
-            if not re.search(r"VITE_API_BASE_URL\s*=", content):
+        except (OSError, UnicodeDecodeError) as e:
+            file_errors.append(f"Error reading file: {e}")
+        else:
+            if not PATTERNS["env_base_url_var"].search(content):
                 file_errors.append("Missing VITE_API_BASE_URL variable")
             
-            env_vars = re.findall(r"^([A-Z_]+)\s*=", content, re.MULTILINE)
+            env_vars = PATTERNS["env_var"].findall(content)
             for var in env_vars:
                 if not var.startswith('VITE_') and var not in ['NODE_ENV', 'PORT']:
                     self.warnings.append(f"{validation_name}: Variable '{var}' should have VITE_ prefix")
         
-        except Exception as e:
-            file_errors.append(f"Error reading file: {e}")
-        
         if file_errors:
             for error in file_errors:
                 self.errors.append(f"{validation_name}: {error}")
@@ -342,22 +408,21 @@ class Stage3Validator:
         try:
             with open(vite_config, 'r', encoding='utf-8') as f:
                 content = f.read()
-            
-            if not re.search(r"import.*defineConfig.*from\s+['\"]vite['\"]", content):
+        except (OSError, UnicodeDecodeError) as e:
+            file_errors.append(f"Error reading file: {e}")
+        else:
+            if not PATTERNS["vite_define_config"].search(content):
                 file_errors.append("Missing defineConfig import from vite")
             
-            if not re.search(r"import.*react.*from\s+['\"]@vitejs/plugin-react['\"]", content):
+            if not PATTERNS["vite_react_plugin"].search(content):
                 file_errors.append("Missing React plugin import")
             
-            if not re.search(r"proxy\s*:", content):
+            if not PATTERNS["vite_proxy"].search(content):
                 self.warnings.append(f"{validation_name}: Missing proxy configuration")
             
-            if not re.search(r"['\"]\/api['\"]", content):
+            if not PATTERNS["vite_api_path"].search(content):
                 self.warnings.append(f"{validation_name}: Should proxy /api requests")
         
-        except Exception as e:
-            file_errors.append(f"Error reading file: {e}")
-        
         if file_errors:
             for error in file_errors:
                 self.errors.append(f"{validation_name}: {error}")
@@ -380,7 +445,11 @@ class Stage3Validator:
         try:
             with open(tsconfig, 'r', encoding='utf-8') as f:
                 config = json.load(f)
-            
+        except json.JSONDecodeError as e:
+            file_errors.append(f"Invalid JSON: {e}")
+        except (OSError, UnicodeDecodeError) as e:
+            file_errors.append(f"Error reading file: {e}")
+        else:
             compiler_options = config.get('compilerOptions', {})
             
             if not compiler_options.get('strict'):
@@ -392,11 +461,6 @@ class Stage3Validator:
             if 'moduleResolution' not in compiler_options:
                 self.warnings.append(f"{validation_name}: Should specify moduleResolution")
         
-        except json.JSONDecodeError as e:
-            file_errors.append(f"Invalid JSON: {e}")
-        except Exception as e:
-            file_errors.append(f"Error reading file: {e}")
-        
         if file_errors:
             for error in file_errors:
                 self.errors.append(f"{validation_name}: {error}")
@@ -417,16 +481,15 @@ class Stage3Validator:
             try:
                 with open(utils_index, 'r', encoding='utf-8') as f:
                     content = f.read()
-                
-                if not re.search(r"export\s+\*\s+from\s+['\"]\.\/formatting['\"]", content):
+            except (OSError, UnicodeDecodeError) as e:
+                file_errors.append(f"utils/index.ts: Error reading file - {e}")
+            else:
+                if not PATTERNS["barrel_formatting"].search(content):
                     file_errors.append("utils/index.ts: Missing export for formatting")
                 
                 # Accept both 'storage' and 'storageUtil' exports
-                if not re.search(r"export.*from\s+['\"]\.\/storage['\"]", content):
+                if not PATTERNS["barrel_storage"].search(content):
                     file_errors.append("utils/index.ts: Missing export for storage")
-            
-            except Exception as e:
-                file_errors.append(f"utils/index.ts: Error reading file - {e}")
         
         # Check hooks/index.ts
         hooks_index = self.base_path / "src" / "hooks" / "index.ts"
@@ -436,18 +499,17 @@ class Stage3Validator:
             try:
                 with open(hooks_index, 'r', encoding='utf-8') as f:
                     content = f.read()
-                
+            except (OSError, UnicodeDecodeError) as e:
+                file_errors.append(f"hooks/index.ts: Error reading file - {e}")
+            else:
                 # Check for useApi export - accept both patterns:
                 # export * from './useApi' OR export { default as useApi } from './useApi'
-                if not re.search(r"(export\s+\*\s+from\s+['\"]\.\/useApi['\"]|export\s*\{\s*default\s+as\s+useApi\s*\}\s*from)", content):
+                if not PATTERNS["barrel_use_api"].search(content):
                     file_errors.append("hooks/index.ts: Missing export for useApi")
                 
                 # Check for usePagination export - accept both patterns
-                if not re.search(r"(export\s+\*\s+from\s+['\"]\.\/usePagination['\"]|export\s*\{\s*default\s+as\s+usePagination\s*\}\s*from)", content):
+                if not PATTERNS["barrel_use_pagination"].search(content):
                     file_errors.append("hooks/index.ts: Missing export for usePagination")
-            
-            except Exception as e:
-                file_errors.append(f"hooks/index.ts: Error reading file - {e}")
         
         if file_errors:
             for error in file_errors:
@@ -467,6 +529,8 @@ class Stage3Validator:
             return
         
         commonjs_violations = []
+        require_search = PATTERNS["commonjs_require"].search
+        exports_search = PATTERNS["commonjs_exports"].search
         
         for directory in ['utils', 'hooks', 'services']:
             dir_path = src_path / directory
@@ -477,17 +541,20 @@ class Stage3Validator:
                 try:
                     with open(file, 'r', encoding='utf-8') as f:
                         content = f.read()
-                    
-                    rel_path = str(file.relative_to(self.base_path))
-                    
-                    if re.search(r"=\s*require\s*\(", content):
-                        commonjs_violations.append(f"{rel_path}: Uses CommonJS 'require()'")
-                    
-                    if re.search(r"module\.exports\s*=", content):
-                        commonjs_violations.append(f"{rel_path}: Uses CommonJS 'module.exports'")
+                except (OSError, UnicodeDecodeError):
+                    continue
                 
-                except Exception as e:
-                    pass
+                # Cheap literal reject before running either regex
+                if 'require' not in content and 'module.exports' not in content:
+                    continue
+                
+                rel_path = str(file.relative_to(self.base_path))
+                
+                if require_search(content):
+                    commonjs_violations.append(f"{rel_path}: Uses CommonJS 'require()'")
+                
+                if exports_search(content):
+                    commonjs_violations.append(f"{rel_path}: Uses CommonJS 'module.exports'")
         
         if commonjs_violations:
             for violation in commonjs_violations:
@@ -511,25 +578,25 @@ class Stage3Validator:
             files_to_check.append(api_file)
         
         untyped_functions = []
+        find_untyped = PATTERNS["untyped_function"].findall
         
         for file in files_to_check:
             try:
                 with open(file, 'r', encoding='utf-8') as f:
                     content = f.read()
-                
-                rel_path = str(file.relative_to(self.base_path))
-                
-                untyped = re.findall(
-                    r"export\s+(?:const|function)\s+(\w+)\s*=\s*(?:<[^>]+>)?\s*\([^)]*\)\s*=>(?!\s*:)",
-                    content
-                )
-                
-                if untyped:
-                    for func_name in untyped:
-                        untyped_functions.append(f"{rel_path}: Function '{func_name}' missing return type")
+            except (OSError, UnicodeDecodeError):
+                continue
             
-            except Exception as e:
-                pass
+            if 'export' not in content:
+                continue
+            
+            rel_path = str(file.relative_to(self.base_path))
+            
+            untyped = find_untyped(content)
+            
+            if untyped:
+                for func_name in untyped:
+                    untyped_functions.append(f"{rel_path}: Function '{func_name}' missing return type")
         
         if untyped_functions:
             for func in untyped_functions:
@@ -544,23 +611,22 @@ class Stage3Validator:
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
+        except (OSError, UnicodeDecodeError):
+            return set()
             
-            named_exports = re.findall(r'export\s+(?:interface|type|const|let|var|function|class)\s+(\w+)', content)
-            exports.update(named_exports)
-            
-            export_declarations = re.findall(r'export\s*\{\s*([^}]+)\s*\}', content)
-            for decl in export_declarations:
-                symbols = [s.strip().split(' as ')[0].strip() for s in decl.split(',')]
-                exports.update(symbols)
-            
-            if re.search(r'export\s+\*\s+from', content):
-                exports.add('*')
-            
-            if re.search(r'export\s+default', content):
-                exports.add('default')
+        named_exports = PATTERNS["export_named"].findall(content)
+        exports.update(named_exports)
         
-        except Exception as e:
-            pass
+        export_declarations = PATTERNS["export_block"].findall(content)
+        for decl in export_declarations:
+            symbols = [s.strip().split(' as ')[0].strip() for s in decl.split(',')]
+            exports.update(symbols)
+        
+        if PATTERNS["export_star"].search(content):
+            exports.add('*')
+        
+        if PATTERNS["default_export"].search(content):
+            exports.add('default')
         
         return exports
     
@@ -571,52 +637,62 @@ class Stage3Validator:
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
-            
-            named_imports = re.finditer(r"import\s*\{\s*([^}]+)\s*\}\s*from\s*['\"]([^'\"]+)['\"]", content)
-            for match in named_imports:
-                symbols_str = match.group(1)
-                from_path = match.group(2)
-                symbols = [s.strip().split(' as ')[0].strip() for s in symbols_str.split(',')]
-                imports.append((symbols, from_path))
-            
-            default_imports = re.finditer(r"import\s+(\w+)\s+from\s+['\"]([^'\"]+)['\"]", content)
-            for match in default_imports:
-                symbol = match.group(1)
-                from_path = match.group(2)
-                imports.append(([symbol], from_path))
-            
-            wildcard_imports = re.finditer(r"import\s+\*\s+as\s+(\w+)\s+from\s+['\"]([^'\"]+)['\"]", content)
-            for match in wildcard_imports:
-                symbol = match.group(1)
-                from_path = match.group(2)
-                imports.append(([symbol], from_path))
-        
-        except Exception as e:
-            pass
+        except (OSError, UnicodeDecodeError):
+            return []
+            
+        named_imports = PATTERNS["import_named"].finditer(content)
+        for match in named_imports:
+            symbols_str = match.group(1)
+            from_path = match.group(2)
+            symbols = [s.strip().split(' as ')[0].strip() for s in symbols_str.split(',')]
+            imports.append((symbols, from_path))
+        
+        default_imports = PATTERNS["import_default"].finditer(content)
+        for match in default_imports:
+            symbol = match.group(1)
+            from_path = match.group(2)
+            imports.append(([symbol], from_path))
+        
+        wildcard_imports = PATTERNS["import_wildcard"].finditer(content)
+        for match in wildcard_imports:
+            symbol = match.group(1)
+            from_path = match.group(2)
+            imports.append(([symbol], from_path))
         
         return imports
     
     def _resolve_import_path(self, importing_file: Path, import_path: str) -> Optional[Path]:
         """Resolve relative import path to absolute file path"""
         if import_path.startswith('.'):
-            base_dir = importing_file.parent
-            resolved = (base_dir / import_path).resolve()
+            # Lexical normalization only - no symlink resolution syscalls
+            resolved = os.path.normpath(os.path.join(str(importing_file.parent), import_path))
             
-            for ext in ['.ts', '.tsx', '.js', '.jsx', '']:
-                if ext == '':
-                    index_path = resolved / 'index.ts'
-                    if index_path.exists():
-                        return index_path
-                    index_path = resolved / 'index.tsx'
-                    if index_path.exists():
-                        return index_path
-                else:
-                    file_with_ext = Path(str(resolved) + ext)
-                    if file_with_ext.exists():
-                        return file_with_ext
+            for candidate in (resolved + '.ts', resolved + '.tsx', resolved + '.js', resolved + '.jsx',
+                              os.path.join(resolved, 'index.ts'), os.path.join(resolved, 'index.tsx')):
+                # Walked source files are known to exist; anything else is checked on disk
+                if candidate in self._source_paths or os.path.exists(candidate):
+                    return Path(os.path.abspath(candidate))
         
         return None
     
+    def _iter_ts_files(self, root: Path, skip_dirs: Set[str] = _SKIP_DIRS):
+        """Yield TypeScript files under root without descending into skipped directories"""
+        stack = [str(root)]
+        while stack:
+            subdirs = []
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in skip_dirs:
+                                subdirs.append(entry.path)
+                        elif entry.name.endswith(('.ts', '.tsx')):
+                            yield Path(entry.path)
+            except OSError:
+                continue
+            # Reverse so directories are visited in listing order, like os.walk
+            stack.extend(reversed(subdirs))
+    
     def validate_imports(self):
         """Validate all imports are valid"""
         validation_name = "Import Validation"
@@ -626,53 +702,42 @@ class Stage3Validator:
             self.validation_results[validation_name] = True
             return
         
+        ts_files = list(self._iter_ts_files(src_path))
+        self._source_paths = {os.path.normpath(str(p)) for p in ts_files}
+        
         # Build export map
-        for root, dirs, files in os.walk(src_path):
-            dirs[:] = [d for d in dirs if d != 'node_modules']
-            
-            for file in files:
-                if not (file.endswith('.ts') or file.endswith('.tsx')):
-                    continue
-                
-                file_path = Path(root) / file
-                exports = self._scan_file_exports(file_path)
-                self.file_exports[file_path] = exports
+        for file_path in ts_files:
+            exports = self._scan_file_exports(file_path)
+            self.file_exports[file_path] = exports
         
         # Validate imports
         import_errors = []
         
-        for root, dirs, files in os.walk(src_path):
-            dirs[:] = [d for d in dirs if d != 'node_modules']
+        for file_path in ts_files:
+            rel_path = str(file_path.relative_to(self.base_path))
+            imports = self._scan_file_imports(file_path)
             
-            for file in files:
-                if not (file.endswith('.ts') or file.endswith('.tsx')):
+            for symbols, from_path in imports:
+                if not from_path.startswith('.'):
                     continue
                 
-                file_path = Path(root) / file
-                rel_path = str(file_path.relative_to(self.base_path))
-                imports = self._scan_file_imports(file_path)
+                resolved_path = self._resolve_import_path(file_path, from_path)
                 
-                for symbols, from_path in imports:
-                    if not from_path.startswith('.'):
-                        continue
-                    
-                    resolved_path = self._resolve_import_path(file_path, from_path)
-                    
-                    if resolved_path is None:
-                        import_errors.append(f"{rel_path}: Import path not found '{from_path}'")
-                        continue
-                    
-                    if resolved_path not in self.file_exports:
-                        continue
-                    
-                    available_exports = self.file_exports[resolved_path]
-                    
-                    if '*' in available_exports:
-                        continue
-                    
-                    for symbol in symbols:
-                        if symbol not in available_exports and 'default' not in available_exports:
-                            import_errors.append(f"{rel_path}: Symbol '{symbol}' not exported from '{from_path}'")
+                if resolved_path is None:
+                    import_errors.append(f"{rel_path}: Import path not found '{from_path}'")
+                    continue
+                
+                if resolved_path not in self.file_exports:
+                    continue
+                
+                available_exports = self.file_exports[resolved_path]
+                
+                if '*' in available_exports or 'default' in available_exports:
+                    continue
+                
+                missing = [s for s in symbols if s not in available_exports]
+                for symbol in missing:
+                    import_errors.append(f"{rel_path}: Symbol '{symbol}' not exported from '{from_path}'")
         
         if import_errors:
             for error in import_errors:
@@ -24,8 +24,21 @@ import os
 import json
 import yaml
 import re
+import hashlib
+import mmap
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Set, Optional, Tuple
+from typing import Dict, List, Set, Optional, Tuple, NamedTuple
+
+# orjson parses large OpenAPI specs noticeably faster; fall back to the stdlib.
+# Its JSONDecodeError subclasses json.JSONDecodeError, so handlers are unchanged.
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 class Colors:
     GREEN = '\033[92m'
@@ -52,6 +65,300 @@ def print_section(title):
     print(f"  {title}")
     print(f"{'='*70}{Colors.RESET}")
 
+# Results cache for unchanged files. The version is a digest of this module,
+# so any change to the validation logic invalidates previously stored results.
+# STAGE_VALIDATORS_NO_CACHE=1 turns the cache off (e.g. read-only or shared
+# HOME on CI) and STAGE_VALIDATORS_CACHE_DIR moves it.
+CACHE_DIR = Path(os.environ.get("STAGE_VALIDATORS_CACHE_DIR") or Path.home() / ".cache" / "stage_validators")
+CACHE_VERSION = hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16).hexdigest()
+
+# Validations are dominated by file reads, so threads overlap well
+MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+# Most recently read files kept in memory for reuse within a run
+CONTENT_CACHE_SIZE = 256
+
+# (validation name, passed, errors, warnings) returned by each validate_* method
+ValidationResult = Tuple[str, bool, List[str], List[str]]
+
+class _CacheEntry(NamedTuple):
+    mtime_ns: int
+    size: int
+    blake2b_hex: str
+
+def _file_digest(path: Path) -> str:
+    return hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+
+# Precompiled patterns shared by the validate_* methods. Import probes use
+# [^;\n]* instead of .* so a match cannot run past the end of the statement.
+_RE_REACT_IMPORT = re.compile(r"import[^;\n]*React[^;\n]*from\s+['\"]react['\"]")
+_RE_LINK_IMPORT = re.compile(r"import[^;\n]*Link[^;\n]*from\s+['\"]react-router-dom['\"]")
+_RE_USE_LOCATION_IMPORT = re.compile(r"import[^;\n]*useLocation[^;\n]*from\s+['\"]react-router-dom['\"]")
+_RE_HOME_EXPORT = re.compile(r"export\s+(const|function)\s+Home")
+_RE_NOTFOUND_EXPORT = re.compile(r"export\s+(const|function)\s+NotFound")
+_RE_LAYOUT_EXPORT = re.compile(r"export\s+(const|function)\s+Layout")
+_RE_NAVBAR_EXPORT = re.compile(r"export\s+(const|function)\s+Navbar")
+_RE_SIDEBAR_EXPORT = re.compile(r"export\s+(const|function)\s+Sidebar")
+
+# routes.ts
+_RE_ROUTES_EXPORT = re.compile(r"export\s+const\s+ROUTES")
+_RE_HOME_ROUTE = re.compile(r"HOME\s*:\s*['\"]\/['\"]")
+_RE_NOT_FOUND_ROUTE = re.compile(r"NOT_FOUND\s*:\s*['\"]?\*['\"]?")
+_RE_ROUTE_ENTRY = re.compile(r"(\w+)\s*:\s*(?:['\"]([^'\"\n]*)['\"]|([^\s,}]*))")
+
+def _parse_route_entries(content: str) -> Dict[str, str]:
+    """Map every `KEY: value` entry in routes.ts to its value; the first occurrence wins"""
+    routes = {}
+    for match in _RE_ROUTE_ENTRY.finditer(content):
+        value = match.group(2) if match.group(2) is not None else match.group(3)
+        routes.setdefault(match.group(1), value)
+    return routes
+
+# router/index.tsx
+_RE_BROWSER_ROUTER_IMPORT = re.compile(r"import[^;\n]*\{[^;\n]*BrowserRouter[^;\n]*\}[^;\n]*from\s+['\"]react-router-dom['\"]")
+_RE_ROUTES_IMPORT = re.compile(r"import[^;\n]*\{[^;\n]*Routes[^;\n]*\}[^;\n]*from\s+['\"]react-router-dom['\"]")
+_RE_ROUTE_IMPORT = re.compile(r"import[^;\n]*\{[^;\n]*Route[^;\n]*\}[^;\n]*from\s+['\"]react-router-dom['\"]")
+_RE_LAYOUT_IMPORT = re.compile(r"import[^;\n]*Layout[^;\n]*from")
+_RE_HOME_IMPORT = re.compile(r"import[^;\n]*Home[^;\n]*from")
+_RE_NOTFOUND_IMPORT = re.compile(r"import[^;\n]*NotFound[^;\n]*from")
+_RE_ROUTES_CONST_IMPORT = re.compile(r"import[^;\n]*ROUTES[^;\n]*from[^;\n]*routes")
+_RE_ROUTE_ELEMENT = re.compile(r"<Route.*path=.*element=")
+
+# Plain substrings; checked with `in` rather than the regex engine
+_LIT_SWITCH_TAG = "<Switch"
+_LIT_ROUTES_TAG = "<Routes>"
+_LIT_BROWSER_ROUTER_TAG = "<BrowserRouter>"
+_LIT_LAYOUT_TAG = "<Layout>"
+
+# Layout / Navbar
+_RE_CHILDREN_PROP = re.compile(r"children.*React\.ReactNode")
+_RE_NAVBAR_IMPORT = re.compile(r"import[^;\n]*Navbar[^;\n]*from")
+_RE_NAVBAR_TAG = re.compile(r"<Navbar\s*/?>")
+_RE_LINK_TO = re.compile(r"<Link\s+to=")
+
+# Barrel files
+_RE_BARREL_STAR = re.compile(r"export\s+\*\s+from\s+['\"]\./([^'\"]+)['\"]")
+
+# Comments are removed once per file before any probe runs. String and
+# template literals are matched first and kept so "//" inside a URL or an
+# import path is not mistaken for a comment.
+_RE_STRIP = re.compile(
+    r"""("(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*'|`(?:\\.|[^`\\])*`)|/\*.*?\*/|//[^\n]*""",
+    re.DOTALL,
+)
+_SOURCE_SUFFIXES = ('.ts', '.tsx', '.js', '.jsx')
+
+def _strip_comments(content: str) -> str:
+    """Remove // and /* */ comments, leaving string literals intact"""
+    if '/' not in content:
+        return content
+    return _RE_STRIP.sub(lambda m: m.group(1) or ' ', content)
+
+# Export/import statement patterns, compiled once at import time
+_EX_NAMED = re.compile(r"export\s+(?:interface|type|const|let|var|function|class)\s+(?P<export_name>\w+)")
+_EX_DECL = re.compile(r"export\s*\{\s*(?P<export_list>[^}]+)\s*\}")
+_EX_STAR = re.compile(r"export\s+\*\s+from")
+_EX_DEF = re.compile(r"export\s+default")
+_IM_NAMED = re.compile(r"import\s*\{\s*(?P<import_list>[^}]+)\s*\}\s*from\s*['\"](?P<named_from>[^'\"]+)['\"]")
+_IM_DEF = re.compile(r"import\s+(?P<default_name>\w+)\s+from\s+['\"](?P<default_from>[^'\"]+)['\"]")
+_IM_STAR = re.compile(r"import\s+\*\s+as\s+(?P<wildcard_name>\w+)\s+from\s+['\"](?P<wildcard_from>[^'\"]+)['\"]")
+
+# Single-pass export/import scanner used by validate_imports; dispatch on m.lastgroup
+_RE_SCAN = re.compile("|".join(f"(?P<{kind}>{pattern.pattern})" for kind, pattern in [
+    ("named_export", _EX_NAMED),
+    ("export_decl", _EX_DECL),
+    ("star_export", _EX_STAR),
+    ("default_export", _EX_DEF),
+    ("named_import", _IM_NAMED),
+    ("default_import", _IM_DEF),
+    ("wildcard_import", _IM_STAR),
+]))
+
+# Large files are scanned as bytes straight from an mmap, with comments
+# stripped by the same pattern _read() applies to files scanned as text, so
+# both paths see the same exports and imports. Files containing bytes the
+# str patterns treat differently - non-ASCII (\w and \s are Unicode-aware),
+# \r (translated by text-mode reads) and \x1c-\x1f (\s in str patterns
+# only) - are always scanned as text.
+MMAP_THRESHOLD = 16 * 1024
+_RE_STRIP_BYTES = re.compile(_RE_STRIP.pattern.encode(), re.DOTALL)
+_RE_SCAN_BYTES = re.compile(_RE_SCAN.pattern.encode())
+_RE_TEXT_ONLY_BYTES = re.compile(rb"[^\x00-\x7f]|[\r\x1c-\x1f]")
+
+def _collect_scan(matches, text) -> Tuple[Set[str], List[Tuple[List[str], str]]]:
+    """Build (exports, imports) from _RE_SCAN matches; text() converts group values to str"""
+    exports = set()
+    
+    # Imports keep the original grouping (named, then default, then
+    # wildcard) so errors are reported in the same order as before
+    named_imports = []
+    default_imports = []
+    wildcard_imports = []
+    
+    for match in matches:
+        kind = match.lastgroup
+        if kind == 'named_export':
+            exports.add(text(match.group('export_name')))
+        elif kind == 'export_decl':
+            symbols = [s.strip().split(' as ')[0].strip() for s in text(match.group('export_list')).split(',')]
+            exports.update(symbols)
+        elif kind == 'star_export':
+            exports.add('*')
+        elif kind == 'default_export':
+            exports.add('default')
+        elif kind == 'named_import':
+            symbols = [s.strip().split(' as ')[0].strip() for s in text(match.group('import_list')).split(',')]
+            named_imports.append((symbols, text(match.group('named_from'))))
+        elif kind == 'default_import':
+            default_imports.append(([text(match.group('default_name'))], text(match.group('default_from'))))
+        elif kind == 'wildcard_import':
+            wildcard_imports.append(([text(match.group('wildcard_name'))], text(match.group('wildcard_from'))))
+    
+    return exports, named_imports + default_imports + wildcard_imports
+
+class _ProbeSet(NamedTuple):
+    """A combined probe pattern with one bit per probe; bit order is report order"""
+    pattern: Optional["re.Pattern"]
+    groups: Tuple[Tuple[int, int], ...]
+    literals: Tuple[Tuple[str, int], ...]
+    regex_mask: int
+    required: int
+    forbidden: int
+    warn: int
+    messages: Tuple[str, ...]
+
+def _compile_probes(probes: List[Tuple[str, object, str, str]]) -> _ProbeSet:
+    """Combine named probes into one pattern so a file is scanned in a single pass.
+    
+    Each probe is (name, pattern, message, kind) where kind is "error" or
+    "warning" for a probe that must match, or "forbidden" for one that must
+    not. A plain string pattern is a literal substring test. Each regex probe
+    sits in its own lookahead, so probes that match the same text (e.g.
+    several names on one import line) are all reported at that position.
+    """
+    regexes = [(name, probe) for name, probe, _, _ in probes if not isinstance(probe, str)]
+    pattern = None
+    if regexes:
+        gate = "|".join(probe.pattern for _, probe in regexes)
+        captures = "".join(f"(?:(?=(?P<{name}>{probe.pattern}))|)" for name, probe in regexes)
+        pattern = re.compile(f"(?=(?:{gate})){captures}")
+    
+    required = forbidden = warn = regex_mask = 0
+    for index, (_, probe, _, kind) in enumerate(probes):
+        bit = 1 << index
+        if not isinstance(probe, str):
+            regex_mask |= bit
+        if kind == "forbidden":
+            forbidden |= bit
+        else:
+            required |= bit
+        if kind == "warning":
+            warn |= bit
+    
+    return _ProbeSet(
+        pattern=pattern,
+        groups=tuple(
+            (pattern.groupindex[name], 1 << index)
+            for index, (name, probe, _, _) in enumerate(probes) if not isinstance(probe, str)
+        ),
+        literals=tuple(
+            (probe, 1 << index)
+            for index, (_, probe, _, _) in enumerate(probes) if isinstance(probe, str)
+        ),
+        regex_mask=regex_mask,
+        required=required,
+        forbidden=forbidden,
+        warn=warn,
+        messages=tuple(message for _, _, message, _ in probes),
+    )
+
+def _scan_probes(probes: _ProbeSet, content: str) -> int:
+    """Return a bitmask of the probes that match content"""
+    found = 0
+    for literal, bit in probes.literals:
+        if literal in content:
+            found |= bit
+    
+    if probes.pattern is None:
+        return found
+    
+    regex_found = 0
+    for match in probes.pattern.finditer(content):
+        for group, bit in probes.groups:
+            if match.start(group) >= 0:
+                regex_found |= bit
+        if regex_found == probes.regex_mask:
+            break
+    return found | regex_found
+
+def _report_probes(probes: _ProbeSet, found: int) -> Tuple[List[str], List[str]]:
+    """Turn a found bitmask into (errors, warnings), in probe order"""
+    flagged = (probes.required & ~found) | (probes.forbidden & found)
+    errors = []
+    warnings = []
+    while flagged:
+        bit = flagged & -flagged
+        message = probes.messages[bit.bit_length() - 1]
+        (warnings if bit & probes.warn else errors).append(message)
+        flagged ^= bit
+    return errors, warnings
+
+_HOME_PROBES = _compile_probes([
+    ("react_import", _RE_REACT_IMPORT, "Missing React import", "error"),
+    ("home_export", _RE_HOME_EXPORT, "Missing Home component export", "error"),
+    ("link_import", _RE_LINK_IMPORT, "Should use Link from react-router-dom", "warning"),
+])
+_NOTFOUND_PROBES = _compile_probes([
+    ("react_import", _RE_REACT_IMPORT, "Missing React import", "error"),
+    ("notfound_export", _RE_NOTFOUND_EXPORT, "Missing NotFound component export", "error"),
+    ("link_import", _RE_LINK_IMPORT, "Should use Link from react-router-dom", "warning"),
+])
+_ROUTES_PROBES = _compile_probes([
+    ("routes_export", _RE_ROUTES_EXPORT, "Missing ROUTES constant export", "error"),
+    ("home_route", _RE_HOME_ROUTE, "Missing HOME route definition", "error"),
+    ("not_found_route", _RE_NOT_FOUND_ROUTE, "Missing NOT_FOUND route definition", "error"),
+])
+_ROUTER_PROBES = _compile_probes([
+    ("browser_router_import", _RE_BROWSER_ROUTER_IMPORT, "Missing BrowserRouter import from react-router-dom", "error"),
+    ("routes_import", _RE_ROUTES_IMPORT, "Missing Routes import from react-router-dom", "error"),
+    ("route_import", _RE_ROUTE_IMPORT, "Missing Route import from react-router-dom", "error"),
+    ("layout_import", _RE_LAYOUT_IMPORT, "Missing Layout component import", "error"),
+    ("home_import", _RE_HOME_IMPORT, "Missing Home view import", "error"),
+    ("notfound_import", _RE_NOTFOUND_IMPORT, "Missing NotFound view import", "error"),
+    ("routes_const_import", _RE_ROUTES_CONST_IMPORT, "Missing ROUTES import from routes.ts", "error"),
+    ("switch_tag", _LIT_SWITCH_TAG, "Using React Router v5 Switch - should use v6 Routes", "forbidden"),
+    ("routes_tag", _LIT_ROUTES_TAG, "Missing <Routes> component (React Router v6)", "error"),
+    ("route_element", _RE_ROUTE_ELEMENT, "Missing Route with element prop (React Router v6 syntax)", "error"),
+    ("browser_router_tag", _LIT_BROWSER_ROUTER_TAG, "Missing <BrowserRouter> wrapper", "error"),
+    ("layout_tag", _LIT_LAYOUT_TAG, "Missing <Layout> wrapper around routes", "error"),
+])
+_LAYOUT_PROBES = _compile_probes([
+    ("react_import", _RE_REACT_IMPORT, "Missing React import", "error"),
+    ("layout_export", _RE_LAYOUT_EXPORT, "Missing Layout component export", "error"),
+    ("children_prop", _RE_CHILDREN_PROP, "Missing children prop with ReactNode type", "error"),
+    ("navbar_import", _RE_NAVBAR_IMPORT, "Missing Navbar import", "error"),
+    ("navbar_tag", _RE_NAVBAR_TAG, "Navbar component not used in Layout", "error"),
+])
+_NAVBAR_PROBES = _compile_probes([
+    ("react_import", _RE_REACT_IMPORT, "Missing React import", "error"),
+    ("navbar_export", _RE_NAVBAR_EXPORT, "Missing Navbar component export", "error"),
+    ("link_import", _RE_LINK_IMPORT, "Missing Link import from react-router-dom", "error"),
+    ("routes_const_import", _RE_ROUTES_CONST_IMPORT, "Should import ROUTES from router/routes", "warning"),
+    ("link_to", _RE_LINK_TO, "No Link components found - should link to entity views", "error"),
+])
+_SIDEBAR_PROBES = _compile_probes([
+    ("react_import", _RE_REACT_IMPORT, "Missing React import", "error"),
+    ("sidebar_export", _RE_SIDEBAR_EXPORT, "Missing Sidebar component export", "error"),
+    ("link_import", _RE_LINK_IMPORT, "Missing Link import from react-router-dom", "error"),
+    ("use_location_import", _RE_USE_LOCATION_IMPORT, "Should use useLocation for active route highlighting", "warning"),
+])
+
+# Extensions _resolve_import_path can land on; all feed the import watermark
+_RESOLVABLE_SUFFIXES = ('.ts', '.tsx', '.js', '.jsx')
+
+# Directories never descended into when walking the source tree
+_SKIP_DIRS = frozenset({'node_modules'})
+
 class Stage4Validator:
     def __init__(self, erd_path: str, openapi_path: str):
         self.erd_path = erd_path
@@ -68,14 +375,29 @@ class Stage4Validator:
         # Track entity views
         self.entity_views = []
         self.entities = []
+        
+        # Cached validation results, keyed by validation name
+        self.use_cache = os.environ.get("STAGE_VALIDATORS_NO_CACHE", "") in ("", "0")
+        self.cache_file = CACHE_DIR / "stage_4.json"
+        self._cache = {}
+        
+        # routes.ts parsed into {KEY: path}, filled by _preload_shared_files
+        self._routes_map = None
+        
+        # Import resolution memo and directory listings, filled by validate_imports
+        self._resolve_cache = {}
+        self._dir_listings = {}
+        
+        # File contents read during this run, shared by the worker threads
+        self._content_cache = OrderedDict()
+        self._content_lock = threading.Lock()
     
     def load_openapi_file(self, file_path: str) -> Optional[dict]:
         """Load OpenAPI file supporting both JSON and YAML formats"""
         # Try JSON first
         if os.path.exists(file_path):
             try:
-                with open(file_path, 'r') as f:
-                    return json.load(f)
+                return _loads(Path(file_path).read_bytes())
             except json.JSONDecodeError:
                 pass  # Not JSON, try YAML
         
@@ -103,9 +425,8 @@ class Stage4Validator:
     def load_inputs(self) -> bool:
         """Load ERD and OpenAPI files"""
         try:
-            with open(self.erd_path, 'r') as f:
-                self.erd_data = json.load(f)
-                self.entities = [entity.get('name') for entity in self.erd_data.get('entities', [])]
+            self.erd_data = _loads(Path(self.erd_path).read_bytes())
+            self.entities = [entity.get('name') for entity in self.erd_data.get('entities', [])]
             
             self.openapi_data = self.load_openapi_file(self.openapi_path)
             if self.openapi_data is None:
@@ -115,346 +436,236 @@ class Stage4Validator:
             # Scan existing entity views
             views_path = self.base_path / "src" / "views"
             if views_path.exists():
-                for view_file in views_path.glob("*View.tsx"):
-                    view_name = view_file.stem
-                    self.entity_views.append(view_name)
+                with os.scandir(views_path) as it:
+                    for entry in it:
+                        if entry.name.endswith('View.tsx') and not entry.name.startswith('.'):
+                            self.entity_views.append(entry.name[:-len('.tsx')])
             
             return True
         except Exception as e:
             self.errors.append(f"Error loading inputs: {e}")
             return False
     
-    def validate_home_view(self):
+    def _preload_shared_files(self):
+        """Read the routing files several validations depend on and parse routes.ts"""
+        src = self.base_path / "src"
+        for file_path in [src / "router" / "routes.ts", src / "router" / "index.tsx",
+                          src / "components" / "Layout.tsx", src / "components" / "Navbar.tsx"]:
+            try:
+                content = self._read(file_path)
+            except (OSError, UnicodeDecodeError):
+                continue  # reported by the validation that owns the file
+            if file_path.name == "routes.ts":
+                self._routes_map = _parse_route_entries(content)
+    
+    def validate_home_view(self) -> ValidationResult:
         """Validate Home view exists"""
         validation_name = "Home View"
+        errors = []
+        warnings = []
         home_file = self.base_path / "src" / "views" / "Home.tsx"
         
         if not home_file.exists():
-            self.errors.append(f"{validation_name}: File not found - src/views/Home.tsx")
-            self.validation_results[validation_name] = False
-            return
+            errors.append(f"{validation_name}: File not found - src/views/Home.tsx")
+            return validation_name, False, errors, warnings
         
         file_errors = []
         
         try:
-            with open(home_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Check for React import
-            if not re.search(r"import.*React.*from\s+['\"]react['\"]", content):
-                file_errors.append("Missing React import")
-            
-            # Check for component export
-            if not re.search(r"export\s+(const|function)\s+Home", content):
-                file_errors.append("Missing Home component export")
+            content = self._read(home_file)
             
-            # Check for React Router Link import
-            if not re.search(r"import.*Link.*from\s+['\"]react-router-dom['\"]", content):
-                self.warnings.append(f"{validation_name}: Should use Link from react-router-dom")
+            probe_errors, probe_warnings = _report_probes(_HOME_PROBES, _scan_probes(_HOME_PROBES, content))
+            file_errors.extend(probe_errors)
+            warnings.extend(f"{validation_name}: {warning}" for warning in probe_warnings)
         
         except Exception as e:
             file_errors.append(f"Error reading file: {e}")
         
-        if file_errors:
-            for error in file_errors:
-                self.errors.append(f"{validation_name}: {error}")
-            self.validation_results[validation_name] = False
-        else:
-            self.validation_results[validation_name] = True
+        for error in file_errors:
+            errors.append(f"{validation_name}: {error}")
+        return validation_name, not file_errors, errors, warnings
     
-    def validate_notfound_view(self):
+    def validate_notfound_view(self) -> ValidationResult:
         """Validate NotFound view exists"""
         validation_name = "NotFound View"
+        errors = []
+        warnings = []
         notfound_file = self.base_path / "src" / "views" / "NotFound.tsx"
         
         if not notfound_file.exists():
-            self.errors.append(f"{validation_name}: File not found - src/views/NotFound.tsx")
-            self.validation_results[validation_name] = False
-            return
+            errors.append(f"{validation_name}: File not found - src/views/NotFound.tsx")
+            return validation_name, False, errors, warnings
         
         file_errors = []
         
         try:
-            with open(notfound_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = self._read(notfound_file)
             
-            # Check for React import
-            if not re.search(r"import.*React.*from\s+['\"]react['\"]", content):
-                file_errors.append("Missing React import")
-            
-            # Check for component export
-            if not re.search(r"export\s+(const|function)\s+NotFound", content):
-                file_errors.append("Missing NotFound component export")
-            
-            # Check for React Router Link import
-            if not re.search(r"import.*Link.*from\s+['\"]react-router-dom['\"]", content):
-                self.warnings.append(f"{validation_name}: Should use Link from react-router-dom")
+            probe_errors, probe_warnings = _report_probes(_NOTFOUND_PROBES, _scan_probes(_NOTFOUND_PROBES, content))
+            file_errors.extend(probe_errors)
+            warnings.extend(f"{validation_name}: {warning}" for warning in probe_warnings)
         
         except Exception as e:
             file_errors.append(f"Error reading file: {e}")
         
-        if file_errors:
-            for error in file_errors:
-                self.errors.append(f"{validation_name}: {error}")
-            self.validation_results[validation_name] = False
-        else:
-            self.validation_results[validation_name] = True
+        for error in file_errors:
+            errors.append(f"{validation_name}: {error}")
+        return validation_name, not file_errors, errors, warnings
     
-    def validate_route_definitions(self):
+    def validate_route_definitions(self) -> ValidationResult:
         """Validate route definitions file"""
         validation_name = "Route Definitions"
+        errors = []
+        warnings = []
         routes_file = self.base_path / "src" / "router" / "routes.ts"
         
         if not routes_file.exists():
-            self.errors.append(f"{validation_name}: File not found - src/router/routes.ts")
-            self.validation_results[validation_name] = False
-            return
+            errors.append(f"{validation_name}: File not found - src/router/routes.ts")
+            return validation_name, False, errors, warnings
         
         file_errors = []
         
         try:
-            with open(routes_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Check for ROUTES export
-            if not re.search(r"export\s+const\s+ROUTES", content):
-                file_errors.append("Missing ROUTES constant export")
+            content = self._read(routes_file)
             
-            # Check for HOME route
-            if not re.search(r"HOME\s*:\s*['\"]\/['\"]", content):
-                file_errors.append("Missing HOME route definition")
+            probe_errors, probe_warnings = _report_probes(_ROUTES_PROBES, _scan_probes(_ROUTES_PROBES, content))
+            file_errors.extend(probe_errors)
+            warnings.extend(f"{validation_name}: {warning}" for warning in probe_warnings)
             
-            # Check for NOT_FOUND route
-            if not re.search(r"NOT_FOUND\s*:\s*['\"]?\*['\"]?", content):
-                file_errors.append("Missing NOT_FOUND route definition")
-            
-            # Check that all entity views have routes
+            # Check that all entity views have routes. A route key counts if
+            # any key in routes.ts ends with it, case-insensitively.
+            if self._routes_map is None:
+                self._routes_map = _parse_route_entries(content)
+            route_keys = [key.upper() for key in self._routes_map]
             for entity_view in self.entity_views:
-                entity_name = entity_view.replace('View', '')
-                route_pattern = rf"{entity_name.upper()}\s*:"
-                if not re.search(route_pattern, content, re.IGNORECASE):
+                route_key = entity_view.replace('View', '').upper()
+                if not any(key.endswith(route_key) for key in route_keys):
                     file_errors.append(f"Missing route definition for {entity_view}")
         
         except Exception as e:
             file_errors.append(f"Error reading file: {e}")
         
-        if file_errors:
-            for error in file_errors:
-                self.errors.append(f"{validation_name}: {error}")
-            self.validation_results[validation_name] = False
-        else:
-            self.validation_results[validation_name] = True
+        for error in file_errors:
+            errors.append(f"{validation_name}: {error}")
+        return validation_name, not file_errors, errors, warnings
     
-    def validate_router_setup(self):
+    def validate_router_setup(self) -> ValidationResult:
         """Validate router setup file"""
         validation_name = "Router Setup"
+        errors = []
+        warnings = []
         router_file = self.base_path / "src" / "router" / "index.tsx"
         
         if not router_file.exists():
-            self.errors.append(f"{validation_name}: File not found - src/router/index.tsx")
-            self.validation_results[validation_name] = False
-            return
+            errors.append(f"{validation_name}: File not found - src/router/index.tsx")
+            return validation_name, False, errors, warnings
         
         file_errors = []
         
         try:
-            with open(router_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Check for React Router v6 imports
-            if not re.search(r"import.*\{.*BrowserRouter.*\}.*from\s+['\"]react-router-dom['\"]", content):
-                file_errors.append("Missing BrowserRouter import from react-router-dom")
+            content = self._read(router_file)
             
-            if not re.search(r"import.*\{.*Routes.*\}.*from\s+['\"]react-router-dom['\"]", content):
-                file_errors.append("Missing Routes import from react-router-dom")
-            
-            if not re.search(r"import.*\{.*Route.*\}.*from\s+['\"]react-router-dom['\"]", content):
-                file_errors.append("Missing Route import from react-router-dom")
-            
-            # Check for Layout import
-            if not re.search(r"import.*Layout.*from", content):
-                file_errors.append("Missing Layout component import")
-            
-            # Check for view imports
-            if not re.search(r"import.*Home.*from", content):
-                file_errors.append("Missing Home view import")
-            
-            if not re.search(r"import.*NotFound.*from", content):
-                file_errors.append("Missing NotFound view import")
-            
-            # Check for ROUTES import
-            if not re.search(r"import.*ROUTES.*from.*routes", content):
-                file_errors.append("Missing ROUTES import from routes.ts")
-            
-            # Check for React Router v6 syntax (Routes/Route, not Switch)
-            if re.search(r"<Switch", content):
-                file_errors.append("Using React Router v5 Switch - should use v6 Routes")
-            
-            if not re.search(r"<Routes>", content):
-                file_errors.append("Missing <Routes> component (React Router v6)")
-            
-            if not re.search(r"<Route.*path=.*element=", content):
-                file_errors.append("Missing Route with element prop (React Router v6 syntax)")
-            
-            # Check for BrowserRouter
-            if not re.search(r"<BrowserRouter>", content):
-                file_errors.append("Missing <BrowserRouter> wrapper")
-            
-            # Check for Layout wrapper
-            if not re.search(r"<Layout>", content):
-                file_errors.append("Missing <Layout> wrapper around routes")
+            probe_errors, probe_warnings = _report_probes(_ROUTER_PROBES, _scan_probes(_ROUTER_PROBES, content))
+            file_errors.extend(probe_errors)
+            warnings.extend(f"{validation_name}: {warning}" for warning in probe_warnings)
         
         except Exception as e:
             file_errors.append(f"Error reading file: {e}")
         
-        if file_errors:
-            for error in file_errors:
-                self.errors.append(f"{validation_name}: {error}")
-            self.validation_results[validation_name] = False
-        else:
-            self.validation_results[validation_name] = True
+        for error in file_errors:
+            errors.append(f"{validation_name}: {error}")
+        return validation_name, not file_errors, errors, warnings
     
-    def validate_layout_component(self):
+    def validate_layout_component(self) -> ValidationResult:
         """Validate Layout component"""
         validation_name = "Layout Component"
+        errors = []
+        warnings = []
         layout_file = self.base_path / "src" / "components" / "Layout.tsx"
         
         if not layout_file.exists():
-            self.errors.append(f"{validation_name}: File not found - src/components/Layout.tsx")
-            self.validation_results[validation_name] = False
-            return
+            errors.append(f"{validation_name}: File not found - src/components/Layout.tsx")
+            return validation_name, False, errors, warnings
         
         file_errors = []
         
         try:
-            with open(layout_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Check for React import
-            if not re.search(r"import.*React.*from\s+['\"]react['\"]", content):
-                file_errors.append("Missing React import")
-            
-            # Check for Layout component export
-            if not re.search(r"export\s+(const|function)\s+Layout", content):
-                file_errors.append("Missing Layout component export")
+            content = self._read(layout_file)
             
-            # Check for children prop
-            if not re.search(r"children.*React\.ReactNode", content):
-                file_errors.append("Missing children prop with ReactNode type")
-            
-            # Check for Navbar import
-            if not re.search(r"import.*Navbar.*from", content):
-                file_errors.append("Missing Navbar import")
-            
-            # Check for Navbar usage
-            if not re.search(r"<Navbar\s*/?>", content):
-                file_errors.append("Navbar component not used in Layout")
+            probe_errors, probe_warnings = _report_probes(_LAYOUT_PROBES, _scan_probes(_LAYOUT_PROBES, content))
+            file_errors.extend(probe_errors)
+            warnings.extend(f"{validation_name}: {warning}" for warning in probe_warnings)
         
         except Exception as e:
             file_errors.append(f"Error reading file: {e}")
         
-        if file_errors:
-            for error in file_errors:
-                self.errors.append(f"{validation_name}: {error}")
-            self.validation_results[validation_name] = False
-        else:
-            self.validation_results[validation_name] = True
+        for error in file_errors:
+            errors.append(f"{validation_name}: {error}")
+        return validation_name, not file_errors, errors, warnings
     
-    def validate_navbar_component(self):
+    def validate_navbar_component(self) -> ValidationResult:
         """Validate Navbar component"""
         validation_name = "Navbar Component"
+        errors = []
+        warnings = []
         navbar_file = self.base_path / "src" / "components" / "Navbar.tsx"
         
         if not navbar_file.exists():
-            self.errors.append(f"{validation_name}: File not found - src/components/Navbar.tsx")
-            self.validation_results[validation_name] = False
-            return
+            errors.append(f"{validation_name}: File not found - src/components/Navbar.tsx")
+            return validation_name, False, errors, warnings
         
         file_errors = []
         
         try:
-            with open(navbar_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = self._read(navbar_file)
             
-            # Check for React import
-            if not re.search(r"import.*React.*from\s+['\"]react['\"]", content):
-                file_errors.append("Missing React import")
-            
-            # Check for Navbar component export
-            if not re.search(r"export\s+(const|function)\s+Navbar", content):
-                file_errors.append("Missing Navbar component export")
-            
-            # Check for React Router Link import
-            if not re.search(r"import.*Link.*from\s+['\"]react-router-dom['\"]", content):
-                file_errors.append("Missing Link import from react-router-dom")
-            
-            # Check for ROUTES import
-            if not re.search(r"import.*ROUTES.*from.*routes", content):
-                self.warnings.append(f"{validation_name}: Should import ROUTES from router/routes")
-            
-            # Check for Link usage
-            if not re.search(r"<Link\s+to=", content):
-                file_errors.append("No Link components found - should link to entity views")
+            probe_errors, probe_warnings = _report_probes(_NAVBAR_PROBES, _scan_probes(_NAVBAR_PROBES, content))
+            file_errors.extend(probe_errors)
+            warnings.extend(f"{validation_name}: {warning}" for warning in probe_warnings)
         
         except Exception as e:
             file_errors.append(f"Error reading file: {e}")
         
-        if file_errors:
-            for error in file_errors:
-                self.errors.append(f"{validation_name}: {error}")
-            self.validation_results[validation_name] = False
-        else:
-            self.validation_results[validation_name] = True
+        for error in file_errors:
+            errors.append(f"{validation_name}: {error}")
+        return validation_name, not file_errors, errors, warnings
     
-    def validate_sidebar_component(self):
+    def validate_sidebar_component(self) -> ValidationResult:
         """Validate Sidebar component (if needed)"""
         validation_name = "Sidebar Component"
+        errors = []
+        warnings = []
         sidebar_file = self.base_path / "src" / "components" / "Sidebar.tsx"
         
         # Sidebar only required if more than 3 entities
         if len(self.entities) <= 3:
-            self.validation_results[validation_name] = True
-            return
+            return validation_name, True, errors, warnings
         
         if not sidebar_file.exists():
-            self.errors.append(f"{validation_name}: File not found - src/components/Sidebar.tsx (required for {len(self.entities)} entities)")
-            self.validation_results[validation_name] = False
-            return
+            errors.append(f"{validation_name}: File not found - src/components/Sidebar.tsx (required for {len(self.entities)} entities)")
+            return validation_name, False, errors, warnings
         
         file_errors = []
         
         try:
-            with open(sidebar_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Check for React import
-            if not re.search(r"import.*React.*from\s+['\"]react['\"]", content):
-                file_errors.append("Missing React import")
-            
-            # Check for Sidebar component export
-            if not re.search(r"export\s+(const|function)\s+Sidebar", content):
-                file_errors.append("Missing Sidebar component export")
-            
-            # Check for React Router imports (Link, useLocation)
-            if not re.search(r"import.*Link.*from\s+['\"]react-router-dom['\"]", content):
-                file_errors.append("Missing Link import from react-router-dom")
+            content = self._read(sidebar_file)
             
-            if not re.search(r"import.*useLocation.*from\s+['\"]react-router-dom['\"]", content):
-                self.warnings.append(f"{validation_name}: Should use useLocation for active route highlighting")
+            probe_errors, probe_warnings = _report_probes(_SIDEBAR_PROBES, _scan_probes(_SIDEBAR_PROBES, content))
+            file_errors.extend(probe_errors)
+            warnings.extend(f"{validation_name}: {warning}" for warning in probe_warnings)
         
         except Exception as e:
             file_errors.append(f"Error reading file: {e}")
         
-        if file_errors:
-            for error in file_errors:
-                self.errors.append(f"{validation_name}: {error}")
-            self.validation_results[validation_name] = False
-        else:
-            self.validation_results[validation_name] = True
+        for error in file_errors:
+            errors.append(f"{validation_name}: {error}")
+        return validation_name, not file_errors, errors, warnings
     
-    def validate_barrel_exports(self):
+    def validate_barrel_exports(self) -> ValidationResult:
         """Validate barrel exports are updated"""
         validation_name = "Barrel Exports"
+        errors = []
+        warnings = []
         file_errors = []
         
         # Check views/index.ts
@@ -463,22 +674,20 @@ class Stage4Validator:
             file_errors.append("Missing src/views/index.ts")
         else:
             try:
-                with open(views_index, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                exported = set(_RE_BARREL_STAR.findall(self._read(views_index)))
                 
                 # Check for Home export
-                if not re.search(r"export\s+\*\s+from\s+['\"]\.\/Home['\"]", content):
+                if "Home" not in exported:
                     file_errors.append("views/index.ts: Missing export for Home")
                 
                 # Check for NotFound export
-                if not re.search(r"export\s+\*\s+from\s+['\"]\.\/NotFound['\"]", content):
+                if "NotFound" not in exported:
                     file_errors.append("views/index.ts: Missing export for NotFound")
                 
                 # Check that entity views are still exported
                 for entity_view in self.entity_views:
-                    export_pattern = rf"export\s+\*\s+from\s+['\"]\./{entity_view}['\"]"
-                    if not re.search(export_pattern, content):
-                        self.warnings.append(f"Barrel Exports: views/index.ts should export {entity_view}")
+                    if entity_view not in exported:
+                        warnings.append(f"Barrel Exports: views/index.ts should export {entity_view}")
             
             except Exception as e:
                 file_errors.append(f"views/index.ts: Error reading file - {e}")
@@ -489,40 +698,37 @@ class Stage4Validator:
             file_errors.append("Missing src/components/index.ts")
         else:
             try:
-                with open(components_index, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                exported = set(_RE_BARREL_STAR.findall(self._read(components_index)))
                 
                 # Check for Layout export
-                if not re.search(r"export\s+\*\s+from\s+['\"]\.\/Layout['\"]", content):
+                if "Layout" not in exported:
                     file_errors.append("components/index.ts: Missing export for Layout")
                 
                 # Check for Navbar export
-                if not re.search(r"export\s+\*\s+from\s+['\"]\.\/Navbar['\"]", content):
+                if "Navbar" not in exported:
                     file_errors.append("components/index.ts: Missing export for Navbar")
                 
                 # Check for Sidebar export (if needed)
                 if len(self.entities) > 3:
-                    if not re.search(r"export\s+\*\s+from\s+['\"]\.\/Sidebar['\"]", content):
+                    if "Sidebar" not in exported:
                         file_errors.append("components/index.ts: Missing export for Sidebar")
             
             except Exception as e:
                 file_errors.append(f"components/index.ts: Error reading file - {e}")
         
-        if file_errors:
-            for error in file_errors:
-                self.errors.append(f"{validation_name}: {error}")
-            self.validation_results[validation_name] = False
-        else:
-            self.validation_results[validation_name] = True
+        for error in file_errors:
+            errors.append(f"{validation_name}: {error}")
+        return validation_name, not file_errors, errors, warnings
     
-    def validate_no_duplicate_views(self):
+    def validate_no_duplicate_views(self) -> ValidationResult:
         """Validate no duplicate entity views were created"""
         validation_name = "No Duplicate Views"
+        errors = []
+        warnings = []
         
         views_path = self.base_path / "src" / "views"
         if not views_path.exists():
-            self.validation_results[validation_name] = True
-            return
+            return validation_name, True, errors, warnings
         
         # Count occurrences of each view file
         view_files = {}
@@ -537,173 +743,330 @@ class Stage4Validator:
             if count > 1:
                 duplicates.append(f"{view_name}.tsx appears {count} times")
         
-        if duplicates:
-            for dup in duplicates:
-                self.errors.append(f"{validation_name}: {dup}")
-            self.validation_results[validation_name] = False
-        else:
-            self.validation_results[validation_name] = True
+        for dup in duplicates:
+            errors.append(f"{validation_name}: {dup}")
+        return validation_name, not duplicates, errors, warnings
     
-    def _scan_file_exports(self, file_path: Path) -> Set[str]:
-        """Scan a TypeScript file for exported symbols"""
-        exports = set()
-        
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            named_exports = re.findall(r'export\s+(?:interface|type|const|let|var|function|class)\s+(\w+)', content)
-            exports.update(named_exports)
-            
-            export_declarations = re.findall(r'export\s*\{\s*([^}]+)\s*\}', content)
-            for decl in export_declarations:
-                symbols = [s.strip().split(' as ')[0].strip() for s in decl.split(',')]
-                exports.update(symbols)
-            
-            if re.search(r'export\s+\*\s+from', content):
-                exports.add('*')
-            
-            if re.search(r'export\s+default', content):
-                exports.add('default')
-        
-        except Exception as e:
-            pass
-        
-        return exports
+    def _read(self, file_path: Path, keep: bool = True) -> str:
+        """Read a source file with comments stripped, caching the result for this run.
+        
+        Pass keep=False for a reader that will not come back to the file: a
+        cached copy is still used, but a fresh read is not added to the cache,
+        so it cannot push out files other validations are still reading.
+        """
+        with self._content_lock:
+            content = self._content_cache.get(file_path)
+            if content is not None and keep:
+                self._content_cache.move_to_end(file_path)
+        if content is not None:
+            return content
+        
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        if file_path.suffix in _SOURCE_SUFFIXES:
+            content = _strip_comments(content)
+        if not keep:
+            return content
+        
+        with self._content_lock:
+            self._content_cache[file_path] = content
+            if len(self._content_cache) > CONTENT_CACHE_SIZE:
+                self._content_cache.popitem(last=False)
+        return content
     
-    def _scan_file_imports(self, file_path: Path) -> List[Tuple[List[str], str]]:
-        """Scan a TypeScript file for imports"""
-        imports = []
-        
+    def _scan_file(self, file_path: Path) -> Tuple[Set[str], List[Tuple[List[str], str]]]:
+        """Scan a TypeScript file for exported symbols and imports"""
+        # Large files are scanned in place through mmap. Other validations run
+        # alongside the import scan and may still need a file, so its text is
+        # not evicted here; validate() clears the cache once the pool drains.
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            named_imports = re.finditer(r"import\s*\{\s*([^}]+)\s*\}\s*from\s*['\"]([^'\"]+)['\"]", content)
-            for match in named_imports:
-                symbols_str = match.group(1)
-                from_path = match.group(2)
-                symbols = [s.strip().split(' as ')[0].strip() for s in symbols_str.split(',')]
-                imports.append((symbols, from_path))
-            
-            default_imports = re.finditer(r"import\s+(\w+)\s+from\s+['\"]([^'\"]+)['\"]", content)
-            for match in default_imports:
-                symbol = match.group(1)
-                from_path = match.group(2)
-                imports.append(([symbol], from_path))
-            
-            wildcard_imports = re.finditer(r"import\s+\*\s+as\s+(\w+)\s+from\s+['\"]([^'\"]+)['\"]", content)
-            for match in wildcard_imports:
-                symbol = match.group(1)
-                from_path = match.group(2)
-                imports.append(([symbol], from_path))
-        
+            if os.stat(file_path).st_size >= MMAP_THRESHOLD:
+                with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if not _RE_TEXT_ONLY_BYTES.search(mm):
+                        stripped = _RE_STRIP_BYTES.sub(lambda m: m.group(1) or b' ', mm)
+                        return _collect_scan(_RE_SCAN_BYTES.finditer(stripped), bytes.decode)
+            content = self._read(file_path, keep=False)
         except Exception as e:
-            pass
+            return set(), []
         
-        return imports
+        return _collect_scan(_RE_SCAN.finditer(content), str)
+    
+    def _list_dir(self, directory: str) -> Set[str]:
+        """Names in a directory, listed once per run"""
+        names = self._dir_listings.get(directory)
+        if names is None:
+            try:
+                with os.scandir(directory or '.') as it:
+                    names = {entry.name for entry in it}
+            except OSError:
+                names = set()
+            self._dir_listings[directory] = names
+        return names
     
     def _resolve_import_path(self, importing_file: Path, import_path: str) -> Optional[Path]:
         """Resolve relative import path to absolute file path"""
-        if import_path.startswith('.'):
-            base_dir = importing_file.parent
-            resolved = (base_dir / import_path).resolve()
-            
-            for ext in ['.ts', '.tsx', '.js', '.jsx', '']:
-                if ext == '':
-                    index_path = resolved / 'index.ts'
-                    if index_path.exists():
-                        return index_path
-                    index_path = resolved / 'index.tsx'
-                    if index_path.exists():
-                        return index_path
-                else:
-                    file_with_ext = Path(str(resolved) + ext)
-                    if file_with_ext.exists():
-                        return file_with_ext
-        
-        return None
+        if not import_path.startswith('.'):
+            return None
+        
+        key = (importing_file.parent, import_path)
+        if key in self._resolve_cache:
+            return self._resolve_cache[key]
+        
+        # Lexical normalization only - no symlink resolution syscalls. Made
+        # absolute like the Path.resolve() result it replaces.
+        resolved = os.path.abspath(os.path.join(importing_file.parent, import_path))
+        parent, name = os.path.split(resolved)
+        siblings = self._list_dir(parent)
+        
+        result = None
+        for ext in ['.ts', '.tsx', '.js', '.jsx']:
+            if name + ext in siblings:
+                result = Path(resolved + ext)
+                break
+        else:
+            if name in siblings:
+                children = self._list_dir(resolved)
+                for index_file in ['index.ts', 'index.tsx']:
+                    if index_file in children:
+                        result = Path(resolved) / index_file
+                        break
+        
+        self._resolve_cache[key] = result
+        return result
+    
+    def _iter_ts_files(self, root: Path, skip_dirs: Set[str] = _SKIP_DIRS,
+                       suffixes: Tuple[str, ...] = ('.ts', '.tsx')):
+        """Yield TypeScript files under root without descending into skipped directories"""
+        stack = [str(root)]
+        while stack:
+            subdirs = []
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in skip_dirs:
+                                subdirs.append(entry.path)
+                        elif entry.name.endswith(suffixes):
+                            yield Path(entry.path)
+            except OSError:
+                continue
+            # Reverse so directories are visited in listing order, like os.walk
+            stack.extend(reversed(subdirs))
     
-    def validate_imports(self):
+    def validate_imports(self) -> ValidationResult:
         """Validate all imports are valid"""
         validation_name = "Import Validation"
+        errors = []
+        warnings = []
         src_path = self.base_path / "src"
         
         if not src_path.exists():
-            self.validation_results[validation_name] = True
-            return
+            return validation_name, True, errors, warnings
+        
+        # Replay the previous result when no file an import could resolve to
+        # has been added, removed or modified since it was computed
+        source_files = list(self._iter_ts_files(src_path, suffixes=_RESOLVABLE_SUFFIXES))
+        watermark = self._tree_watermark(source_files) if self.use_cache else None
+        cache_key = self._cache_key(validation_name)
+        entry = self._cache.get(cache_key)
+        if watermark is not None and entry and entry.get('watermark') == watermark:
+            return validation_name, entry['result'], entry['errors'], entry['warnings']
+        
+        ts_files = [file_path for file_path in source_files if file_path.suffix in ('.ts', '.tsx')]
+        
+        # Scan every file for exports and imports in parallel; reads dominate
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            scans = list(executor.map(self._scan_file, ts_files))
         
         # Build export map
-        for root, dirs, files in os.walk(src_path):
-            dirs[:] = [d for d in dirs if d != 'node_modules']
-            
-            for file in files:
-                if not (file.endswith('.ts') or file.endswith('.tsx')):
-                    continue
-                
-                file_path = Path(root) / file
-                exports = self._scan_file_exports(file_path)
-                self.file_exports[file_path] = exports
+        for file_path, (exports, _) in zip(ts_files, scans):
+            self.file_exports[file_path] = exports
         
         # Validate imports
         import_errors = []
         
-        for root, dirs, files in os.walk(src_path):
-            dirs[:] = [d for d in dirs if d != 'node_modules']
+        for file_path, (_, imports) in zip(ts_files, scans):
+            rel_path = str(file_path.relative_to(self.base_path))
             
-            for file in files:
-                if not (file.endswith('.ts') or file.endswith('.tsx')):
+            for symbols, from_path in imports:
+                if not from_path.startswith('.'):
                     continue
                 
-                file_path = Path(root) / file
-                rel_path = str(file_path.relative_to(self.base_path))
-                imports = self._scan_file_imports(file_path)
+                resolved_path = self._resolve_import_path(file_path, from_path)
                 
-                for symbols, from_path in imports:
-                    if not from_path.startswith('.'):
-                        continue
-                    
-                    resolved_path = self._resolve_import_path(file_path, from_path)
-                    
-                    if resolved_path is None:
-                        import_errors.append(f"{rel_path}: Import path not found '{from_path}'")
-                        continue
-                    
-                    if resolved_path not in self.file_exports:
-                        continue
-                    
-                    available_exports = self.file_exports[resolved_path]
-                    
-                    if '*' in available_exports:
-                        continue
-                    
-                    for symbol in symbols:
-                        if symbol not in available_exports and 'default' not in available_exports:
-                            import_errors.append(f"{rel_path}: Symbol '{symbol}' not exported from '{from_path}'")
-        
-        if import_errors:
-            for error in import_errors:
-                self.errors.append(f"{validation_name}: {error}")
-            self.validation_results[validation_name] = False
-        else:
-            self.validation_results[validation_name] = True
+                if resolved_path is None:
+                    import_errors.append(f"{rel_path}: Import path not found '{from_path}'")
+                    continue
+                
+                if resolved_path not in self.file_exports:
+                    continue
+                
+                available_exports = self.file_exports[resolved_path]
+                
+                if '*' in available_exports:
+                    continue
+                
+                for symbol in symbols:
+                    if symbol not in available_exports and 'default' not in available_exports:
+                        import_errors.append(f"{rel_path}: Symbol '{symbol}' not exported from '{from_path}'")
+        
+        for error in import_errors:
+            errors.append(f"{validation_name}: {error}")
+        
+        if watermark is not None:
+            self._cache[cache_key] = {
+                'watermark': watermark,
+                'result': not import_errors,
+                'errors': errors,
+                'warnings': warnings,
+            }
+        return validation_name, not import_errors, errors, warnings
+    
+    def _load_cache(self):
+        """Load cached validation results written by a previous run"""
+        try:
+            data = _loads(self.cache_file.read_bytes())
+        except (OSError, ValueError):
+            return
+        
+        if data.get('version') == CACHE_VERSION:
+            self._cache = data.get('entries', {})
+    
+    def _save_cache(self):
+        """Persist cached validation results for the next run"""
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_suffix('.tmp')
+            tmp_file.write_text(json.dumps({'version': CACHE_VERSION, 'entries': self._cache}, separators=(',', ':')))
+            os.replace(tmp_file, self.cache_file)
+        except OSError:
+            pass
+    
+    def _cache_key(self, validation_name: str) -> str:
+        return f"{self.base_path.resolve()}:{validation_name}"
+    
+    @staticmethod
+    def _tree_watermark(files: List[Path]) -> Optional[str]:
+        """Digest of every file's path, mtime and size; changes on any edit, add or delete"""
+        digest = hashlib.blake2b(digest_size=16)
+        for file_path in files:
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                return None
+            digest.update(f"{file_path}\0{st.st_mtime_ns}\0{st.st_size}\n".encode())
+        return digest.hexdigest()
+    
+    def _stamp_files(self, files: List[Path], cached: Optional[Dict[str, list]] = None) -> Optional[Dict[str, list]]:
+        """Stamp input files, reusing cached digests when (mtime, size) is unchanged"""
+        stamps = {}
+        for file_path in files:
+            key = str(file_path.resolve())
+            try:
+                st = os.stat(key)
+            except OSError:
+                stamps[key] = None
+                continue
+            
+            previous = cached.get(key) if cached else None
+            if previous and previous[0] == st.st_mtime_ns and previous[1] == st.st_size:
+                stamps[key] = previous
+            else:
+                try:
+                    stamps[key] = list(_CacheEntry(st.st_mtime_ns, st.st_size, _file_digest(file_path)))
+                except OSError:
+                    return None
+        return stamps
+    
+    @staticmethod
+    def _same_inputs(stamps: Dict[str, list], cached_files: Dict[str, list]) -> bool:
+        """Compare file stamps by content digest; missing files must match missing files"""
+        if stamps.keys() != cached_files.keys():
+            return False
+        for key, stamp in stamps.items():
+            cached = cached_files[key]
+            if stamp is None or cached is None:
+                if stamp is not cached:
+                    return False
+            elif _CacheEntry(*stamp).blake2b_hex != _CacheEntry(*cached).blake2b_hex:
+                return False
+        return True
+    
+    def _run_cached(self, validation_name: str, files: List[Path], validate, context=None) -> ValidationResult:
+        """Run a validate_* method, replaying its stored result if its inputs are unchanged"""
+        if not self.use_cache:
+            return validate()
+        
+        cache_key = self._cache_key(validation_name)
+        entry = self._cache.get(cache_key)
+        cached_files = entry['files'] if entry and entry['context'] == context else None
+        stamps = self._stamp_files(files, cached_files)
+        
+        if cached_files is not None and stamps is not None and self._same_inputs(stamps, cached_files):
+            entry['files'] = stamps
+            return validation_name, entry['result'], entry['errors'], entry['warnings']
+        
+        result = validate()
+        
+        if stamps is not None:
+            # Each validation owns its own key, so workers never write the same entry
+            _, ok, errors, warnings = result
+            self._cache[cache_key] = {
+                'files': stamps,
+                'context': context,
+                'result': ok,
+                'errors': errors,
+                'warnings': warnings,
+            }
+        return result
     
     def validate(self) -> bool:
         """Run all validations"""
         if not self.load_inputs():
             return False
         
-        # Run all validations silently
-        self.validate_home_view()
-        self.validate_notfound_view()
-        self.validate_route_definitions()
-        self.validate_router_setup()
-        self.validate_layout_component()
-        self.validate_navbar_component()
-        self.validate_sidebar_component()
-        self.validate_barrel_exports()
-        self.validate_no_duplicate_views()
-        self.validate_imports()
+        if self.use_cache:
+            self._load_cache()
+        self._preload_shared_files()
+        src = self.base_path / "src"
+        sidebar_required = len(self.entities) > 3
+        
+        # Run all validations silently and concurrently; single-file checks
+        # replay cached results. Results are merged in submission order so the
+        # report is identical to a serial run.
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = [
+                executor.submit(self._run_cached, "Home View", [src / "views" / "Home.tsx"],
+                                self.validate_home_view),
+                executor.submit(self._run_cached, "NotFound View", [src / "views" / "NotFound.tsx"],
+                                self.validate_notfound_view),
+                executor.submit(self._run_cached, "Route Definitions", [src / "router" / "routes.ts"],
+                                self.validate_route_definitions, context=self.entity_views),
+                executor.submit(self._run_cached, "Router Setup", [src / "router" / "index.tsx"],
+                                self.validate_router_setup),
+                executor.submit(self._run_cached, "Layout Component", [src / "components" / "Layout.tsx"],
+                                self.validate_layout_component),
+                executor.submit(self._run_cached, "Navbar Component", [src / "components" / "Navbar.tsx"],
+                                self.validate_navbar_component),
+                executor.submit(self._run_cached, "Sidebar Component", [src / "components" / "Sidebar.tsx"],
+                                self.validate_sidebar_component, context=[len(self.entities)]),
+                executor.submit(self._run_cached, "Barrel Exports",
+                                [src / "views" / "index.ts", src / "components" / "index.ts"],
+                                self.validate_barrel_exports, context=[self.entity_views, sidebar_required]),
+                executor.submit(self.validate_no_duplicate_views),
+                executor.submit(self.validate_imports),
+            ]
+            
+            for future in futures:
+                validation_name, ok, errors, warnings = future.result()
+                self.errors.extend(errors)
+                self.warnings.extend(warnings)
+                self.validation_results[validation_name] = ok
+        
+        # Drop whatever file text is left now that every reader has finished
+        self._content_cache.clear()
+        if self.use_cache:
+            self._save_cache()
         
         # Print summary
         print_section("VALIDATION SUMMARY")
@@ -761,8 +1124,7 @@ class Stage4Validator:
             return
         
         try:
-            with open(output_file, 'r') as f:
-                output_data = json.load(f)
+            output_data = _loads(output_file.read_bytes())
             
             if 'files' not in output_data:
                 print_error("output/stage_4_output.json missing 'files' key")
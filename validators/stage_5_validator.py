@@ -20,20 +20,60 @@ CRITICAL VALIDATIONS:
 
 import sys
 import os
+import stat
+import bisect
+import io
 import json
 import yaml
 import re
+import mmap
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, List, Set, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Set, Optional, Tuple, NamedTuple
 from urllib.parse import urlparse
 
+# libyaml's C loader is an order of magnitude faster on large OpenAPI specs
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+# orjson parses large ERDs noticeably faster; fall back to the stdlib.
+# Its JSONDecodeError subclasses json.JSONDecodeError, so handlers are unchanged.
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# The regex module is a drop-in replacement for re with a faster matcher on
+# the literal-heavy alternations below; fall back to the stdlib. google-re2
+# is not an option because the combined probes rely on lookaheads.
+try:
+    import regex as _rx
+except ImportError:
+    _rx = re
+
+# pyahocorasick reports every literal signal of a service file in one pass;
+# fall back to one substring test per literal.
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# ANSI colors only when writing to a terminal; piped CI logs get plain text
+_USE_COLOR = sys.stdout.isatty()
+
 class Colors:
-    GREEN = '\033[92m'
-    RED = '\033[91m'
-    YELLOW = '\033[93m'
-    BLUE = '\033[94m'
-    CYAN = '\033[96m'
-    RESET = '\033[0m'
+    GREEN = '\033[92m' if _USE_COLOR else ''
+    RED = '\033[91m' if _USE_COLOR else ''
+    YELLOW = '\033[93m' if _USE_COLOR else ''
+    BLUE = '\033[94m' if _USE_COLOR else ''
+    CYAN = '\033[96m' if _USE_COLOR else ''
+    RESET = '\033[0m' if _USE_COLOR else ''
 
 def print_success(msg):
     print(f"{Colors.GREEN}✓ {msg}{Colors.RESET}")
@@ -47,11 +87,531 @@ def print_warning(msg):
 def print_info(msg):
     print(f"{Colors.BLUE}ℹ {msg}{Colors.RESET}")
 
+def print_lines(color, marker, messages):
+    """print_success/error/... for many messages, written in one call"""
+    sys.stdout.write(''.join(f"{color}{marker} {msg}{Colors.RESET}\n" for msg in messages))
+
 def print_section(title):
     print(f"\n{Colors.CYAN}{'='*70}")
     print(f"  {title}")
     print(f"{'='*70}{Colors.RESET}")
 
+# Shell files are small and known up front, so they are read concurrently
+MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+# Shared read-only default for missing sections of the ERD
+_EMPTY = MappingProxyType({})
+
+# Files at least this large are scanned in place through mmap with the bytes
+# form of their probes, rather than being decoded into a str first. Files
+# containing bytes the str probes treat differently - non-ASCII (\w, \s and
+# IGNORECASE are Unicode-aware, and bad UTF-8 must still fail to decode), \r
+# (translated by text-mode reads) and \x1c-\x1f (\s in str patterns only) -
+# are always scanned as text.
+MMAP_THRESHOLD = 16 * 1024
+_RE_TEXT_ONLY_BYTES = re.compile(rb"[^\x00-\x7f]|[\r\x1c-\x1f]")
+
+# (validation name, passed, errors, warnings) returned by each validate_* method
+ValidationResult = Tuple[str, bool, List[str], List[str]]
+
+# Files read by the validate_* methods, relative to the project root.
+# Service files are discovered separately under src/services.
+_SHELL_FILES = (
+    ("src", "App.tsx"),
+    ("src", "main.tsx"),
+    ("src", "App.css"),
+    ("src", "index.css"),
+    ("src", "context", "AuthContext.tsx"),
+    ("src", "context", "index.ts"),
+    ("index.html",),
+    ("package.json",),
+    (".env",),
+    ("src", "config", "api.config.ts"),
+)
+
+_TS_EXTENSIONS = frozenset(('ts', 'tsx'))
+
+def _iter_source_files(root: str, extensions: frozenset = _TS_EXTENSIONS,
+                       skip_dirs: frozenset = frozenset(('node_modules',))):
+    """Yield paths of files under root with one of extensions, in os.walk order.
+    
+    Uses the DirEntry type cache from os.scandir instead of a stat per
+    entry. Like os.walk, symlinked directories are not descended into.
+    """
+    stack = [root]
+    while stack:
+        subdirs = []
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        if entry.name not in skip_dirs and not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    else:
+                        _, dot, ext = entry.name.rpartition('.')
+                        if dot and ext in extensions:
+                            yield entry.path
+        except OSError:
+            continue
+        # Reverse so directories are visited in listing order
+        stack.extend(reversed(subdirs))
+
+# Precompiled patterns shared by the validate_* methods
+# App.tsx / main.tsx
+_RE_REACT_IMPORT = _rx.compile(r"import.*React.*from\s+['\"]react['\"]")
+_RE_APP_NAMED_EXPORT = _rx.compile(r"export\s+(const|function)\s+App\b")
+_RE_APP_DEFINITION = _rx.compile(r"(const|function)\s+App\b")
+_RE_APP_DEFAULT_EXPORT = _rx.compile(r"export\s+default\s+App\b")
+_RE_APP_DEFAULT_INLINE = _rx.compile(r"export\s+default\s+(function|const)\s+App\b")
+_RE_APP_ROUTER_IMPORT = _rx.compile(r"import.*AppRouter.*from.*router")
+_RE_APP_CSS_IMPORT = _rx.compile(r"import\s+['\"]\.\/App\.css['\"]")
+_RE_APP_ROUTER_TAG = _rx.compile(r"<AppRouter\s*/?>")
+_RE_AUTH_PROVIDER_IMPORT = _rx.compile(r"import.*AuthProvider.*from")
+_RE_REACT_DOM_IMPORT = _rx.compile(r"import.*ReactDOM.*from\s+['\"]react-dom/client['\"]")
+_RE_APP_IMPORT = _rx.compile(r"import.*App.*from.*App")
+_RE_APP_NAMED_IMPORT = _rx.compile(r"import\s*\{\s*App\s*\}")
+_RE_APP_DEFAULT_IMPORT = _rx.compile(r"import\s+App\s+from")
+_RE_INDEX_CSS_IMPORT = _rx.compile(r"import\s+['\"]\.\/index\.css['\"]")
+_RE_ROOT_ELEMENT = _rx.compile(r"getElementById\(['\"]root['\"]")
+
+# App.css / index.css
+# Required App.css selectors as (probe name, pattern, error when missing);
+# patterns are written out escaped so nothing is escaped or formatted per run
+_CSS_SELECTOR_CHECKS = (
+    ("selector_app", _rx.compile(r"\.app\s*\{"), "Missing styles for '.app'"),
+    ("selector_layout", _rx.compile(r"\.layout\s*\{"), "Missing styles for '.layout'"),
+    ("selector_navbar", _rx.compile(r"\.navbar\s*\{"), "Missing styles for '.navbar'"),
+    ("selector_button", _rx.compile(r"button\s*\{"), "Missing styles for 'button'"),
+)
+_RE_BOX_SIZING = _rx.compile(r"box-sizing\s*:\s*border-box")
+_RE_BODY_RULE = _rx.compile(r"body\s*\{")
+_RE_ROOT_RULE = _rx.compile(r"(:root|html)\s*\{")
+# The same index.css rules as token sequences that may be separated by
+# whitespace, matched with str.find on the text path instead of a regex
+_INDEX_CSS_TOKENS = (
+    ("box_sizing", (("box-sizing", ":", "border-box"),)),
+    ("body_rule", (("body", "{"),)),
+    ("root_rule", ((":root", "{"), ("html", "{"))),
+)
+
+# AuthContext.tsx / context barrel
+_RE_CREATE_CONTEXT_IMPORT = _rx.compile(r"import.*createContext.*from\s+['\"]react['\"]")
+_RE_USE_CONTEXT_IMPORT = _rx.compile(r"import.*useContext.*from\s+['\"]react['\"]")
+_RE_AUTH_CONTEXT_CREATE = _rx.compile(r"const\s+AuthContext\s*=\s*createContext")
+_RE_AUTH_PROVIDER_EXPORT = _rx.compile(r"export\s+(const|function)\s+AuthProvider")
+_RE_USE_AUTH_EXPORT = _rx.compile(r"export\s+(const|function)\s+useAuth")
+_AUTH_METHOD_CHECKS = (
+    ("method_login", _rx.compile(r"login\s*[:=]"), "Missing login method"),
+    ("method_logout", _rx.compile(r"logout\s*[:=]"), "Missing logout method"),
+)
+_RE_AUTH_CONTEXT_BARREL = _rx.compile(r"export\s+\*\s+from\s+['\"]\.\/AuthContext['\"]")
+
+# index.html
+_RE_DOCTYPE = _rx.compile(r"<!DOCTYPE html>", _rx.IGNORECASE)
+_RE_META_CHARSET = _rx.compile(r'<meta\s+charset=["\']UTF-8["\']', _rx.IGNORECASE)
+_RE_META_VIEWPORT = _rx.compile(r'<meta\s+name=["\']viewport["\']', _rx.IGNORECASE)
+_RE_ROOT_DIV = _rx.compile(r'<div\s+id=["\']root["\']')
+_RE_MAIN_SCRIPT = _rx.compile(r'<script.*src=["\'].*main\.tsx["\']')
+
+# .env / api.config.ts / services
+_RE_ENV_BASE_URL = _rx.compile(r'VITE_API_BASE_URL\s*=\s*(.+)')
+_RE_CONFIG_BASE_URL = _rx.compile(r'baseURL:\s*[\'"`]([^\'"`]+)[\'"`]')
+_RE_API_ENDPOINT = _rx.compile(r'api\.\w+\([\'"`](/[^\'"` ]+)[\'"`]')
+_RE_API_ENDPOINT_CALL = _rx.compile(r'api\.\w+\(\s*[\'"`]([/][^\'"` ]*)[\'"`]\s*[,\)]')
+_RE_API_CALL = _rx.compile(r'\bapi\.(get|post|put|patch|delete)\(')
+_RE_AXIOS_CALL = _rx.compile(r'\baxios\.(get|post|put|patch|delete)\(')
+_RE_HARDCODED_URL = _rx.compile(r'[\'"`](https?://[^\'"`]+)[\'"`]')
+_RE_TEMPLATE_PARAM = _rx.compile(r'\$\{(\w+)\}')
+_substitute_template_params = partial(_RE_TEMPLATE_PARAM.sub, r'{\1}')
+
+def _normalize_template(path: str) -> str:
+    """Rewrite ${param} placeholders as {param}, as OpenAPI paths spell them"""
+    return _substitute_template_params(path) if '${' in path else path
+
+# Every API client call pattern above starts with this literal
+_LIT_API_ANCHOR = "api."
+
+def _iter_api_calls(pattern: "re.Pattern", content: str):
+    """Yield the non-overlapping matches of an api.* call pattern, like finditer.
+    
+    str.find jumps straight between occurrences of the "api." anchor and the
+    pattern is only tried there, so text without API calls is never handed
+    to the regex engine.
+    """
+    pos = content.find(_LIT_API_ANCHOR)
+    while pos != -1:
+        match = pattern.match(content, pos)
+        if match:
+            yield match
+            pos = content.find(_LIT_API_ANCHOR, match.end())
+        else:
+            pos = content.find(_LIT_API_ANCHOR, pos + 1)
+
+def _line_starts(content: str) -> List[int]:
+    """Offsets at which each line of content starts, for bisecting match offsets"""
+    starts = [0]
+    pos = content.find('\n')
+    while pos != -1:
+        starts.append(pos + 1)
+        pos = content.find('\n', pos + 1)
+    return starts
+
+def _find_line(content: str, line_starts: List[int], text: str, marker: str) -> Optional[int]:
+    """1-based number of the first line containing both text and marker, else None"""
+    if '\n' in text:
+        return None
+    pos = content.find(text)
+    while pos != -1:
+        line_num = bisect.bisect_right(line_starts, pos)
+        line_end = content.find('\n', pos)
+        if line_end == -1:
+            line_end = len(content)
+        if content.find(marker, line_starts[line_num - 1], line_end) != -1:
+            return line_num
+        pos = content.find(text, line_end)
+    return None
+
+def _line_text(content: str, line_starts: List[int], line_num: int) -> str:
+    """Text of a 1-based line, without its newline"""
+    start = line_starts[line_num - 1]
+    end = line_starts[line_num] - 1 if line_num < len(line_starts) else len(content)
+    return content[start:end]
+
+# Export/import statements
+_RE_DEFAULT_EXPORT = _rx.compile(r'export\s+default')
+# Every export statement shape in one alternation, dispatched on lastgroup
+_RE_EXPORTS = _rx.compile(
+    r'(?P<declared>export\s+(interface|type|const|let|var|function|class)\s+(\w+))'
+    r'|(?P<list>export\s*\{\s*([^}]+)\s*\}(?!\s*from))'
+    r'|(?P<reexport>export\s*\{\s*([^}]+)\s*\}\s*from\s+[\'"]([^"\']+)[\'"])'
+    r'|(?P<wildcard>export\s+\*\s+from\s+[\'"]([^"\']+)[\'"])'
+    r'|(?P<default>export\s+default)'
+)
+_RE_NAMED_IMPORT = _rx.compile(r"import\s*\{\s*([^}]+)\s*\}\s*from\s*['\"]([^'\"]+)['\"]")
+_RE_DEFAULT_IMPORT = _rx.compile(r"import\s+(\w+)\s+from\s+['\"]([^'\"]+)['\"]")
+_RE_WILDCARD_IMPORT = _rx.compile(r"import\s+\*\s+as\s+(\w+)\s+from\s+['\"]([^'\"]+)['\"]")
+
+# Declarations that create a runtime value, as opposed to interface/type
+_VALUE_KEYWORDS = frozenset(('const', 'let', 'var', 'function', 'class'))
+# Declarations that satisfy a named import, and those that make a default
+# import of the same name a mismatch
+_NAMED_IMPORT_KEYWORDS = frozenset(('const', 'function', 'class', 'interface', 'type'))
+_DEFAULT_MISMATCH_KEYWORDS = frozenset(('const', 'function', 'class'))
+
+class _ExportScan(NamedTuple):
+    """Export statements found in one file by a single pass of _RE_EXPORTS"""
+    declared: List[Tuple[str, str]]    # (keyword, name) of export const/function/...
+    keywords: Dict[str, Set[str]]      # declared name -> keywords it was exported with
+    lists: List[str]                   # bodies of export { ... } without a from
+    reexports: List[Tuple[str, str]]   # (body, path) of export { ... } from '...'
+    wildcards: List[str]               # paths of export * from '...'
+    has_default: bool
+
+def _scan_exports(content: str) -> _ExportScan:
+    """Collect every export statement in content with one finditer pass"""
+    scan = _ExportScan([], {}, [], [], [], False)
+    if _LIT_EXPORT not in content:
+        return scan
+    
+    has_default = False
+    for match in _RE_EXPORTS.finditer(content):
+        kind = match.lastgroup
+        if kind == 'declared':
+            scan.declared.append((match.group(2), match.group(3)))
+            scan.keywords.setdefault(match.group(3), set()).add(match.group(2))
+        elif kind == 'list':
+            scan.lists.append(match.group(5))
+        elif kind == 'reexport':
+            scan.reexports.append((match.group(7), match.group(8)))
+        elif kind == 'wildcard':
+            scan.wildcards.append(match.group(10))
+        else:
+            has_default = True
+    return scan._replace(has_default=has_default)
+
+# Per-symbol import shapes, compiled once for each distinct symbol
+@lru_cache(maxsize=None)
+def _named_import_pattern(symbol: str) -> "re.Pattern":
+    return _rx.compile(rf"import\s*\{{[^}}]*\b{_rx.escape(symbol)}\b[^}}]*\}}")
+
+@lru_cache(maxsize=None)
+def _default_import_pattern(symbol: str) -> "re.Pattern":
+    return _rx.compile(rf"import\s+{_rx.escape(symbol)}\b")
+
+# The same few specifiers (react, react-dom/client, @mui/...) recur in
+# almost every file
+@lru_cache(maxsize=4096)
+def _extract_package_name(import_path: str) -> Optional[str]:
+    """Extract package name from import path"""
+    # Handle scoped packages like @vitejs/plugin-react
+    head, sep, rest = import_path.partition('/')
+    if sep and import_path.startswith('@'):
+        return f"{head}/{rest.partition('/')[0]}"
+    
+    # Handle regular packages like react, react-dom/client
+    return head
+
+# Route/view naming
+_RE_CAMEL_BOUNDARY = _rx.compile(r'([a-z0-9])([A-Z])')
+
+@lru_cache(maxsize=None)
+def _route_constant_pattern(snake_case: str) -> "re.Pattern":
+    """Accepts SNAKE:, SNAKE_VIEW: and SNAKE_ANY: in a single search"""
+    return _rx.compile(rf"\b{_rx.escape(snake_case)}(?:_[A-Z_]+)?\s*:")
+
+def _router_view_index(router_content: str) -> Tuple[str, str]:
+    """Index router/index.tsx once for the per-view import and Route checks.
+    
+    Returns (imports, elements). A view matches `import.*View.*from.*views`
+    iff View is in imports, and matches `<Route.*element={<View` iff
+    '\n' + View is in elements. Both are built line by line, as the
+    patterns match.
+    """
+    imports = []
+    elements = []
+    for line in router_content.split('\n'):
+        # Widest span between an `import` and a `from` that has `views` after it
+        start = line.find('import')
+        views = line.rfind('views')
+        if start != -1 and views != -1:
+            end = line.rfind('from', 0, views)
+            if end >= start + 6:
+                imports.append(line[start + 6:end])
+        
+        # Whatever follows each `element={<` that comes after a `<Route`
+        start = line.find('<Route')
+        if start != -1:
+            pos = line.find('element={<', start + 6)
+            while pos != -1:
+                elements.append(line[pos + 10:])
+                pos = line.find('element={<', pos + 1)
+    return '\n'.join(imports), ''.join('\n' + tail for tail in elements)
+
+# Every `KEY:` in routes.ts, collected in one pass so each view's route
+# constant becomes a set lookup
+_RE_ROUTE_KEY = _rx.compile(r'\b(\w+)\s*:')
+_RE_ROUTE_KEY_SUFFIX = _rx.compile(r'[A-Z_]+')
+_RE_WORD = _rx.compile(r'\w+')
+
+def _route_key_index(route_keys: Set[str]) -> Set[str]:
+    """Every SNAKE such that a key is SNAKE or SNAKE_[A-Z_]+.
+    
+    Membership matches the route constant pattern for a snake_case made of
+    word characters; other names must be searched with the pattern itself.
+    """
+    index = set(route_keys)
+    for key in route_keys:
+        pos = key.find('_')
+        while pos != -1:
+            if _RE_ROUTE_KEY_SUFFIX.fullmatch(key, pos + 1):
+                index.add(key[:pos])
+            pos = key.find('_', pos + 1)
+    return index
+
+# Plain substrings; checked with `in` rather than the regex engine
+_LIT_AXIOS = "axios."
+_LIT_URL_SCHEME = "://"
+_LIT_EXPORT = "export"
+_LIT_IMPORT = "import"
+_LIT_CREATE_ROOT = "ReactDOM.createRoot"
+_LIT_STRICT_MODE = "<React.StrictMode>"
+_LIT_AUTH_PROVIDER_TAG = "<AuthProvider>"
+
+# Literal signals looked for in every service file
+_LIT_API_IMPORTS = ("from './api'", 'from "./api"', "from '../config/api")
+_SERVICE_LITERALS = _LIT_API_IMPORTS + (_LIT_API_ANCHOR, _LIT_AXIOS, _LIT_URL_SCHEME)
+
+def _literal_finder(literals: Tuple[str, ...]):
+    """Return a function giving the set of literals that occur in a text"""
+    if ahocorasick is None:
+        return lambda content: {literal for literal in literals if literal in content}
+    
+    automaton = ahocorasick.Automaton()
+    for literal in literals:
+        automaton.add_word(literal, literal)
+    automaton.make_automaton()
+    return lambda content: {literal for _, literal in automaton.iter(content)}
+
+_find_service_literals = _literal_finder(_SERVICE_LITERALS)
+
+def _contains_spaced(text: str, tokens: Tuple[str, ...]) -> bool:
+    """True if the tokens appear in order with only whitespace between them.
+    
+    Equivalent to searching for the escaped tokens joined by \\s*, because no
+    token starts with whitespace.
+    """
+    first = tokens[0]
+    pos = text.find(first)
+    while pos != -1:
+        end = pos + len(first)
+        for token in tokens[1:]:
+            while end < len(text) and text[end].isspace():
+                end += 1
+            if not text.startswith(token, end):
+                break
+            end += len(token)
+        else:
+            return True
+        pos = text.find(first, pos + 1)
+    return False
+
+def _url_path(url: str) -> str:
+    """Path component of a URL, as urlparse(url).path would return it.
+    
+    Plain http(s):// and root-relative URLs are split by slicing; anything
+    else (other schemes, '//' prefixes, IPv6 hosts, embedded whitespace)
+    goes through urlparse.
+    """
+    if url.startswith(('http://', 'https://')):
+        # The host runs up to the first '/', '?' or '#'
+        start = _find_first(url, '/?#', url.find('://') + 3)
+    elif url.startswith('/') and not url.startswith('//'):
+        start = 0
+    else:
+        return urlparse(url).path
+    
+    if any(char in url for char in '\t\r\n[]'):
+        return urlparse(url).path
+    
+    path = url[start:_find_first(url, '?#', start)]
+    # Like urlparse, drop ;params from the last path segment
+    params = path.find(';', path.rfind('/') + 1)
+    return path if params == -1 else path[:params]
+
+def _find_first(text: str, delimiters: str, start: int) -> int:
+    """Index of the first of delimiters in text at or after start, else len(text)"""
+    end = len(text)
+    for delimiter in delimiters:
+        index = text.find(delimiter, start, end)
+        if index != -1:
+            end = index
+    return end
+
+class _ProbeSet(NamedTuple):
+    """A combined probe pattern plus the literal probes tested with `in`, in str and bytes form"""
+    pattern: Optional["re.Pattern"]
+    literals: Tuple[Tuple[str, str], ...]
+    bytes_pattern: Optional["re.Pattern"]
+    bytes_literals: Tuple[Tuple[str, bytes], ...]
+    size: int
+
+def _compile_probes(probes: Dict[str, object]) -> _ProbeSet:
+    """Combine named probes into one pattern so a file is scanned in a single pass.
+    
+    A plain string probe is a literal substring test. Each regex probe sits
+    in its own lookahead, so probes that match the same text are all
+    recorded at that position. The leading gate keeps finditer from
+    stopping at positions where no probe matches.
+    """
+    sources = {
+        name: f"(?i:{probe.pattern})" if probe.flags & _rx.IGNORECASE else probe.pattern
+        for name, probe in probes.items() if not isinstance(probe, str)
+    }
+    pattern = bytes_pattern = None
+    if sources:
+        gate = "|".join(sources.values())
+        captures = "".join(f"(?:(?=(?P<{name}>{source}))|)" for name, source in sources.items())
+        pattern = _rx.compile(f"(?=(?:{gate})){captures}")
+        bytes_pattern = _rx.compile(pattern.pattern.encode('utf-8'))
+    
+    literals = tuple((name, probe) for name, probe in probes.items() if isinstance(probe, str))
+    return _ProbeSet(
+        pattern=pattern,
+        literals=literals,
+        bytes_pattern=bytes_pattern,
+        bytes_literals=tuple((name, literal.encode('utf-8')) for name, literal in literals),
+        size=len(probes),
+    )
+
+def _scan_probes(probes: _ProbeSet, content: str) -> Set[str]:
+    """Return the names of the probes that match anywhere in content"""
+    found = {name for name, literal in probes.literals if literal in content}
+    return _scan_probe_pattern(probes.pattern, content, found, probes.size)
+
+def _scan_probes_mmap(probes: _ProbeSet, mm: mmap.mmap) -> Set[str]:
+    """Bytes counterpart of _scan_probes for a memory-mapped file"""
+    found = {name for name, literal in probes.bytes_literals if mm.find(literal) != -1}
+    return _scan_probe_pattern(probes.bytes_pattern, mm, found, probes.size)
+
+def _scan_probe_pattern(pattern: Optional["re.Pattern"], content, found: Set[str], size: int) -> Set[str]:
+    """Add the regex probes matching content to found, stopping once all are seen"""
+    if pattern is None:
+        return found
+    
+    for match in pattern.finditer(content):
+        found.update(name for name, value in match.groupdict().items() if value is not None)
+        if len(found) == size:
+            break
+    return found
+
+# App.tsx probes and checks come in two variants; the auth variant is used
+# only when the ERD enables authentication, so the AuthProvider probes are
+# never scanned for otherwise
+_APP_BASE_PROBES = {
+    "react_import": _RE_REACT_IMPORT,
+    "named_export": _RE_APP_NAMED_EXPORT,
+    "definition": _RE_APP_DEFINITION,
+    "default_export": _RE_APP_DEFAULT_EXPORT,
+    "default_inline": _RE_APP_DEFAULT_INLINE,
+    "router_import": _RE_APP_ROUTER_IMPORT,
+    "css_import": _RE_APP_CSS_IMPORT,
+    "router_tag": _RE_APP_ROUTER_TAG,
+    # Any default export; read by the main.tsx import compatibility check
+    "any_default_export": _RE_DEFAULT_EXPORT,
+}
+_APP_PROBES = _compile_probes(_APP_BASE_PROBES)
+_APP_AUTH_PROBES = _compile_probes({
+    **_APP_BASE_PROBES,
+    "auth_provider_import": _RE_AUTH_PROVIDER_IMPORT,
+    "auth_provider_tag": _LIT_AUTH_PROVIDER_TAG,
+})
+# (probe name, error when missing), checked after the App export checks
+_APP_CHECKS = (
+    ("router_import", "Missing AppRouter import from router"),
+    ("css_import", "Missing App.css import"),
+    ("router_tag", "AppRouter component not used"),
+)
+_APP_AUTH_CHECKS = _APP_CHECKS + (
+    ("auth_provider_import", "Auth enabled but missing AuthProvider import"),
+    ("auth_provider_tag", "Auth enabled but AuthProvider not wrapping AppRouter"),
+)
+_MAIN_PROBES = _compile_probes({
+    "react_import": _RE_REACT_IMPORT,
+    "react_dom_import": _RE_REACT_DOM_IMPORT,
+    "app_import": _RE_APP_IMPORT,
+    "app_named_import": _RE_APP_NAMED_IMPORT,
+    "app_default_import": _RE_APP_DEFAULT_IMPORT,
+    "index_css_import": _RE_INDEX_CSS_IMPORT,
+    "create_root": _LIT_CREATE_ROOT,
+    "strict_mode": _LIT_STRICT_MODE,
+    "root_element": _RE_ROOT_ELEMENT,
+})
+_APP_CSS_PROBES = _compile_probes({name: pattern for name, pattern, _ in _CSS_SELECTOR_CHECKS})
+_INDEX_CSS_PROBES = _compile_probes({
+    "box_sizing": _RE_BOX_SIZING,
+    "body_rule": _RE_BODY_RULE,
+    "root_rule": _RE_ROOT_RULE,
+})
+_AUTH_CONTEXT_PROBES = _compile_probes({
+    "create_context_import": _RE_CREATE_CONTEXT_IMPORT,
+    "use_context_import": _RE_USE_CONTEXT_IMPORT,
+    "context_create": _RE_AUTH_CONTEXT_CREATE,
+    "provider_export": _RE_AUTH_PROVIDER_EXPORT,
+    "use_auth_export": _RE_USE_AUTH_EXPORT,
+    **{name: pattern for name, pattern, _ in _AUTH_METHOD_CHECKS},
+})
+_HTML_PROBES = _compile_probes({
+    "doctype": _RE_DOCTYPE,
+    "meta_charset": _RE_META_CHARSET,
+    "meta_viewport": _RE_META_VIEWPORT,
+    "root_div": _RE_ROOT_DIV,
+    "main_script": _RE_MAIN_SCRIPT,
+})
+
 class Stage5Validator:
     def __init__(self, erd_path: str, openapi_path: str):
         self.erd_path = erd_path
@@ -63,13 +623,28 @@ class Stage5Validator:
         
         # Track exported symbols and imports
         self.file_exports = {}
+        self._export_scans: Dict[Path, _ExportScan] = {}
+        # (importing directory, import path) -> resolved file, or None
+        self._resolved_imports: Dict[Tuple[Path, str], Optional[Path]] = {}
+        # 'file', 'dir' or 'missing' for paths probed while checking imports
+        self._path_kinds: Dict[Path, str] = {}
+        # (resolved file, import path, symbol) -> missing-symbol error, minus the importer prefix
+        self._symbol_errors: Dict[Tuple[Path, str, str], str] = {}
         self.file_imports = {}
         
         # Track auth requirements
         self.auth_enabled = False
+        self._specialize_for_auth()
         
         # Track installed packages
         self.installed_packages = set()
+        
+        # (st_mtime_ns, st_size, contents) of the files read by the validate_* methods
+        self._file_cache: Dict[Path, Tuple[int, int, str]] = {}
+        self._service_files: Optional[List[Path]] = None
+        self._dir_listings: Dict[Path, Set[str]] = {}
+        # Last probe scan per file: (st_mtime_ns, st_size, probe set, matched names)
+        self._scan_results: Dict[Path, Tuple[int, int, _ProbeSet, Set[str]]] = {}
     
     def load_openapi_file(self, file_path: str) -> Optional[dict]:
         """Load OpenAPI file supporting both JSON and YAML formats"""
@@ -86,7 +661,7 @@ class Stage5Validator:
         if os.path.exists(yaml_path):
             try:
                 with open(yaml_path, 'r') as f:
-                    return yaml.safe_load(f)
+                    return yaml.load(f, Loader=_SafeLoader)
             except yaml.YAMLError as e:
                 print_error(f"Error parsing YAML file {yaml_path}: {e}")
                 return None
@@ -95,7 +670,7 @@ class Stage5Validator:
         if file_path.endswith('.yaml') or file_path.endswith('.yml'):
             try:
                 with open(file_path, 'r') as f:
-                    return yaml.safe_load(f)
+                    return yaml.load(f, Loader=_SafeLoader)
             except yaml.YAMLError as e:
                 print_error(f"Error parsing YAML file {file_path}: {e}")
                 return None
@@ -105,11 +680,10 @@ class Stage5Validator:
     def load_inputs(self) -> bool:
         """Load ERD and OpenAPI files"""
         try:
-            with open(self.erd_path, 'r') as f:
-                self.erd_data = json.load(f)
-                business_logic = self.erd_data.get('business_logic', {})
-                authentication = business_logic.get('authentication', {})
-                self.auth_enabled = authentication.get('enabled', False)
+            with open(self.erd_path, 'rb') as f:
+                self.erd_data = _loads(f.read())
+            self.auth_enabled = self.erd_data.get('business_logic', _EMPTY).get('authentication', _EMPTY).get('enabled', False)
+            self._specialize_for_auth()
             
             self.openapi_data = self.load_openapi_file(self.openapi_path)
             if self.openapi_data is None:
@@ -121,121 +695,202 @@ class Stage5Validator:
             self.errors.append(f"Error loading inputs: {e}")
             return False
     
-    def validate_app_component(self):
+    def _specialize_for_auth(self):
+        """Pick the App.tsx probes and checks for the current auth setting"""
+        if self.auth_enabled:
+            self._app_probes, self._app_checks = _APP_AUTH_PROBES, _APP_AUTH_CHECKS
+        else:
+            self._app_probes, self._app_checks = _APP_PROBES, _APP_CHECKS
+    
+    def _read_text(self, file_path: Path) -> str:
+        """Return file contents, re-reading only when the file's mtime or size changed"""
+        stat = os.stat(file_path)
+        cached = self._file_cache.get(file_path)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+        
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        self._file_cache[file_path] = (stat.st_mtime_ns, stat.st_size, content)
+        return content
+    
+    def _read_quietly(self, file_path: Path) -> Optional[str]:
+        """Read a file for preloading; errors are left for the validator to report"""
+        try:
+            return self._read_text(file_path)
+        except (OSError, UnicodeDecodeError):
+            return None
+    
+    def _list_dir(self, directory: Path) -> Set[str]:
+        """Names in a directory, listed once per run"""
+        names = self._dir_listings.get(directory)
+        if names is None:
+            try:
+                with os.scandir(directory) as entries:
+                    names = {entry.name for entry in entries}
+            except OSError:
+                names = set()
+            self._dir_listings[directory] = names
+        return names
+    
+    def _exists(self, path: Path) -> bool:
+        """Existence check answered from the parent directory's cached listing"""
+        return path.name in self._list_dir(path.parent)
+    
+    def _path_kind(self, path: Path) -> str:
+        """'file', 'dir' or 'missing', from one os.stat per path per run"""
+        kind = self._path_kinds.get(path)
+        if kind is None:
+            try:
+                kind = 'dir' if stat.S_ISDIR(os.stat(path).st_mode) else 'file'
+            except OSError:
+                kind = 'missing'
+            self._path_kinds[path] = kind
+        return kind
+    
+    def _scan_shell_file(self, file_path: Path, probes: _ProbeSet) -> Set[str]:
+        """Scan a file for probes; large files are scanned in place through mmap.
+        
+        The result is kept per file, so validators sharing a file and probe
+        set (App.tsx is checked from both App and main.tsx) scan it once.
+        """
+        stat = os.stat(file_path)
+        cached = self._scan_results.get(file_path)
+        if (cached is not None and cached[2] is probes
+                and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size):
+            return cached[3]
+        
+        found = None
+        if stat.st_size >= MMAP_THRESHOLD:
+            with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if not _RE_TEXT_ONLY_BYTES.search(mm):
+                    found = _scan_probes_mmap(probes, mm)
+        if found is None:
+            found = _scan_probes(probes, self._read_text(file_path))
+        self._scan_results[file_path] = (stat.st_mtime_ns, stat.st_size, probes, found)
+        return found
+    
+    def _list_service_files(self) -> List[Path]:
+        """Return src/services/*.service.ts from a single scandir pass"""
+        if self._service_files is None:
+            service_files = []
+            try:
+                with os.scandir(self.base_path / "src" / "services") as entries:
+                    for entry in entries:
+                        if entry.name.endswith('.service.ts') and entry.name != 'api.ts' and entry.is_file():
+                            service_files.append(Path(entry.path))
+            except OSError:
+                pass
+            self._service_files = service_files
+        return self._service_files
+    
+    def _preload_files(self):
+        """Read every shell and service file concurrently into the file cache"""
+        paths = [self.base_path.joinpath(*parts) for parts in _SHELL_FILES]
+        paths = [path for path in paths if self._exists(path)]
+        paths.extend(self._list_service_files())
+        # Large files are left for the validators to scan in place through mmap
+        paths = [path for path in paths if path.is_file() and path.stat().st_size < MMAP_THRESHOLD]
+        
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+            list(pool.map(self._read_quietly, paths))
+    
+    def validate_app_component(self) -> ValidationResult:
         """Validate App.tsx component"""
         validation_name = "App Component"
+        errors = []
+        warnings = []
         app_file = self.base_path / "src" / "App.tsx"
         
-        if not app_file.exists():
-            self.errors.append(f"{validation_name}: File not found - src/App.tsx")
-            self.validation_results[validation_name] = False
-            return
+        if not self._exists(app_file):
+            errors.append(f"{validation_name}: File not found - src/App.tsx")
+            return validation_name, False, errors, warnings
         
         file_errors = []
         
         try:
-            with open(app_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+            found = self._scan_shell_file(app_file, self._app_probes)
             
             # Check for React import
-            if not re.search(r"import.*React.*from\s+['\"]react['\"]", content):
+            if "react_import" not in found:
                 file_errors.append("Missing React import")
             
             # Check for App component export (named or default)
             # Pattern 1: export const App or export function App
-            has_named_export = bool(re.search(r"export\s+(const|function)\s+App\b", content))
+            has_named_export = "named_export" in found
             # Pattern 2: const/function App defined + export default App
-            has_app_definition = bool(re.search(r"(const|function)\s+App\b", content))
-            has_default_export_identifier = bool(re.search(r"export\s+default\s+App\b", content))
+            has_app_definition = "definition" in found
+            has_default_export_identifier = "default_export" in found
             # Pattern 3: export default function App or export default const App (inline)
-            has_default_export_inline = bool(re.search(r"export\s+default\s+(function|const)\s+App\b", content))
+            has_default_export_inline = "default_inline" in found
             
             # Check for INVALID pattern: both definition + inline export (duplicate App)
             if has_app_definition and has_default_export_inline:
                 file_errors.append("Invalid App export: Found both 'const/function App' definition AND 'export default function App'. Remove one - use EITHER 'const App = () => {}; export default App;' OR 'export default function App() {}'")
             # Valid if: named export OR (definition + default export) OR inline default export
             elif not (has_named_export or (has_app_definition and has_default_export_identifier) or has_default_export_inline):
-                # Add detailed error message showing what was found
-                debug_info = f"App export validation failed:\n"
-                debug_info += f"  - has_named_export (export const/function App): {has_named_export}\n"
-                debug_info += f"  - has_app_definition (const/function App): {has_app_definition}\n"
-                debug_info += f"  - has_default_export_identifier (export default App): {has_default_export_identifier}\n"
-                debug_info += f"  - has_default_export_inline (export default function/const App): {has_default_export_inline}\n"
-                debug_info += f"  - File preview (first 500 chars):\n{content[:500]}"
-                file_errors.append(f"Missing App component export\n{debug_info}")
-            
-            # Check for AppRouter import
-            if not re.search(r"import.*AppRouter.*from.*router", content):
-                file_errors.append("Missing AppRouter import from router")
-            
-            # Check for App.css import
-            if not re.search(r"import\s+['\"]\.\/App\.css['\"]", content):
-                file_errors.append("Missing App.css import")
-            
-            # Check for AppRouter usage
-            if not re.search(r"<AppRouter\s*/?>", content):
-                file_errors.append("AppRouter component not used")
-            
-            # Check for AuthProvider if auth enabled
-            if self.auth_enabled:
-                if not re.search(r"import.*AuthProvider.*from", content):
-                    file_errors.append("Auth enabled but missing AuthProvider import")
-                
-                if not re.search(r"<AuthProvider>", content):
-                    file_errors.append("Auth enabled but AuthProvider not wrapping AppRouter")
+                # Add detailed error message showing what was found; built only on failure
+                file_errors.append("\n".join((
+                    "Missing App component export",
+                    "App export validation failed:",
+                    f"  - has_named_export (export const/function App): {has_named_export}",
+                    f"  - has_app_definition (const/function App): {has_app_definition}",
+                    f"  - has_default_export_identifier (export default App): {has_default_export_identifier}",
+                    f"  - has_default_export_inline (export default function/const App): {has_default_export_inline}",
+                    "  - File preview (first 500 chars):",
+                    self._read_text(app_file)[:500],
+                )))
+            
+            # Check AppRouter import and usage, App.css import, and AuthProvider if auth enabled
+            file_errors.extend(message for name, message in self._app_checks if name not in found)
         
         except Exception as e:
             file_errors.append(f"Error reading file: {e}")
         
-        if file_errors:
-            for error in file_errors:
-                self.errors.append(f"{validation_name}: {error}")
-            self.validation_results[validation_name] = False
-        else:
-            self.validation_results[validation_name] = True
+        for error in file_errors:
+            errors.append(f"{validation_name}: {error}")
+        return validation_name, not file_errors, errors, warnings
     
-    def validate_main_entry(self):
+    def validate_main_entry(self) -> ValidationResult:
         """Validate main.tsx entry point"""
         validation_name = "Main Entry Point"
+        errors = []
+        warnings = []
         main_file = self.base_path / "src" / "main.tsx"
         
-        if not main_file.exists():
-            self.errors.append(f"{validation_name}: File not found - src/main.tsx")
-            self.validation_results[validation_name] = False
-            return
+        if not self._exists(main_file):
+            errors.append(f"{validation_name}: File not found - src/main.tsx")
+            return validation_name, False, errors, warnings
         
         file_errors = []
         
         try:
-            with open(main_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+            found = self._scan_shell_file(main_file, _MAIN_PROBES)
             
             # Check for React import
-            if not re.search(r"import.*React.*from\s+['\"]react['\"]", content):
+            if "react_import" not in found:
                 file_errors.append("Missing React import")
             
             # Check for ReactDOM import
-            if not re.search(r"import.*ReactDOM.*from\s+['\"]react-dom/client['\"]", content):
+            if "react_dom_import" not in found:
                 file_errors.append("Missing ReactDOM import from 'react-dom/client'")
             
             # Check for App import
-            if not re.search(r"import.*App.*from.*App", content):
+            if "app_import" not in found:
                 file_errors.append("Missing App component import")
             else:
                 # Check if import matches export type in App.tsx
                 app_file = self.base_path / "src" / "App.tsx"
-                if app_file.exists():
+                if self._exists(app_file):
                     try:
-                        with open(app_file, 'r', encoding='utf-8') as f:
-                            app_content = f.read()
-                        
                         # Check how App is imported in main.tsx
-                        has_named_import = bool(re.search(r"import\s*\{\s*App\s*\}", content))
-                        has_default_import = bool(re.search(r"import\s+App\s+from", content))
+                        has_named_import = "app_named_import" in found
+                        has_default_import = "app_default_import" in found
                         
                         # Check how App is exported in App.tsx
-                        has_named_export = bool(re.search(r"export\s+(const|function)\s+App\b", app_content))
-                        has_default_export = bool(re.search(r"export\s+default", app_content))
+                        app_found = self._scan_shell_file(app_file, self._app_probes)
+                        has_named_export = "named_export" in app_found
+                        has_default_export = "any_default_export" in app_found
                         
                         # Validate match
                         if has_named_import and not has_named_export:
@@ -246,267 +901,240 @@ class Stage5Validator:
                         pass
             
             # Check for index.css import
-            if not re.search(r"import\s+['\"]\.\/index\.css['\"]", content):
+            if "index_css_import" not in found:
                 file_errors.append("Missing index.css import")
             
             # Check for React 18 createRoot API
-            if not re.search(r"ReactDOM\.createRoot", content):
+            if "create_root" not in found:
                 file_errors.append("Not using React 18 createRoot API")
             
             # Check for StrictMode
-            if not re.search(r"<React\.StrictMode>", content):
-                self.warnings.append(f"{validation_name}: Should wrap App in React.StrictMode")
+            if "strict_mode" not in found:
+                warnings.append(f"{validation_name}: Should wrap App in React.StrictMode")
             
             # Check for root element
-            if not re.search(r"getElementById\(['\"]root['\"]", content):
+            if "root_element" not in found:
                 file_errors.append("Missing root element selection")
         
         except Exception as e:
             file_errors.append(f"Error reading file: {e}")
         
-        if file_errors:
-            for error in file_errors:
-                self.errors.append(f"{validation_name}: {error}")
-            self.validation_results[validation_name] = False
-        else:
-            self.validation_results[validation_name] = True
+        for error in file_errors:
+            errors.append(f"{validation_name}: {error}")
+        return validation_name, not file_errors, errors, warnings
     
-    def validate_app_css(self):
+    def validate_app_css(self) -> ValidationResult:
         """Validate App.css styles"""
         validation_name = "App.css Styles"
+        errors = []
+        warnings = []
         css_file = self.base_path / "src" / "App.css"
         
-        if not css_file.exists():
-            self.errors.append(f"{validation_name}: File not found - src/App.css")
-            self.validation_results[validation_name] = False
-            return
+        if not self._exists(css_file):
+            errors.append(f"{validation_name}: File not found - src/App.css")
+            return validation_name, False, errors, warnings
         
         file_errors = []
         
         try:
-            with open(css_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
             # Check for essential component styles
-            required_selectors = [
-                '.app',
-                '.layout',
-                '.navbar',
-                'button'
-            ]
-            
-            for selector in required_selectors:
-                if not re.search(rf"{re.escape(selector)}\s*\{{", content):
-                    file_errors.append(f"Missing styles for '{selector}'")
+            found = self._scan_shell_file(css_file, _APP_CSS_PROBES)
+            file_errors.extend(message for name, _, message in _CSS_SELECTOR_CHECKS if name not in found)
         
         except Exception as e:
             file_errors.append(f"Error reading file: {e}")
         
-        if file_errors:
-            for error in file_errors:
-                self.errors.append(f"{validation_name}: {error}")
-            self.validation_results[validation_name] = False
-        else:
-            self.validation_results[validation_name] = True
+        for error in file_errors:
+            errors.append(f"{validation_name}: {error}")
+        return validation_name, not file_errors, errors, warnings
     
-    def validate_index_css(self):
+    def validate_index_css(self) -> ValidationResult:
         """Validate index.css reset"""
         validation_name = "index.css Reset"
+        errors = []
+        warnings = []
         css_file = self.base_path / "src" / "index.css"
         
-        if not css_file.exists():
-            self.errors.append(f"{validation_name}: File not found - src/index.css")
-            self.validation_results[validation_name] = False
-            return
+        if not self._exists(css_file):
+            errors.append(f"{validation_name}: File not found - src/index.css")
+            return validation_name, False, errors, warnings
         
         file_errors = []
         
         try:
-            with open(css_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+            if os.stat(css_file).st_size < MMAP_THRESHOLD:
+                content = self._read_text(css_file)
+                found = {
+                    name for name, alternatives in _INDEX_CSS_TOKENS
+                    if any(_contains_spaced(content, tokens) for tokens in alternatives)
+                }
+            else:
+                found = self._scan_shell_file(css_file, _INDEX_CSS_PROBES)
             
             # Check for CSS reset patterns
-            if not re.search(r"box-sizing\s*:\s*border-box", content):
+            if "box_sizing" not in found:
                 file_errors.append("Missing box-sizing reset")
             
-            if not re.search(r"body\s*\{", content):
+            if "body_rule" not in found:
                 file_errors.append("Missing body styles")
             
             # Check for root or html styles
-            if not re.search(r"(:root|html)\s*\{", content):
-                self.warnings.append(f"{validation_name}: Should include :root or html styles")
+            if "root_rule" not in found:
+                warnings.append(f"{validation_name}: Should include :root or html styles")
         
         except Exception as e:
             file_errors.append(f"Error reading file: {e}")
         
-        if file_errors:
-            for error in file_errors:
-                self.errors.append(f"{validation_name}: {error}")
-            self.validation_results[validation_name] = False
-        else:
-            self.validation_results[validation_name] = True
+        for error in file_errors:
+            errors.append(f"{validation_name}: {error}")
+        return validation_name, not file_errors, errors, warnings
     
-    def validate_auth_context(self):
+    def validate_auth_context(self) -> ValidationResult:
         """Validate AuthContext (if auth enabled)"""
         validation_name = "Auth Context"
+        errors = []
+        warnings = []
         auth_file = self.base_path / "src" / "context" / "AuthContext.tsx"
         
         if not self.auth_enabled:
-            self.validation_results[validation_name] = True
-            return
+            return validation_name, True, errors, warnings
         
-        if not auth_file.exists():
-            self.errors.append(f"{validation_name}: File not found - src/context/AuthContext.tsx (auth is enabled)")
-            self.validation_results[validation_name] = False
-            return
+        if not self._exists(auth_file):
+            errors.append(f"{validation_name}: File not found - src/context/AuthContext.tsx (auth is enabled)")
+            return validation_name, False, errors, warnings
         
         file_errors = []
         
         try:
-            with open(auth_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+            found = self._scan_shell_file(auth_file, _AUTH_CONTEXT_PROBES)
             
             # Check for React imports
-            if not re.search(r"import.*createContext.*from\s+['\"]react['\"]", content):
+            if "create_context_import" not in found:
                 file_errors.append("Missing createContext import from React")
             
-            if not re.search(r"import.*useContext.*from\s+['\"]react['\"]", content):
+            if "use_context_import" not in found:
                 file_errors.append("Missing useContext import from React")
             
             # Check for AuthContext creation
-            if not re.search(r"const\s+AuthContext\s*=\s*createContext", content):
+            if "context_create" not in found:
                 file_errors.append("Missing AuthContext creation with createContext")
             
             # Check for AuthProvider export
-            if not re.search(r"export\s+(const|function)\s+AuthProvider", content):
+            if "provider_export" not in found:
                 file_errors.append("Missing AuthProvider export")
             
             # Check for useAuth hook export
-            if not re.search(r"export\s+(const|function)\s+useAuth", content):
+            if "use_auth_export" not in found:
                 file_errors.append("Missing useAuth hook export")
             
             # Check for auth methods
-            required_methods = ['login', 'logout']
-            for method in required_methods:
-                if not re.search(rf"{method}\s*[:=]", content):
-                    file_errors.append(f"Missing {method} method")
+            file_errors.extend(message for name, _, message in _AUTH_METHOD_CHECKS if name not in found)
         
         except Exception as e:
             file_errors.append(f"Error reading file: {e}")
         
-        if file_errors:
-            for error in file_errors:
-                self.errors.append(f"{validation_name}: {error}")
-            self.validation_results[validation_name] = False
-        else:
-            self.validation_results[validation_name] = True
+        for error in file_errors:
+            errors.append(f"{validation_name}: {error}")
+        return validation_name, not file_errors, errors, warnings
     
-    def validate_context_barrel_exports(self):
+    def validate_context_barrel_exports(self) -> ValidationResult:
         """Validate context barrel exports"""
         validation_name = "Context Barrel Exports"
+        errors = []
+        warnings = []
         
         # Only required if contexts exist
         context_dir = self.base_path / "src" / "context"
-        if not context_dir.exists() or not self.auth_enabled:
-            self.validation_results[validation_name] = True
-            return
+        if not self._exists(context_dir) or not self.auth_enabled:
+            return validation_name, True, errors, warnings
         
         context_index = context_dir / "index.ts"
         
-        if not context_index.exists():
-            self.errors.append(f"{validation_name}: File not found - src/context/index.ts")
-            self.validation_results[validation_name] = False
-            return
+        if not self._exists(context_index):
+            errors.append(f"{validation_name}: File not found - src/context/index.ts")
+            return validation_name, False, errors, warnings
         
         file_errors = []
         
         try:
-            with open(context_index, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = self._read_text(context_index)
             
-            # Check for AuthContext export
-            if self.auth_enabled:
-                if not re.search(r"export\s+\*\s+from\s+['\"]\.\/AuthContext['\"]", content):
-                    file_errors.append("Missing export for AuthContext")
+            # Check for AuthContext export; only reached when auth is enabled
+            if not _RE_AUTH_CONTEXT_BARREL.search(content):
+                file_errors.append("Missing export for AuthContext")
         
         except Exception as e:
             file_errors.append(f"Error reading file: {e}")
         
-        if file_errors:
-            for error in file_errors:
-                self.errors.append(f"{validation_name}: {error}")
-            self.validation_results[validation_name] = False
-        else:
-            self.validation_results[validation_name] = True
+        for error in file_errors:
+            errors.append(f"{validation_name}: {error}")
+        return validation_name, not file_errors, errors, warnings
     
-    def validate_html_template(self):
+    def validate_html_template(self) -> ValidationResult:
         """Validate index.html template"""
         validation_name = "HTML Template"
+        errors = []
+        warnings = []
         html_file = self.base_path / "index.html"
         
-        if not html_file.exists():
-            self.errors.append(f"{validation_name}: File not found - index.html")
-            self.validation_results[validation_name] = False
-            return
+        if not self._exists(html_file):
+            errors.append(f"{validation_name}: File not found - index.html")
+            return validation_name, False, errors, warnings
         
         file_errors = []
         
         try:
-            with open(html_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+            found = self._scan_shell_file(html_file, _HTML_PROBES)
             
             # Check for DOCTYPE
-            if not re.search(r"<!DOCTYPE html>", content, re.IGNORECASE):
+            if "doctype" not in found:
                 file_errors.append("Missing DOCTYPE declaration")
             
             # Check for charset meta tag
-            if not re.search(r'<meta\s+charset=["\']UTF-8["\']', content, re.IGNORECASE):
+            if "meta_charset" not in found:
                 file_errors.append("Missing charset meta tag")
             
             # Check for viewport meta tag
-            if not re.search(r'<meta\s+name=["\']viewport["\']', content, re.IGNORECASE):
+            if "meta_viewport" not in found:
                 file_errors.append("Missing viewport meta tag")
             
             # Check for root div
-            if not re.search(r'<div\s+id=["\']root["\']', content):
+            if "root_div" not in found:
                 file_errors.append("Missing root div element")
             
             # Check for script tag
-            if not re.search(r'<script.*src=["\'].*main\.tsx["\']', content):
+            if "main_script" not in found:
                 file_errors.append("Missing script tag for main.tsx")
         
         except Exception as e:
             file_errors.append(f"Error reading file: {e}")
         
-        if file_errors:
-            for error in file_errors:
-                self.errors.append(f"{validation_name}: {error}")
-            self.validation_results[validation_name] = False
-        else:
-            self.validation_results[validation_name] = True
+        for error in file_errors:
+            errors.append(f"{validation_name}: {error}")
+        return validation_name, not file_errors, errors, warnings
     
-    def validate_package_json(self):
+    def validate_package_json(self) -> ValidationResult:
         """Validate package.json dependencies"""
         validation_name = "Package.json Dependencies"
+        errors = []
+        warnings = []
         package_file = self.base_path / "package.json"
         
-        if not package_file.exists():
-            self.errors.append(f"{validation_name}: File not found - package.json")
-            self.validation_results[validation_name] = False
-            return
+        if not self._exists(package_file):
+            errors.append(f"{validation_name}: File not found - package.json")
+            return validation_name, False, errors, warnings
         
         file_errors = []
         
         try:
-            with open(package_file, 'r', encoding='utf-8') as f:
-                package_data = json.load(f)
+            package_data = _loads(self._read_text(package_file))
             
             dependencies = package_data.get('dependencies', {})
             dev_dependencies = package_data.get('devDependencies', {})
-            all_deps = {**dependencies, **dev_dependencies}
+            all_deps = ChainMap(dependencies, dev_dependencies)
             
             # Store for later import validation
-            self.installed_packages = set(all_deps.keys())
+            self.installed_packages = set(dependencies) | set(dev_dependencies)
             
             # Check required dependencies
             required_deps = [
@@ -546,19 +1174,22 @@ class Stage5Validator:
         except Exception as e:
             file_errors.append(f"Error reading file: {e}")
         
-        if file_errors:
-            for error in file_errors:
-                self.errors.append(f"{validation_name}: {error}")
-            self.validation_results[validation_name] = False
-        else:
-            self.validation_results[validation_name] = True
+        for error in file_errors:
+            errors.append(f"{validation_name}: {error}")
+        return validation_name, not file_errors, errors, warnings
     
-    def validate_backend_api_matching(self):
+    def validate_backend_api_matching(self) -> ValidationResult:
         """Validate frontend API calls match OpenAPI backend spec"""
         validation_name = "Backend API Matching with the one defined inside input/openapi.json"
+        errors = []
+        warnings = []
         
         api_errors = []
         
+        # Built inside the try below; the summary rebuilds them if it failed first
+        sorted_openapi_paths = None
+        openapi_matchable = None
+        
         try:
             # Extract backend URL from openapi.json - try multiple formats
             backend_url = None
@@ -582,23 +1213,18 @@ class Stage5Validator:
             
             if not backend_url:
                 warning_msg = f"Could not find backend URL in openapi.json (checked: servers[].url, url, host+basePath)"
-                self.warnings.append(f"{validation_name}: {warning_msg}")
+                warnings.append(f"{validation_name}: {warning_msg}")
                 # Add any accumulated errors before returning
-                if api_errors:
-                    for error in api_errors:
-                        self.errors.append(f"{validation_name}: {error}")
-                    self.validation_results[validation_name] = False
-                else:
-                    self.validation_results[validation_name] = True
-                return
+                for error in api_errors:
+                    errors.append(f"{validation_name}: {error}")
+                return validation_name, not api_errors, errors, warnings
             
             # Check .env file
             env_file = self.base_path / ".env"
-            if env_file.exists():
-                with open(env_file, 'r', encoding='utf-8') as f:
-                    env_content = f.read()
+            if self._exists(env_file):
+                env_content = self._read_text(env_file)
                 
-                env_match = re.search(r'VITE_API_BASE_URL\s*=\s*(.+)', env_content)
+                env_match = _RE_ENV_BASE_URL.search(env_content)
                 if env_match:
                     env_url = env_match.group(1).strip().strip('"').strip("'").rstrip('/')
                     if env_url != backend_url:
@@ -612,20 +1238,18 @@ class Stage5Validator:
             api_config = self.base_path / "src" / "config" / "api.config.ts"
             api_base_path = ""  # Track if baseURL includes path prefix like /api
             
-            if api_config.exists():
-                with open(api_config, 'r', encoding='utf-8') as f:
-                    config_content = f.read()
+            if self._exists(api_config):
+                config_content = self._read_text(api_config)
                 
                 if 'import.meta.env.VITE_API_BASE_URL' not in config_content:
                     api_errors.append("api.config.ts not using import.meta.env.VITE_API_BASE_URL")
                 
                 # Check if baseURL has a path component (e.g., /api)
                 # This affects how services should construct paths
-                base_url_match = re.search(r'baseURL:\s*[\'"`]([^\'"`]+)[\'"`]', config_content)
+                base_url_match = _RE_CONFIG_BASE_URL.search(config_content)
                 if base_url_match:
                     # Extract path from hardcoded URL if present
-                    parsed = urlparse(base_url_match.group(1))
-                    api_base_path = parsed.path.rstrip('/')
+                    api_base_path = _url_path(base_url_match.group(1)).rstrip('/')
             
             # Extract API endpoints from openapi.json
             # Support both standard OpenAPI format and custom format
@@ -655,46 +1279,45 @@ class Stage5Validator:
             frontend_endpoints = {}
             services_dir = self.base_path / "src" / "services"
             
-            if services_dir.exists():
-                for service_file in services_dir.glob("*.service.ts"):
-                    if service_file.name == 'api.ts':
-                        continue
+            if self._exists(services_dir):
+                for service_file in self._list_service_files():
                     try:
-                        with open(service_file, 'r', encoding='utf-8') as f:
-                            content = f.read()
+                        content = self._read_text(service_file)
                         # Extract endpoints - handle both {id} and ${id} syntax
-                        endpoints = re.findall(r'api\.\w+\([\'"`](/[^\'"` ]+)[\'"`]', content)
+                        endpoints = [match.group(1) for match in _iter_api_calls(_RE_API_ENDPOINT, content)]
                         if endpoints:
                             frontend_endpoints[service_file.name] = endpoints
                     except:
                         pass
             
             if not openapi_paths:
-                # Show comparison even when no backend paths found
-                print("\n" + "="*70)
-                print("  ❌ BACKEND API VALIDATION FAILED")
-                print("="*70)
+                # Show comparison even when no backend paths found, written
+                # to stdout in one piece
+                report = io.StringIO()
+                print("\n" + "="*70, file=report)
+                print("  ❌ BACKEND API VALIDATION FAILED", file=report)
+                print("="*70, file=report)
                 
-                print(f"\n  📁 BACKEND ENDPOINTS: None found in openapi.json")
-                print(f"     → Checked: 'paths', 'endpoints', 'routes' keys")
+                print(f"\n  📁 BACKEND ENDPOINTS: None found in openapi.json", file=report)
+                print(f"     → Checked: 'paths', 'endpoints', 'routes' keys", file=report)
                 
-                print(f"\n  💻 FRONTEND ENDPOINTS:")
+                print(f"\n  💻 FRONTEND ENDPOINTS:", file=report)
                 if frontend_endpoints:
                     for service, endpoints in sorted(frontend_endpoints.items()):
-                        print(f"     {service}:")
+                        print(f"     {service}:", file=report)
                         for ep in endpoints:
-                            print(f"       → {ep}")
+                            print(f"       → {ep}", file=report)
                 else:
-                    print(f"     None found")
+                    print(f"     None found", file=report)
                 
-                print("="*70 + "\n")
+                print("="*70 + "\n", file=report)
+                sys.stdout.write(report.getvalue())
                 
                 error_msg = "No API paths found in openapi.json - cannot validate service endpoints"
                 api_errors.append(error_msg)
                 for error in api_errors:
-                    self.errors.append(f"{validation_name}: {error}")
-                self.validation_results[validation_name] = False
-                return
+                    errors.append(f"{validation_name}: {error}")
+                return validation_name, False, errors, warnings
             
             # Determine if OpenAPI paths have a common prefix (like /api)
             openapi_prefix = ""
@@ -704,50 +1327,51 @@ class Stage5Validator:
                 if all(p.startswith('/api/') or p == '/api' for p in sample_paths):
                     openapi_prefix = "/api"
             
+            # Lookups shared by every endpoint check below:
+            # - a path matches if it, or it plus a trailing '/', is an OpenAPI path
+            # - the sorted paths (also listed in the summary) and the first ten
+            #   of them pre-formatted for error messages
+            # - paths containing a given last segment, filled on first use
+            openapi_matchable = openapi_paths | {p[:-1] for p in openapi_paths if p.endswith('/')}
+            sorted_openapi_paths = sorted(openapi_paths)
+            openapi_sample = '\n'.join(f"      • {p}" for p in sorted_openapi_paths[:10])
+            similar_paths = {}
+            
             # Check service files for endpoint mismatches AND proper API client usage
             services_dir = self.base_path / "src" / "services"
-            if not services_dir.exists():
+            if not self._exists(services_dir):
                 # If there are already errors collected, add them before returning
-                if api_errors:
-                    for error in api_errors:
-                        self.errors.append(f"{validation_name}: {error}")
-                    self.validation_results[validation_name] = False
-                else:
-                    # No services directory but also no other errors - this is OK
-                    self.validation_results[validation_name] = True
-                return
-            
-            service_files = list(services_dir.glob("*.service.ts"))
+                # No services directory but also no other errors - this is OK
+                for error in api_errors:
+                    errors.append(f"{validation_name}: {error}")
+                return validation_name, not api_errors, errors, warnings
             
-            if services_dir.exists():
-                for service_file in services_dir.glob("*.service.ts"):
-                    if service_file.name == 'api.ts':
-                        continue
-                    
+            if self._exists(services_dir):
+                for service_file in self._list_service_files():
                     try:
-                        with open(service_file, 'r', encoding='utf-8') as f:
-                            content = f.read()
+                        content = self._read_text(service_file)
+                        signals = _find_service_literals(content)
                         
                         # CRITICAL: Check if service imports the API client
-                        has_api_import = "from './api'" in content or 'from "./api"' in content or "from '../config/api" in content
+                        has_api_import = not signals.isdisjoint(_LIT_API_IMPORTS)
                         
                         if not has_api_import:
                             api_errors.append(f"{service_file.name}: Missing API client import. Add: import {{ api }} from './api'")
                             continue
                         
                         # CRITICAL: Check if service actually uses the api client
-                        api_calls = re.findall(r'\bapi\.(get|post|put|patch|delete)\(', content)
+                        api_calls = next(_iter_api_calls(_RE_API_CALL, content), None) if _LIT_API_ANCHOR in signals else None
                         
                         if not api_calls:
                             api_errors.append(f"{service_file.name}: Imports 'api' but never calls api.get/post/put/delete methods")
                             continue
                         
                         # Check for direct axios usage (bypassing API client)
-                        if re.search(r'\baxios\.(get|post|put|patch|delete)\(', content):
+                        if _LIT_AXIOS in signals and _RE_AXIOS_CALL.search(content):
                             api_errors.append(f"{service_file.name}: Uses axios directly. Must use 'api.get()' not 'axios.get()' to apply baseURL")
                         
                         # Check for hardcoded full URLs
-                        hardcoded = re.findall(r'[\'"`](https?://[^\'"`]+)[\'"`]', content)
+                        hardcoded = _RE_HARDCODED_URL.findall(content) if _LIT_URL_SCHEME in signals else []
                         if hardcoded:
                             api_errors.append(f"{service_file.name}: Contains hardcoded URL(s) {hardcoded}. Use 'api.get(\"/path\")' with relative paths")
                         
@@ -756,51 +1380,37 @@ class Stage5Validator:
                         # - api.get('/users') 
                         # - api.get(`/users/${id}`)
                         # - api.get( '/users' ) (with spaces)
-                        endpoints_raw = re.findall(r'api\.\w+\(\s*[\'"`]([/][^\'"` ]*)[\'"`]\s*[,\)]', content)
+                        endpoints_raw = [match.group(1) for match in _iter_api_calls(_RE_API_ENDPOINT_CALL, content)]
                         
                         # Also try without requiring comma/paren at end (for edge cases)
                         if not endpoints_raw:
-                            endpoints_raw = re.findall(r'api\.\w+\([\'"`](/[^\'"` ]+)[\'"`]', content)
+                            endpoints_raw = [match.group(1) for match in _iter_api_calls(_RE_API_ENDPOINT, content)]
                         
                         # Remove duplicates while preserving order
-                        endpoints = []
-                        seen = set()
-                        for ep in endpoints_raw:
-                            if ep not in seen:
-                                endpoints.append(ep)
-                                seen.add(ep)
+                        endpoints = list(dict.fromkeys(endpoints_raw))
                         
                         if not endpoints:
                             # Service uses api client but no endpoints found - might be a parsing issue
-                            self.warnings.append(f"{validation_name}: {service_file.name} uses api client but no endpoints detected (check syntax)")
+                            warnings.append(f"{validation_name}: {service_file.name} uses api client but no endpoints detected (check syntax)")
                             continue
                         
                         # Find line numbers for each endpoint
-                        lines = content.split('\n')
+                        line_starts = _line_starts(content)
                         
                         for endpoint in endpoints:
                             endpoint_clean = endpoint.rstrip('/')
                             
                             # Normalize endpoint for comparison: ${id} -> {id}
-                            endpoint_normalized = re.sub(r'\$\{(\w+)\}', r'{\1}', endpoint_clean)
+                            endpoint_normalized = _normalize_template(endpoint_clean)
                             
                             # Find which line this endpoint is on
-                            line_num = None
-                            for i, line in enumerate(lines, 1):
-                                if endpoint in line and 'api.' in line:
-                                    line_num = i
-                                    break
+                            line_num = _find_line(content, line_starts, endpoint, _LIT_API_ANCHOR)
                             
                             # Construct full path as backend will see it
                             full_path = f"{api_base_path}{endpoint_normalized}"
                             
                             # Check if this full path exists in OpenAPI (with variations)
-                            path_found = (
-                                full_path in openapi_paths or
-                                f"{full_path}/" in openapi_paths or
-                                endpoint_normalized in openapi_paths or
-                                f"{endpoint_normalized}/" in openapi_paths
-                            )
+                            path_found = full_path in openapi_matchable or endpoint_normalized in openapi_matchable
                             
                             if not path_found:
                                 # PATH MISMATCH - This is a CRITICAL ERROR
@@ -811,7 +1421,7 @@ class Stage5Validator:
                                 # Case 1: OpenAPI has prefix but service endpoint doesn't
                                 if openapi_prefix and not endpoint_normalized.startswith(openapi_prefix):
                                     correct_path = f"{openapi_prefix}{endpoint_normalized}"
-                                    if correct_path in openapi_paths or f"{correct_path}/" in openapi_paths:
+                                    if correct_path in openapi_matchable:
                                         api_errors.append(
                                             f"{location}: API endpoint mismatch\n"
                                             f"  ❌ Current: api.XXX('{endpoint}')\n"
@@ -825,7 +1435,7 @@ class Stage5Validator:
                                             f"  → Frontend calls: '{endpoint}'\n"
                                             f"  → Backend has prefix: '{openapi_prefix}'\n"
                                             f"  → Available backend paths:\n" +
-                                            '\n'.join(f"      • {p}" for p in sorted(openapi_paths)[:10])
+                                            openapi_sample
                                         )
                                 
                                 # Case 2: baseURL already has path but service repeats it
@@ -844,24 +1454,27 @@ class Stage5Validator:
                                     # Try to find similar paths
                                     endpoint_parts = endpoint_normalized.split('/')
                                     last_part = endpoint_parts[-1] if endpoint_parts else ''
-                                    similar = [p for p in openapi_paths if last_part and last_part in p]
+                                    similar = similar_paths.get(last_part)
+                                    if similar is None:
+                                        similar = [p for p in openapi_paths if last_part and last_part in p]
+                                        similar_paths[last_part] = similar
                                     
-                                    error_msg = (
-                                        f"{location}: Endpoint does not exist in backend\n"
-                                        f"  ❌ Frontend calls: api.XXX('{endpoint}')\n"
-                                        f"  → Normalized: '{endpoint_normalized}'\n"
-                                        f"  → Full path: '{full_path}'\n"
-                                        f"  → NOT FOUND in backend API\n"
-                                    )
+                                    error_lines = [
+                                        f"{location}: Endpoint does not exist in backend",
+                                        f"  ❌ Frontend calls: api.XXX('{endpoint}')",
+                                        f"  → Normalized: '{endpoint_normalized}'",
+                                        f"  → Full path: '{full_path}'",
+                                        f"  → NOT FOUND in backend API",
+                                    ]
                                     if similar:
-                                        error_msg += f"  → Similar backend paths:\n"
-                                        error_msg += '\n'.join(f"      • {p}" for p in similar[:5])
-                                        error_msg += f"\n  → Fix line {line_num}: Use correct backend path"
+                                        error_lines.append(f"  → Similar backend paths:")
+                                        error_lines.extend(f"      • {p}" for p in similar[:5])
+                                        error_lines.append(f"  → Fix line {line_num}: Use correct backend path")
                                     else:
-                                        error_msg += f"  → Available backend paths:\n"
-                                        error_msg += '\n'.join(f"      • {p}" for p in sorted(openapi_paths)[:10])
-                                        error_msg += f"\n  → Fix line {line_num}: Match one of the above"
-                                    api_errors.append(error_msg)
+                                        error_lines.append(f"  → Available backend paths:")
+                                        error_lines.append(openapi_sample)
+                                        error_lines.append(f"  → Fix line {line_num}: Match one of the above")
+                                    api_errors.append('\n'.join(error_lines))
                     except Exception as e:
                         api_errors.append(f"{service_file.name}: Failed to validate - {str(e)}")
         
@@ -873,52 +1486,58 @@ class Stage5Validator:
         has_backend_endpoints = 'openapi_paths' in locals() and openapi_paths
         
         if has_frontend_endpoints or has_backend_endpoints:
-            print("\n" + "="*70)
+            # Build the summary in memory and write it to stdout in one piece
+            report = io.StringIO()
+            print("\n" + "="*70, file=report)
             if api_errors:
-                print("  ❌ BACKEND API ENDPOINT MISMATCH DETECTED")
+                print("  ❌ BACKEND API ENDPOINT MISMATCH DETECTED", file=report)
             else:
-                print("  ✓ BACKEND API ENDPOINT VALIDATION")
-            print("="*70)
+                print("  ✓ BACKEND API ENDPOINT VALIDATION", file=report)
+            print("="*70, file=report)
             
             # Show backend URL if available
             if 'backend_url' in locals() and backend_url:
-                print(f"\n  🌐 Backend URL: {backend_url}")
+                print(f"\n  🌐 Backend URL: {backend_url}", file=report)
             
             # Show available backend paths
             if has_backend_endpoints:
-                print(f"\n  📁 Backend Endpoints (from openapi.json): {len(openapi_paths)} total")
-                for path in sorted(openapi_paths):
-                    print(f"     ✓ {path}")
+                print(f"\n  📁 Backend Endpoints (from openapi.json): {len(openapi_paths)} total", file=report)
+                if sorted_openapi_paths is None:
+                    sorted_openapi_paths = sorted(openapi_paths)
+                for path in sorted_openapi_paths:
+                    print(f"     ✓ {path}", file=report)
             else:
-                print(f"\n  📁 Backend Endpoints: None found in openapi.json")
+                print(f"\n  📁 Backend Endpoints: None found in openapi.json", file=report)
             
             # Show frontend endpoints
             if has_frontend_endpoints:
                 total_fe_endpoints = sum(len(eps) for eps in frontend_endpoints.values())
-                print(f"\n  💻 Frontend Endpoints (from service files): {total_fe_endpoints} total")
+                print(f"\n  💻 Frontend Endpoints (from service files): {total_fe_endpoints} total", file=report)
+                if openapi_matchable is None:
+                    openapi_matchable = openapi_paths | {p[:-1] for p in openapi_paths if p.endswith('/')} if has_backend_endpoints else set()
                 for service, endpoints in sorted(frontend_endpoints.items()):
-                    print(f"     {service}: {len(endpoints)} endpoint(s)")
+                    print(f"     {service}: {len(endpoints)} endpoint(s)", file=report)
                     for ep in endpoints:
                         # Normalize for display
-                        ep_normalized = re.sub(r'\$\{(\w+)\}', r'{\1}', ep)
+                        ep_normalized = _normalize_template(ep)
                         # Check if matches backend
-                        matches = ep_normalized in openapi_paths or f"{ep_normalized}/" in openapi_paths
+                        matches = ep_normalized in openapi_matchable
                         status = "✓" if matches else "✗"
                         if ep != ep_normalized:
-                            print(f"       {status} {ep} → {ep_normalized}")
+                            print(f"       {status} {ep} → {ep_normalized}", file=report)
                         else:
-                            print(f"       {status} {ep}")
+                            print(f"       {status} {ep}", file=report)
             else:
-                print(f"\n  💻 Frontend Endpoints: None found in service files")
+                print(f"\n  💻 Frontend Endpoints: None found in service files", file=report)
             
             if api_errors:
-                print(f"\n  ❗ Mismatches Found: {len(api_errors)}")
-                print("  " + "-"*66)
+                print(f"\n  ❗ Mismatches Found: {len(api_errors)}", file=report)
+                print("  " + "-"*66, file=report)
                 
                 # Collect files that need fixing
                 files_to_fix = set()
                 for i, error in enumerate(api_errors, 1):
-                    print(f"\n  {i}. {error}")
+                    print(f"\n  {i}. {error}", file=report)
                     # Extract filename if present
                     first_line = error.split('\n')[0]
                     if ':' in first_line:
@@ -927,27 +1546,28 @@ class Stage5Validator:
                             files_to_fix.add(file_loc)
                 
                 if files_to_fix:
-                    print("\n" + "="*70)
-                    print("  🔧 FILES REQUIRING FIXES:")
-                    print("="*70)
+                    print("\n" + "="*70, file=report)
+                    print("  🔧 FILES REQUIRING FIXES:", file=report)
+                    print("="*70, file=report)
                     for file in sorted(files_to_fix):
                         file_path = f"generated_project/src/services/{file}"
-                        print(f"     → {file_path}")
-                    print("="*70 + "\n")
+                        print(f"     → {file_path}", file=report)
+                    print("="*70 + "\n", file=report)
             else:
-                print(f"\n  ✓ All endpoints validated successfully")
-                print("="*70 + "\n")
+                print(f"\n  ✓ All endpoints validated successfully", file=report)
+                print("="*70 + "\n", file=report)
+            
+            sys.stdout.write(report.getvalue())
         
-        if api_errors:
-            for error in api_errors:
-                self.errors.append(f"{validation_name}: {error}")
-            self.validation_results[validation_name] = False
-        else:
-            self.validation_results[validation_name] = True
+        for error in api_errors:
+            errors.append(f"{validation_name}: {error}")
+        return validation_name, not api_errors, errors, warnings
     
-    def validate_no_previous_modifications(self):
+    def validate_no_previous_modifications(self) -> ValidationResult:
         """Validate no modifications to previous stage files"""
         validation_name = "No Previous Stage Modifications"
+        errors = []
+        warnings = []
         
         # This is a soft check - we validate that key files still exist and have expected structure
         # We can't fully guarantee no modifications without comparing to baseline
@@ -964,21 +1584,27 @@ class Stage5Validator:
         
         for file_path in critical_files:
             full_path = self.base_path / file_path
-            if not full_path.exists():
+            if not self._exists(full_path):
                 file_errors.append(f"Critical file missing or moved: {file_path}")
         
-        if file_errors:
-            for error in file_errors:
-                self.errors.append(f"{validation_name}: {error}")
-            self.validation_results[validation_name] = False
-        else:
-            self.validation_results[validation_name] = True
+        for error in file_errors:
+            errors.append(f"{validation_name}: {error}")
+        return validation_name, not file_errors, errors, warnings
+    
+    def _export_scan(self, file_path: Path) -> _ExportScan:
+        """Parse a file's export statements once per run"""
+        scan = self._export_scans.get(file_path)
+        if scan is None:
+            scan = _scan_exports(self._read_text(file_path))
+            self._export_scans[file_path] = scan
+        return scan
     
     def _scan_file_exports(self, file_path: Path, visited: Set[Path] = None) -> Set[str]:
-        """Scan a TypeScript file for exported symbols"""
-        # Normalize path to absolute resolved path
-        file_path = file_path.resolve()
+        """Scan a TypeScript file for exported symbols.
         
+        file_path must already be resolved: validate_imports resolves the
+        walked files and _resolve_import_path returns resolved paths.
+        """
         # Check if already scanned and cached
         if file_path in self.file_exports:
             return self.file_exports[file_path]
@@ -995,38 +1621,32 @@ class Stage5Validator:
         exports = set()
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            scan = self._export_scan(file_path)
             
-            # Direct exports
-            named_exports = re.findall(r'export\s+(?:interface|type|const|let|var|function|class)\s+(\w+)', content)
-            exports.update(named_exports)
+            # Direct exports: export const/function/interface/... X
+            exports.update(name for _, name in scan.declared)
             
             # Export declarations: export { foo, bar as baz } (NOT from another file)
-            export_declarations = re.findall(r'export\s*\{\s*([^}]+)\s*\}(?!\s*from)', content)
-            for decl in export_declarations:
+            for decl in scan.lists:
                 symbols = [s.strip().split(' as ')[-1].strip() for s in decl.split(',')]
                 exports.update(symbols)
             
             # Named re-exports: export { foo, default as bar } from './file'
-            named_reexports = re.findall(r'export\s*\{\s*([^}]+)\s*\}\s*from\s+[\'"]([^"\']+)[\'"]', content)
-            for symbols_str, export_path in named_reexports:
+            for symbols_str, export_path in scan.reexports:
                 symbols = [s.strip().split(' as ')[-1].strip() for s in symbols_str.split(',')]
                 exports.update(symbols)
             
             # Wildcard re-exports: export * from './file'
-            wildcard_exports = re.findall(r'export\s+\*\s+from\s+[\'"]([^"\']+)[\'"]', content)
-            if wildcard_exports:
-                for export_path in wildcard_exports:
-                    resolved_path = self._resolve_import_path(file_path, export_path)
-                    if resolved_path and resolved_path.exists():
-                        # Recursively get exports from that file (share visited set)
-                        re_exported = self._scan_file_exports(resolved_path, visited)
-                        # Wildcard re-exports don't include 'default'
-                        exports.update(re_exported - {'default'})
+            for export_path in scan.wildcards:
+                resolved_path = self._resolve_import_path(file_path, export_path)
+                if resolved_path and self._path_kind(resolved_path) != 'missing':
+                    # Recursively get exports from that file (share visited set)
+                    re_exported = self._scan_file_exports(resolved_path, visited)
+                    # Wildcard re-exports don't include 'default'
+                    exports.update(re_exported - {'default'})
             
             # Default export
-            if re.search(r'export\s+default', content):
+            if scan.has_default:
                 exports.add('default')
         
         except Exception as e:
@@ -1042,23 +1662,26 @@ class Stage5Validator:
         imports = []
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = self._read_text(file_path)
+            
+            # Files without the keyword are not handed to the import patterns
+            if _LIT_IMPORT not in content:
+                return imports
             
-            named_imports = re.finditer(r"import\s*\{\s*([^}]+)\s*\}\s*from\s*['\"]([^'\"]+)['\"]", content)
+            named_imports = _RE_NAMED_IMPORT.finditer(content)
             for match in named_imports:
                 symbols_str = match.group(1)
                 from_path = match.group(2)
                 symbols = [s.strip().split(' as ')[0].strip() for s in symbols_str.split(',')]
                 imports.append((symbols, from_path))
             
-            default_imports = re.finditer(r"import\s+(\w+)\s+from\s+['\"]([^'\"]+)['\"]", content)
+            default_imports = _RE_DEFAULT_IMPORT.finditer(content)
             for match in default_imports:
                 symbol = match.group(1)
                 from_path = match.group(2)
                 imports.append(([symbol], from_path))
             
-            wildcard_imports = re.finditer(r"import\s+\*\s+as\s+(\w+)\s+from\s+['\"]([^'\"]+)['\"]", content)
+            wildcard_imports = _RE_WILDCARD_IMPORT.finditer(content)
             for match in wildcard_imports:
                 symbol = match.group(1)
                 from_path = match.group(2)
@@ -1071,68 +1694,82 @@ class Stage5Validator:
     
     def _resolve_import_path(self, importing_file: Path, import_path: str) -> Optional[Path]:
         """Resolve relative import path to absolute file path"""
+        key = (importing_file.parent, import_path)
+        if key in self._resolved_imports:
+            return self._resolved_imports[key]
+        
+        resolved = self._probe_import_path(importing_file, import_path)
+        self._resolved_imports[key] = resolved
+        return resolved
+    
+    def _probe_import_path(self, importing_file: Path, import_path: str) -> Optional[Path]:
+        """Probe the candidate files for an import path, in extension order.
+        
+        Candidates are looked up in the cached directory listings first, so
+        only names that are actually present cost a resolve() and exists().
+        """
         if import_path.startswith('.'):
             base_dir = importing_file.parent
             resolved = (base_dir / import_path).resolve()
             
-            for ext in ['.ts', '.tsx', '.js', '.jsx', '.css', '']:
-                if ext == '':
-                    index_path = (resolved / 'index.ts').resolve()
-                    if index_path.exists():
-                        return index_path
-                    index_path = (resolved / 'index.tsx').resolve()
-                    if index_path.exists():
-                        return index_path
-                else:
+            siblings = self._list_dir(resolved.parent)
+            for ext in ('.ts', '.tsx', '.js', '.jsx', '.css'):
+                if resolved.name + ext in siblings:
                     file_with_ext = Path(str(resolved) + ext).resolve()
-                    if file_with_ext.exists():
+                    if self._path_kind(file_with_ext) != 'missing':
                         return file_with_ext
+            
+            children = self._list_dir(resolved)
+            for index_name in ('index.ts', 'index.tsx'):
+                if index_name in children:
+                    index_path = (resolved / index_name).resolve()
+                    if self._path_kind(index_path) != 'missing':
+                        return index_path
         
         return None
     
-    def validate_imports(self):
+    def validate_imports(self) -> ValidationResult:
         """Validate all imports are valid"""
         validation_name = "Import Validation"
+        errors = []
+        warnings = []
         src_path = self.base_path / "src"
         
-        if not src_path.exists():
-            self.validation_results[validation_name] = True
-            return
+        if not self._exists(src_path):
+            return validation_name, True, errors, warnings
+        
+        # Walk src once; both passes below reuse the file list
+        # Normalize to absolute paths
+        source_files = [Path(path).resolve() for path in _iter_source_files(str(src_path))]
+        
+        # Read the sources concurrently so the scans below hit the file cache
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+            list(pool.map(self._read_quietly, source_files))
         
         # Build export map for internal files
-        for root, dirs, files in os.walk(src_path):
-            dirs[:] = [d for d in dirs if d != 'node_modules']
+        for file_path in source_files:
+            # _scan_file_exports now caches internally, so just call it
+            self._scan_file_exports(file_path)
             
-            for file in files:
-                if not (file.endswith('.ts') or file.endswith('.tsx')):
-                    continue
-                
-                file_path = (Path(root) / file).resolve()  # Normalize to absolute path
-                # _scan_file_exports now caches internally, so just call it
-                self._scan_file_exports(file_path)
+            # Check for duplicate exports in this file
+            try:
+                scan = self._export_scan(file_path)
+                # Find all named exports: export const/let/var/function/class X
+                named_exports = [name for keyword, name in scan.declared if keyword in _VALUE_KEYWORDS]
+                # Find all re-exports: export { X, Y, Z }
+                reexported_names = set()
+                for block in scan.lists:
+                    names = [s.strip().split(' as ')[0].strip() for s in block.split(',')]
+                    reexported_names.update(names)
                 
-                # Check for duplicate exports in this file
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    
-                    # Find all named exports: export const/let/var/function/class X
-                    named_exports = re.findall(r'export\s+(?:const|let|var|function|class)\s+(\w+)', content)
-                    # Find all re-exports: export { X, Y, Z }
-                    reexport_blocks = re.findall(r'export\s*\{\s*([^}]+)\s*\}(?!\s*from)', content)
-                    reexported_names = set()
-                    for block in reexport_blocks:
-                        names = [s.strip().split(' as ')[0].strip() for s in block.split(',')]
-                        reexported_names.update(names)
-                    
-                    # Check for duplicates
-                    duplicates = set(named_exports) & reexported_names
-                    if duplicates:
-                        rel_path = str(file_path.relative_to(self.base_path))
-                        for dup in duplicates:
-                            duplicate_export_errors.append(f"{rel_path}: Duplicate export '{dup}' (exported with 'export const {dup}' AND 'export {{ {dup} }}'). Remove 'export {{ {dup} }}'")
-                except Exception as e:
-                    pass
+                # Check for duplicates
+                duplicates = set(named_exports) & reexported_names
+                if duplicates:
+                    rel_path = str(file_path.relative_to(self.base_path))
+                    for dup in duplicates:
+                        duplicate_export_errors.append(f"{rel_path}: Duplicate export '{dup}' (exported with 'export const {dup}' AND 'export {{ {dup} }}'). Remove 'export {{ {dup} }}'")
+            except Exception as e:
+                pass
         
         # Collect all external package imports
         external_imports = set()
@@ -1141,272 +1778,270 @@ class Stage5Validator:
         import_errors = []
         duplicate_export_errors = []
         
-        for root, dirs, files in os.walk(src_path):
-            dirs[:] = [d for d in dirs if d != 'node_modules']
-            
-            for file in files:
-                if not (file.endswith('.ts') or file.endswith('.tsx')):
-                    continue
-                
-                file_path = (Path(root) / file).resolve()  # Normalize to absolute path
-                rel_path = str(file_path.relative_to(self.base_path))
-                imports = self._scan_file_imports(file_path)
-                
-                for symbols, from_path in imports:
-                    # Handle relative imports (internal)
-                    if from_path.startswith('.'):
-                        # Skip CSS imports
-                        if from_path.endswith('.css'):
-                            continue
-                        
-                        resolved_path = self._resolve_import_path(file_path, from_path)
-                        
-                        if resolved_path is None:
-                            import_errors.append(f"{rel_path}: Import path not found '{from_path}'")
-                            continue
-                        
-                        # Skip CSS files
-                        if str(resolved_path).endswith('.css'):
-                            continue
+        for file_path in source_files:
+            rel_path = str(file_path.relative_to(self.base_path))
+            prefix = f"{rel_path}: "
+            imports = self._scan_file_imports(file_path)
+            line_starts = None
+            
+            for symbols, from_path in imports:
+                # Handle relative imports (internal)
+                if from_path.startswith('.'):
+                    # Skip CSS imports
+                    if from_path.endswith('.css'):
+                        continue
+                    
+                    resolved_path = self._resolve_import_path(file_path, from_path)
+                    
+                    if resolved_path is None:
+                        import_errors.append(prefix + f"Import path not found '{from_path}'")
+                        continue
+                    
+                    # Skip CSS files
+                    if str(resolved_path).endswith('.css'):
+                        continue
+                    
+                    # Check for import/export type mismatch
+                    if self._path_kind(resolved_path) != 'missing' and not resolved_path.name.startswith('index.'):
+                        try:
+                            target_scan = self._export_scan(resolved_path)
+                            target_keywords = target_scan.keywords
+                            
+                            # First line mentioning both the path and 'import'
+                            content = self._read_text(file_path)
+                            if line_starts is None:
+                                line_starts = _line_starts(content)
+                            line_num = _find_line(content, line_starts, from_path, _LIT_IMPORT)
+                            import_line = _line_text(content, line_starts, line_num) if line_num else None
+                            
+                            if import_line:
+                                for symbol in symbols:
+                                    # Check if this is a named import: import { Symbol }
+                                    is_named_import = bool(_named_import_pattern(symbol).search(import_line))
+                                    # Check if this is a default import: import Symbol
+                                    is_default_import = not is_named_import and bool(_default_import_pattern(symbol).search(import_line))
+                                    
+                                    if is_named_import:
+                                        # Named import requires named export
+                                        has_named_export = not _NAMED_IMPORT_KEYWORDS.isdisjoint(target_keywords.get(symbol, ()))
+                                        if not has_named_export:
+                                            if target_scan.has_default:
+                                                import_errors.append(prefix + f"Import/export mismatch for '{symbol}' from '{from_path}'\n  → Import uses: import {{ {symbol} }}\n  → Export uses: export default\n  → Fix: Change import to 'import {symbol} from'{from_path}''")
+                                    
+                                    elif is_default_import:
+                                        # Default import requires default export
+                                        if not target_scan.has_default:
+                                            has_named_export = not _DEFAULT_MISMATCH_KEYWORDS.isdisjoint(target_keywords.get(symbol, ()))
+                                            if has_named_export:
+                                                import_errors.append(prefix + f"Import/export mismatch for '{symbol}' from '{from_path}'\n  → Import uses: import {symbol}\n  → Export uses: export const/function {symbol}\n  → Fix: Change import to 'import {{ {symbol} }} from'{from_path}''")
+                        except:
+                            pass
+                    
+                    if resolved_path not in self.file_exports:
+                        # File was not in export map - check why
+                        # Show what was imported for context
+                        requested_str = ', '.join(f"'{s}'" for s in symbols)
                         
-                        # Check for import/export type mismatch
-                        if resolved_path.exists() and not resolved_path.name.startswith('index.'):
-                            try:
-                                with open(resolved_path, 'r', encoding='utf-8') as f:
-                                    target_content = f.read()
-                                
-                                with open(file_path, 'r', encoding='utf-8') as f:
-                                    import_line = None
-                                    for line in f:
-                                        if from_path in line and 'import' in line:
-                                            import_line = line
-                                            break
-                                
-                                if import_line:
-                                    for symbol in symbols:
-                                        # Check if this is a named import: import { Symbol }
-                                        is_named_import = bool(re.search(rf"import\s*\{{[^}}]*\b{symbol}\b[^}}]*\}}", import_line))
-                                        # Check if this is a default import: import Symbol
-                                        is_default_import = not is_named_import and bool(re.search(rf"import\s+{symbol}\b", import_line))
-                                        
-                                        if is_named_import:
-                                            # Named import requires named export
-                                            has_named_export = bool(re.search(rf"export\s+(const|function|class|interface|type)\s+{symbol}\b", target_content))
-                                            if not has_named_export:
-                                                has_default_export = bool(re.search(r"export\s+default", target_content))
-                                                if has_default_export:
-                                                    import_errors.append(f"{rel_path}: Import/export mismatch for '{symbol}' from '{from_path}'\n  → Import uses: import {{ {symbol} }}\n  → Export uses: export default\n  → Fix: Change import to 'import {symbol} from'{from_path}''")
-                                        
-                                        elif is_default_import:
-                                            # Default import requires default export
-                                            has_default_export = bool(re.search(r"export\s+default", target_content))
-                                            if not has_default_export:
-                                                has_named_export = bool(re.search(rf"export\s+(const|function|class)\s+{symbol}\b", target_content))
-                                                if has_named_export:
-                                                    import_errors.append(f"{rel_path}: Import/export mismatch for '{symbol}' from '{from_path}'\n  → Import uses: import {symbol}\n  → Export uses: export const/function {symbol}\n  → Fix: Change import to 'import {{ {symbol} }} from'{from_path}''")
-                            except:
-                                pass
+                        # First check if the import refers to a directory
+                        base_import_path = (file_path.parent / from_path.lstrip('./')).resolve()
                         
-                        if resolved_path not in self.file_exports:
-                            # File was not in export map - check why
-                            # Show what was imported for context
-                            requested_str = ', '.join(f"'{s}'" for s in symbols)
-                            
-                            # First check if the import refers to a directory
-                            base_import_path = (file_path.parent / from_path.lstrip('./')).resolve()
+                        if self._path_kind(base_import_path) == 'dir':
+                            # It's a directory - check for index files
+                            index_ts = base_import_path / 'index.ts'
+                            index_tsx = base_import_path / 'index.tsx'
                             
-                            if base_import_path.is_dir():
-                                # It's a directory - check for index files
-                                index_ts = base_import_path / 'index.ts'
-                                index_tsx = base_import_path / 'index.tsx'
-                                
-                                if index_ts.exists() or index_tsx.exists():
-                                    # index file exists but wasn't scanned or has no exports
-                                    actual_index = index_ts if index_ts.exists() else index_tsx
-                                    try:
-                                        with open(actual_index, 'r', encoding='utf-8') as f:
-                                            content = f.read().strip()
-                                        
-                                        error_msg = f"{rel_path}: Import from directory '{from_path}'\n"
-                                        error_msg += f"  → Requested imports: {requested_str}\n"
-                                        
-                                        if not content:
-                                            error_msg += f"  → Issue: {actual_index.name} exists but is empty\n"
-                                            error_msg += f"  → Fix: Add exports to {base_import_path.name}/{actual_index.name}"
-                                        elif 'export' not in content:
-                                            error_msg += f"  → Issue: {actual_index.name} exists but has no exports\n"
-                                            error_msg += f"  → Fix: Add 'export * from' or 'export {{ ... }}' statements to {base_import_path.name}/{actual_index.name}"
-                                        else:
-                                            error_msg += f"  → Issue: {base_import_path.name}/{actual_index.name} exists but exports are incorrect or incomplete\n"
-                                            error_msg += f"  → Fix: Ensure {actual_index.name} properly exports all required symbols"
-                                        
-                                        import_errors.append(error_msg.rstrip())
-                                    except Exception as e:
-                                        import_errors.append(f"{rel_path}: Import '{from_path}' is a directory. Found {actual_index.name} but failed to read it: {str(e)}")
-                                else:
-                                    # Directory exists but no index file
-                                    error_msg = f"{rel_path}: Import from directory '{from_path}'\n"
-                                    error_msg += f"  → Requested imports: {requested_str}\n"
-                                    error_msg += f"  → Issue: Directory '{base_import_path.name}' exists but is missing index.ts or index.tsx\n"
-                                    error_msg += f"  → Fix: Create {base_import_path.name}/index.ts with proper exports"
-                                    import_errors.append(error_msg)
-                            elif not resolved_path.exists():
-                                # Neither file nor directory exists
-                                error_msg = f"{rel_path}: Import path not found\n"
-                                error_msg += f"  → Requested: '{from_path}'\n"
-                                error_msg += f"  → Issue: Path does not exist (not a file or directory)\n"
-                                error_msg += f"  → Fix: Check the import path is correct"
-                                import_errors.append(error_msg)
-                            elif resolved_path.name in ['index.ts', 'index.tsx']:
-                                # This is a barrel export file that exists but failed to scan
+                            has_index_ts = self._path_kind(index_ts) != 'missing'
+                            if has_index_ts or self._path_kind(index_tsx) != 'missing':
+                                # index file exists but wasn't scanned or has no exports
+                                actual_index = index_ts if has_index_ts else index_tsx
                                 try:
-                                    with open(resolved_path, 'r', encoding='utf-8') as f:
-                                        barrel_content = f.read().strip()
+                                    content = self._read_text(actual_index).strip()
                                     
-                                    error_msg = f"{rel_path}: Import from barrel file '{from_path}'\n"
-                                    error_msg += f"  → Requested imports: {requested_str}\n"
-                                    error_msg += f"  → File: {resolved_path.parent.name}/{resolved_path.name}\n"
+                                    error_lines = [
+                                        prefix + f"Import from directory '{from_path}'",
+                                        f"  → Requested imports: {requested_str}",
+                                    ]
                                     
-                                    if not barrel_content:
-                                        error_msg += f"  → Issue: Barrel file is empty\n"
-                                        error_msg += f"  → Fix: Add exports to {resolved_path.parent.name}/{resolved_path.name}"
-                                    elif 'export' not in barrel_content:
-                                        error_msg += f"  → Issue: Barrel file has no exports\n"
-                                        error_msg += f"  → Fix: Add 'export * from' statements to {resolved_path.parent.name}/{resolved_path.name}"
+                                    if not content:
+                                        error_lines.append(f"  → Issue: {actual_index.name} exists but is empty")
+                                        error_lines.append(f"  → Fix: Add exports to {base_import_path.name}/{actual_index.name}")
+                                    elif 'export' not in content:
+                                        error_lines.append(f"  → Issue: {actual_index.name} exists but has no exports")
+                                        error_lines.append(f"  → Fix: Add 'export * from' or 'export {{ ... }}' statements to {base_import_path.name}/{actual_index.name}")
                                     else:
-                                        error_msg += f"  → Issue: Barrel file exists but exports are incorrect or incomplete\n"
-                                        error_msg += f"  → Current content:\n"
-                                        for line in barrel_content.split('\n')[:5]:  # Show first 5 lines
-                                            error_msg += f"      {line}\n"
-                                        error_msg += f"  → Fix: Ensure {resolved_path.name} exports all required symbols"
+                                        error_lines.append(f"  → Issue: {base_import_path.name}/{actual_index.name} exists but exports are incorrect or incomplete")
+                                        error_lines.append(f"  → Fix: Ensure {actual_index.name} properly exports all required symbols")
                                     
-                                    import_errors.append(error_msg.rstrip())
+                                    import_errors.append('\n'.join(error_lines).rstrip())
                                 except Exception as e:
-                                    import_errors.append(f"{rel_path}: Failed to read barrel file '{from_path}': {str(e)}")
+                                    import_errors.append(prefix + f"Import '{from_path}' is a directory. Found {actual_index.name} but failed to read it: {str(e)}")
                             else:
-                                # Regular file exists but has no exports
-                                error_msg = f"{rel_path}: Import from file '{from_path}'\n"
-                                error_msg += f"  → Requested imports: {requested_str}\n"
-                                error_msg += f"  → File: {resolved_path.name}\n"
-                                error_msg += f"  → Issue: File exists but has no exports or failed to scan\n"
-                                error_msg += f"  → Fix: Add 'export const/function/class' statements to {resolved_path.name}"
-                                import_errors.append(error_msg)
+                                # Directory exists but no index file
+                                import_errors.append('\n'.join((
+                                    prefix + f"Import from directory '{from_path}'",
+                                    f"  → Requested imports: {requested_str}",
+                                    f"  → Issue: Directory '{base_import_path.name}' exists but is missing index.ts or index.tsx",
+                                    f"  → Fix: Create {base_import_path.name}/index.ts with proper exports",
+                                )))
+                        elif self._path_kind(resolved_path) == 'missing':
+                            # Neither file nor directory exists
+                            import_errors.append('\n'.join((
+                                prefix + "Import path not found",
+                                f"  → Requested: '{from_path}'",
+                                f"  → Issue: Path does not exist (not a file or directory)",
+                                f"  → Fix: Check the import path is correct",
+                            )))
+                        elif resolved_path.name in ['index.ts', 'index.tsx']:
+                            # This is a barrel export file that exists but failed to scan
+                            try:
+                                barrel_content = self._read_text(resolved_path).strip()
+                                
+                                error_lines = [
+                                    prefix + f"Import from barrel file '{from_path}'",
+                                    f"  → Requested imports: {requested_str}",
+                                    f"  → File: {resolved_path.parent.name}/{resolved_path.name}",
+                                ]
+                                
+                                if not barrel_content:
+                                    error_lines.append(f"  → Issue: Barrel file is empty")
+                                    error_lines.append(f"  → Fix: Add exports to {resolved_path.parent.name}/{resolved_path.name}")
+                                elif 'export' not in barrel_content:
+                                    error_lines.append(f"  → Issue: Barrel file has no exports")
+                                    error_lines.append(f"  → Fix: Add 'export * from' statements to {resolved_path.parent.name}/{resolved_path.name}")
+                                else:
+                                    error_lines.append(f"  → Issue: Barrel file exists but exports are incorrect or incomplete")
+                                    error_lines.append(f"  → Current content:")
+                                    # Show first 5 lines
+                                    error_lines.extend(f"      {line}" for line in barrel_content.split('\n')[:5])
+                                    error_lines.append(f"  → Fix: Ensure {resolved_path.name} exports all required symbols")
+                                
+                                import_errors.append('\n'.join(error_lines).rstrip())
+                            except Exception as e:
+                                import_errors.append(prefix + f"Failed to read barrel file '{from_path}': {str(e)}")
+                        else:
+                            # Regular file exists but has no exports
+                            import_errors.append('\n'.join((
+                                prefix + f"Import from file '{from_path}'",
+                                f"  → Requested imports: {requested_str}",
+                                f"  → File: {resolved_path.name}",
+                                f"  → Issue: File exists but has no exports or failed to scan",
+                                f"  → Fix: Add 'export const/function/class' statements to {resolved_path.name}",
+                            )))
+                        continue
+                    
+                    available_exports = self.file_exports[resolved_path]
+                    
+                    # Shared by every missing symbol of this import; filled on the first one
+                    available_str = None
+                    barrel_content = None
+                    
+                    for symbol in symbols:
+                        if symbol in available_exports or 'default' in available_exports:
                             continue
                         
-                        available_exports = self.file_exports[resolved_path]
+                        # The same symbol imported from the same path in another file
+                        # gets the same message
+                        key = (resolved_path, from_path, symbol)
+                        if key in self._symbol_errors:
+                            import_errors.append(prefix + self._symbol_errors[key])
+                            continue
                         
-                        # Debug: Show what we found if there's a mismatch
-                        if any(s not in available_exports and 'default' not in available_exports for s in symbols):
-                            # At least one symbol is missing - prepare detailed error
-                            pass
+                        # Provide detailed error with what was expected vs found
+                        if available_str is None:
+                            available_list = sorted(list(available_exports - {'default'}))
+                            available_str = ', '.join(f"'{e}'" for e in available_list) if available_list else "(none)"
                         
-                        for symbol in symbols:
-                            if symbol not in available_exports and 'default' not in available_exports:
-                                # Provide detailed error with what was expected vs found
-                                available_list = sorted(list(available_exports - {'default'}))
-                                available_str = ', '.join(f"'{e}'" for e in available_list) if available_list else "(none)"
-                                
-                                error_msg = f"{rel_path}: Import mismatch for '{from_path}'\n"
-                                error_msg += f"  → Requested: '{symbol}'\n"
-                                error_msg += f"  → Available exports: {available_str}\n"
+                        error_lines = [
+                            f"Import mismatch for '{from_path}'",
+                            f"  → Requested: '{symbol}'",
+                            f"  → Available exports: {available_str}",
+                        ]
+                        
+                        # Try to give a helpful error message based on the situation
+                        if resolved_path.name in ['index.ts', 'index.tsx']:
+                            try:
+                                if barrel_content is None:
+                                    barrel_content = self._read_text(resolved_path)
                                 
-                                # Try to give a helpful error message based on the situation
-                                if resolved_path.name in ['index.ts', 'index.tsx']:
-                                    try:
-                                        with open(resolved_path, 'r', encoding='utf-8') as f:
-                                            barrel_content = f.read()
-                                        
-                                        # Check if there's a wildcard re-export for this symbol
-                                        if f"export * from './{symbol}" in barrel_content or f'export * from "./{symbol}' in barrel_content:
-                                            error_msg += f"  → Issue: Barrel file has 'export * from './{symbol}'' but {symbol} file likely uses 'export default'\n"
-                                            error_msg += f"  → Fix Option 1: Change {symbol}.tsx to use 'export const {symbol}' instead of 'export default'\n"
-                                            error_msg += f"  → Fix Option 2: Change index.ts to 'export {{ default as {symbol} }} from './{symbol}''"
-                                        else:
-                                            error_msg += f"  → Issue: Symbol '{symbol}' is not exported from {resolved_path.parent.name}/{resolved_path.name}\n"
-                                            error_msg += f"  → Fix: Add 'export * from './{symbol}'' or 'export {{ default as {symbol} }} from './{symbol}'' to {resolved_path.name}"
-                                    except Exception as e:
-                                        error_msg += f"  → Issue: Symbol not found in barrel export file"
+                                # Check if there's a wildcard re-export for this symbol
+                                if f"export * from './{symbol}" in barrel_content or f'export * from "./{symbol}' in barrel_content:
+                                    error_lines.append(f"  → Issue: Barrel file has 'export * from './{symbol}'' but {symbol} file likely uses 'export default'")
+                                    error_lines.append(f"  → Fix Option 1: Change {symbol}.tsx to use 'export const {symbol}' instead of 'export default'")
+                                    error_lines.append(f"  → Fix Option 2: Change index.ts to 'export {{ default as {symbol} }} from './{symbol}''")
                                 else:
-                                    error_msg += f"  → Fix: Add 'export const {symbol}' or 'export function {symbol}' to {resolved_path.name}"
-                                
-                                import_errors.append(error_msg.rstrip())
-                    
-                    # Handle external package imports
-                    else:
-                        # Extract base package name
-                        package_name = self._extract_package_name(from_path)
-                        if package_name:
-                            external_imports.add(package_name)
-        
+                                    error_lines.append(f"  → Issue: Symbol '{symbol}' is not exported from {resolved_path.parent.name}/{resolved_path.name}")
+                                    error_lines.append(f"  → Fix: Add 'export * from './{symbol}'' or 'export {{ default as {symbol} }} from './{symbol}'' to {resolved_path.name}")
+                            except Exception as e:
+                                error_lines.append(f"  → Issue: Symbol not found in barrel export file")
+                        else:
+                            error_lines.append(f"  → Fix: Add 'export const {symbol}' or 'export function {symbol}' to {resolved_path.name}")
+                        
+                        self._symbol_errors[key] = '\n'.join(error_lines).rstrip()
+                        import_errors.append(prefix + self._symbol_errors[key])
+                
+                # Handle external package imports
+                else:
+                    # Extract base package name
+                    package_name = _extract_package_name(from_path)
+                    if package_name:
+                        external_imports.add(package_name)
+    
         # Validate external imports against package.json
         if hasattr(self, 'installed_packages'):
-            for package in external_imports:
-                if package not in self.installed_packages:
-                    import_errors.append(f"Package '{package}' is imported but not in package.json dependencies")
+            for package in sorted(external_imports - self.installed_packages):
+                import_errors.append(f"Package '{package}' is imported but not in package.json dependencies")
         
         # Add all errors
         all_errors = duplicate_export_errors + import_errors
         
-        if all_errors:
-            for error in all_errors:
-                self.errors.append(f"{validation_name}: {error}")
-            self.validation_results[validation_name] = False
-        else:
-            self.validation_results[validation_name] = True
+        for error in all_errors:
+            errors.append(f"{validation_name}: {error}")
+        return validation_name, not all_errors, errors, warnings
     
-    def _extract_package_name(self, import_path: str) -> Optional[str]:
-        """Extract package name from import path"""
-        # Handle scoped packages like @vitejs/plugin-react
-        if import_path.startswith('@'):
-            parts = import_path.split('/')
-            if len(parts) >= 2:
-                return f"{parts[0]}/{parts[1]}"
-            return parts[0]
-        
-        # Handle regular packages like react, react-dom/client
-        parts = import_path.split('/')
-        return parts[0] if parts else None
-    
-    def validate_route_view_matching(self):
+    def validate_route_view_matching(self) -> ValidationResult:
         """Validate that all views have corresponding routes defined"""
         validation_name = "Route-View Matching"
+        errors = []
+        warnings = []
         
         views_path = self.base_path / "src" / "views"
         routes_file = self.base_path / "src" / "router" / "routes.ts"
         router_file = self.base_path / "src" / "router" / "index.tsx"
         
-        if not views_path.exists():
-            self.validation_results[validation_name] = True
-            return
+        if not self._exists(views_path):
+            return validation_name, True, errors, warnings
         
-        if not routes_file.exists():
-            self.errors.append(f"{validation_name}: routes.ts not found")
-            self.validation_results[validation_name] = False
-            return
+        if not self._exists(routes_file):
+            errors.append(f"{validation_name}: routes.ts not found")
+            return validation_name, False, errors, warnings
         
-        if not router_file.exists():
-            self.errors.append(f"{validation_name}: router/index.tsx not found")
-            self.validation_results[validation_name] = False
-            return
+        if not self._exists(router_file):
+            errors.append(f"{validation_name}: router/index.tsx not found")
+            return validation_name, False, errors, warnings
         
         file_errors = []
         
         try:
-            # Get all view files
+            # Get all view files, in directory order, from one scandir pass
             view_files = []
-            for view_file in views_path.glob("*.tsx"):
-                view_name = view_file.stem
+            try:
+                with os.scandir(views_path) as entries:
+                    view_names = [os.path.splitext(entry.name)[0] for entry in entries if entry.name.endswith('.tsx')]
+            except OSError:
+                view_names = []
+            for view_name in view_names:
                 # Skip Home and NotFound as they have special routes
                 if view_name not in ['Home', 'NotFound']:
                     view_files.append(view_name)
             
             # Read routes.ts
-            with open(routes_file, 'r', encoding='utf-8') as f:
-                routes_content = f.read()
+            routes_content = self._read_text(routes_file)
             
             # Read router/index.tsx
-            with open(router_file, 'r', encoding='utf-8') as f:
-                router_content = f.read()
+            router_content = self._read_text(router_file)
+            
+            route_constants = _route_key_index(set(_RE_ROUTE_KEY.findall(routes_content)))
+            router_imports, route_elements = _router_view_index(router_content)
             
             # Check each view has a route definition
             for view_name in view_files:
@@ -1415,78 +2050,80 @@ class Stage5Validator:
                 
                 # Convert camelCase to SNAKE_CASE for matching
                 # e.g., 'UserForm' -> 'USER_FORM', 'UserList' -> 'USER_LIST'
-                snake_case = re.sub(r'([a-z0-9])([A-Z])', r'\1_\2', base_name).upper()
-                
-                # Try multiple naming patterns for route constants:
-                # 1. EXACT_SNAKE_CASE: (e.g., USER_FORM:)
-                # 2. EXACT_SNAKE_CASE_VIEW: (e.g., USER_FORM_VIEW:)
-                # 3. Any constant containing the snake_case pattern
+                snake_case = _RE_CAMEL_BOUNDARY.sub(r'\1_\2', base_name).upper()
                 
-                patterns = [
-                    rf"\b{snake_case}\s*:",           # USER_FORM:
-                    rf"\b{snake_case}_VIEW\s*:",      # USER_FORM_VIEW:
-                    rf"\b{snake_case}_[A-Z_]+\s*:",   # USER_FORM_SOMETHING:
-                ]
-                
-                found = False
-                for pattern in patterns:
-                    if re.search(pattern, routes_content):
-                        found = True
-                        break
+                # Route constants may be named USER_FORM:, USER_FORM_VIEW:
+                # or USER_FORM_SOMETHING:
+                if _RE_WORD.fullmatch(snake_case):
+                    found = snake_case in route_constants
+                else:
+                    found = bool(_route_constant_pattern(snake_case).search(routes_content))
                 
                 if not found:
                     file_errors.append(f"View '{view_name}' missing route constant in routes.ts (expected: {snake_case}* constant)")
                 
                 # Check view is imported in router/index.tsx
-                if not re.search(rf"import.*{view_name}.*from.*views", router_content):
+                if view_name not in router_imports:
                     file_errors.append(f"View '{view_name}' not imported in router/index.tsx")
                 
                 # Check view is used in a Route component
-                if not re.search(rf"<Route.*element=\{{<{view_name}", router_content):
+                if '\n' + view_name not in route_elements:
                     file_errors.append(f"View '{view_name}' not used in any Route in router/index.tsx")
         
         except Exception as e:
             file_errors.append(f"Error validating routes: {e}")
         
-        if file_errors:
-            for error in file_errors:
-                self.errors.append(f"{validation_name}: {error}")
-            self.validation_results[validation_name] = False
-        else:
-            self.validation_results[validation_name] = True
+        for error in file_errors:
+            errors.append(f"{validation_name}: {error}")
+        return validation_name, not file_errors, errors, warnings
     
-    def validate_html_location(self):
+    def validate_html_location(self) -> ValidationResult:
         """Validate that index.html is in project root"""
         validation_name = "HTML Template Location"
+        errors = []
+        warnings = []
         
         # Check in project root (generated_project/)
         root_html = self.base_path / "index.html"
         
-        if not root_html.exists():
-            self.errors.append(f"{validation_name}: index.html not found in project root (generated_project/)")
-            self.validation_results[validation_name] = False
-        else:
-            self.validation_results[validation_name] = True
+        if not self._exists(root_html):
+            errors.append(f"{validation_name}: index.html not found in project root (generated_project/)")
+            return validation_name, False, errors, warnings
+        return validation_name, True, errors, warnings
     
     def validate(self) -> bool:
         """Run all validations"""
         if not self.load_inputs():
             return False
         
-        # Run all validations silently
-        self.validate_app_component()
-        self.validate_main_entry()
-        self.validate_app_css()
-        self.validate_index_css()
-        self.validate_auth_context()
-        self.validate_context_barrel_exports()
-        self.validate_html_template()
-        self.validate_html_location()  # NEW: Check index.html is in project root
-        self.validate_package_json()  # Must run before validate_imports
-        self.validate_backend_api_matching()  # NEW: Check frontend matches backend API
-        self.validate_no_previous_modifications()
-        self.validate_route_view_matching()  # NEW: Check views match routes
-        self.validate_imports()
+        self._preload_files()
+        
+        # Run all validations silently and concurrently. Results are merged in
+        # submission order so the report is identical to a serial run.
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = [
+                executor.submit(self.validate_app_component),
+                executor.submit(self.validate_main_entry),
+                executor.submit(self.validate_app_css),
+                executor.submit(self.validate_index_css),
+                executor.submit(self.validate_auth_context),
+                executor.submit(self.validate_context_barrel_exports),
+                executor.submit(self.validate_html_template),
+                executor.submit(self.validate_html_location),  # NEW: Check index.html is in project root
+                executor.submit(self.validate_package_json),  # Must finish before validate_imports
+                executor.submit(self.validate_backend_api_matching),  # NEW: Check frontend matches backend API
+                executor.submit(self.validate_no_previous_modifications),
+                executor.submit(self.validate_route_view_matching),  # NEW: Check views match routes
+            ]
+            # validate_imports checks against installed_packages from package.json
+            futures[8].result()
+            futures.append(executor.submit(self.validate_imports))
+            
+            for future in futures:
+                validation_name, ok, errors, warnings = future.result()
+                self.errors.extend(errors)
+                self.warnings.extend(warnings)
+                self.validation_results[validation_name] = ok
         
         # Print summary
         print_section("VALIDATION SUMMARY")
@@ -1501,39 +2138,29 @@ class Stage5Validator:
                 failed.append(validation)
         
         # Print passed validations
-        for validation in passed:
-            print_success(f"{validation}: PASSED")
+        print_lines(Colors.GREEN, "✓", (f"{validation}: PASSED" for validation in passed))
         
         # Print failed validations
-        for validation in failed:
-            print_error(f"{validation}: FAILED")
+        print_lines(Colors.RED, "✗", (f"{validation}: FAILED" for validation in failed))
         
         # Print detailed errors if any exist
         if self.errors:
             print_section("ERROR DETAILS")
-            for i, error in enumerate(self.errors, 1):
-                print_error(f"{i}. {error}")
+            print_lines(Colors.RED, "✗", (f"{i}. {error}" for i, error in enumerate(self.errors, 1)))
         
         # Print warnings if any exist
         if self.warnings:
             print(f"\n{Colors.YELLOW}WARNINGS:{Colors.RESET}")
-            for i, warning in enumerate(self.warnings, 1):
-                print_warning(f"{i}. {warning}")
+            print_lines(Colors.YELLOW, "⚠", (f"{i}. {warning}" for i, warning in enumerate(self.warnings, 1)))
         
         # Print validation statistics
         print_section("VALIDATION STATISTICS")
         
         # Count files scanned
         src_path = self.base_path / "src"
-        ts_files = []
-        if src_path.exists():
-            for root, dirs, files in os.walk(src_path):
-                dirs[:] = [d for d in dirs if d != 'node_modules']
-                for file in files:
-                    if file.endswith('.ts') or file.endswith('.tsx'):
-                        ts_files.append(Path(root) / file)
+        ts_file_count = sum(1 for _ in _iter_source_files(str(src_path)))
         
-        print_info(f"TypeScript files scanned: {len(ts_files)}")
+        print_info(f"TypeScript files scanned: {ts_file_count}")
         print_info(f"Files with exports validated: {len(self.file_exports)}")
         print_info(f"External packages detected: {len(self.installed_packages)}")
         
@@ -1542,8 +2169,6 @@ class Stage5Validator:
         
         # Final result
         print()
-        # Determine overall success based on validation results
-        all_passed = len(failed) == 0
         
         if not all_passed:
             print_error(f"✗ VALIDATION FAILED")
@@ -1553,28 +2178,7 @@ class Stage5Validator:
                 print_warning(f"  → {len(self.warnings)} warning(s)")
             print()
             print_error("Failed validations:")
-            for validation in failed:
-                print(f"  ✗ {validation}")
-            return False
-        else:
-            print_success(f"✓ ALL VALIDATIONS PASSED")
-            if len(self.warnings) > 0:
-                print_info(f"Note: {len(self.warnings)} warning(s) found")
-            print_info(f"Application shell integrated successfully")
-            if self.auth_enabled:
-                print_info("Authentication context enabled and configured")
-            print_success("All imports validated against package.json")
-            return True
-        if not all_passed:
-            print_error(f"✗ VALIDATION FAILED")
-            print_error(f"  → {len(failed)} validation(s) failed")
-            print_error(f"  → {len(self.errors)} total error(s)")
-            if len(self.warnings) > 0:
-                print_warning(f"  → {len(self.warnings)} warning(s)")
-            print()
-            print_error("Failed validations:")
-            for validation in failed:
-                print(f"  ✗ {validation}")
+            sys.stdout.write(''.join(f"  ✗ {validation}\n" for validation in failed))
             return False
         else:
             print_success(f"✓ ALL VALIDATIONS PASSED")